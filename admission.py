@@ -0,0 +1,128 @@
+"""
+Admission control for the browser-backed endpoints of one server worker.
+
+At most ``max_in_flight`` scrape/apply requests run at once; up to
+``max_waiting`` more wait ``wait_timeout`` seconds for a turn. Anything
+beyond that is turned away with ``Overloaded`` (HTTP 429) instead of piling
+up threads and browsers, and once ``drain()`` has started every new request
+gets ``Overloaded`` with HTTP 503 while in-flight ones finish.
+
+    try:
+        admission.admit()
+    except Overloaded as e:
+        return error, e.status, {"Retry-After": str(e.retry_after)}
+    try:
+        ...
+    finally:
+        admission.release()
+
+Configuration (environment variables):
+  ADMISSION_MAX_IN_FLIGHT  concurrent browser requests per worker (default 4)
+  ADMISSION_MAX_WAITING    requests that may wait for a turn (default 8)
+  ADMISSION_WAIT_TIMEOUT   seconds a request waits before it is rejected (default 5)
+  ADMISSION_RETRY_AFTER    Retry-After seconds sent with 429/503 (default 10)
+"""
+
+import os
+import threading
+import time
+
+
+class Overloaded(Exception):
+    """The request was not admitted; answer with ``status`` and ``retry_after``."""
+
+    def __init__(self, message, status=429, retry_after=10):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    def __init__(self, max_in_flight=4, max_waiting=8, wait_timeout=5.0, retry_after=10):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.max_waiting = max(0, int(max_waiting))
+        self.wait_timeout = wait_timeout
+        self.retry_after = int(retry_after)
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._waiting = 0
+        self._draining = False
+        self._stats = {"admitted": 0, "queued": 0, "rejected": 0, "drain_rejected": 0}
+
+    def _draining_error(self):
+        self._stats["drain_rejected"] += 1
+        return Overloaded("Server is shutting down", status=503, retry_after=self.retry_after)
+
+    def admit(self):
+        """Take a slot, waiting briefly if needed. Raises ``Overloaded``."""
+        with self._cond:
+            if self._draining:
+                raise self._draining_error()
+            if self._in_flight >= self.max_in_flight:
+                if self._waiting >= self.max_waiting:
+                    self._stats["rejected"] += 1
+                    raise Overloaded(
+                        f"{self._in_flight} requests in flight and {self._waiting} waiting",
+                        retry_after=self.retry_after,
+                    )
+                self._waiting += 1
+                self._stats["queued"] += 1
+                deadline = time.monotonic() + self.wait_timeout
+                try:
+                    while self._in_flight >= self.max_in_flight and not self._draining:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._stats["rejected"] += 1
+                            raise Overloaded(
+                                f"No capacity within {self.wait_timeout}s",
+                                retry_after=self.retry_after,
+                            )
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+                if self._draining:
+                    raise self._draining_error()
+            self._in_flight += 1
+            self._stats["admitted"] += 1
+
+    def release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def drain(self, timeout=None):
+        """
+        Reject new requests and wait up to ``timeout`` seconds for in-flight
+        ones to finish. Returns True when nothing is left running.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._draining = True
+            self._cond.notify_all()
+            while self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def stats(self):
+        with self._cond:
+            return {
+                "max_in_flight": self.max_in_flight,
+                "max_waiting": self.max_waiting,
+                "in_flight": self._in_flight,
+                "waiting": self._waiting,
+                "draining": int(self._draining),
+                **self._stats,
+            }
+
+
+def admission_from_env():
+    return AdmissionController(
+        max_in_flight=int(os.getenv("ADMISSION_MAX_IN_FLIGHT", 4)),
+        max_waiting=int(os.getenv("ADMISSION_MAX_WAITING", 8)),
+        wait_timeout=float(os.getenv("ADMISSION_WAIT_TIMEOUT", 5)),
+        retry_after=int(os.getenv("ADMISSION_RETRY_AFTER", 10)),
+    )
@@ -1,29 +1,645 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
-from naukri_scrapper import scrape_naukri_jobs, apply_to_naukri_job
+from driver_pool import close_pools, pool_stats
+from backends import browser_available, default_backend, get_backend
+from result_cache import cache_from_env
+from single_flight import SingleFlight, SingleFlightTimeout
+from job_store import get_job_store
+from task_queue import QueueFull, queue_from_env
+from page_readiness import readiness_stats
+from batch_scheduler import scheduler_from_env
+from host_limits import get_host_limiter
+from rate_limiter import RetriesExhausted, get_rate_limiter
+from strategy_cache import get_strategy_cache
+from dedup import get_dedup_index
+from admission import Overloaded, admission_from_env
+from browser_budget import BrowserBudgetExhausted, get_browser_budget
+import metrics
+import json
 import os
+import signal
+import sys
+import threading
+import time
 
 app = Flask(__name__)
 CORS(app)
 
+result_cache = cache_from_env()
+scrape_flight = SingleFlight()
+batch_scheduler = scheduler_from_env()
+SCRAPE_COALESCE_TIMEOUT = float(os.getenv("SCRAPE_COALESCE_TIMEOUT", 120))
+
+# Endpoints that may start browsers go through admission control
+admission = admission_from_env()
+ADMITTED_ENDPOINTS = {"scrape", "scrape_batch", "scrape_stream", "apply", "apply_batch"}
+SHUTDOWN_TIMEOUT = float(os.getenv("SHUTDOWN_TIMEOUT", 60))
+
+
+def scrape_cache_key(keywords, location, max_results):
+    # The scraper (requests, bs4, cryptography) loads on first use, not at startup
+    from naukri_scrapper import normalize_query
+
+    search_query, location = normalize_query(keywords, location)
+    return f"{search_query}|{location}|{max_results}"
+
+
+def scrape_jobs(keywords, location, max_results, **options):
+    """Run the configured scrape backend (see ``backends``) to completion."""
+    return list(get_backend()(keywords, location, max_results, debug=True, **options))
+
+
+def cached_scrape(keywords, location, max_results, browser_profile=None):
+    """
+    Scrape through the result cache, coalescing concurrent identical misses
+    into a single browser run. Returns ``(jobs, cache_status, deduplicated)``.
+    The browser profile does not change results, so it is not part of the key.
+    """
+    key = scrape_cache_key(keywords, location, max_results)
+    deduplicated = False
+
+    def scrape_and_store():
+        jobs = scrape_jobs(keywords, location, max_results, browser_profile=browser_profile)
+        get_job_store().upsert_jobs(jobs)
+        return jobs
+
+    def load():
+        nonlocal deduplicated
+        jobs, deduplicated = scrape_flight.do(
+            key, scrape_and_store, timeout=SCRAPE_COALESCE_TIMEOUT
+        )
+        return jobs
+
+    jobs, cache_status = result_cache.get_or_load(key, load)
+    return jobs, cache_status, deduplicated
+
+
+def incremental_scrape(keywords, location, max_results, browser_profile=None):
+    """
+    Scrape only jobs the store has not seen yet. Bypasses the result cache
+    (the answer depends on the store) but still coalesces identical calls.
+    Returns ``(jobs, deduplicated)``.
+    """
+    key = "incremental|" + scrape_cache_key(keywords, location, max_results)
+    return scrape_flight.do(
+        key,
+        lambda: scrape_jobs(
+            keywords, location, max_results, incremental=True, browser_profile=browser_profile
+        ),
+        timeout=SCRAPE_COALESCE_TIMEOUT,
+    )
+
+
+def run_scrape(
+    keywords, location, max_results, incremental=False, browser_profile=None, enrich=False
+):
+    """
+    Returns ``(jobs, cache_status, deduplicated)`` for a /scrape payload.
+    With ``enrich`` the jobs get description, skills and posted date from
+    their detail pages (see ``enrichment``).
+    """
+    if incremental:
+        jobs, deduplicated = incremental_scrape(
+            keywords, location, max_results, browser_profile
+        )
+        cache_status = "bypass"
+    else:
+        jobs, cache_status, deduplicated = cached_scrape(
+            keywords, location, max_results, browser_profile
+        )
+    if enrich:
+        from enrichment import enrich_jobs
+
+        jobs = enrich_jobs(jobs, debug=True)
+    return jobs, cache_status, deduplicated
+
+
+def invalid_browser_profile(data):
+    """A 400 response when the payload names an unknown browser profile, else None."""
+    from naukri_scrapper import BROWSER_PROFILES
+
+    profile = data.get("browser_profile")
+    if profile is None or profile in BROWSER_PROFILES:
+        return None
+    return (
+        jsonify(
+            {
+                "success": False,
+                "error": f"browser_profile must be one of {list(BROWSER_PROFILES)}",
+            }
+        ),
+        400,
+    )
+
+
+def _scrape_task(payload):
+    jobs, cache_status, deduplicated = run_scrape(
+        payload.get("keywords", "Product Manager"),
+        payload.get("location", "Mumbai"),
+        payload.get("max_results", 20),
+        bool(payload.get("incremental", False)),
+        payload.get("browser_profile"),
+        bool(payload.get("enrich", False)),
+    )
+    return {"count": len(jobs), "jobs": jobs, "cache": cache_status}
+
+
+def _max_results(value, where):
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise ValueError(f"{where} must be a positive integer")
+    return value
+
+
+def _batch_queries(data):
+    """
+    Normalised query dicts for a /scrape/batch payload. Raises ``ValueError``
+    (answered with 400) when ``queries`` is not a list of objects or a
+    ``max_results`` is not a positive integer.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Body must be a JSON object")
+    default_max = _max_results(data.get("max_results", 20), "max_results")
+    raw_queries = data.get("queries") or []
+    if not isinstance(raw_queries, list):
+        raise ValueError("queries must be a non-empty list")
+    queries = []
+    for i, query in enumerate(raw_queries):
+        if not isinstance(query, dict):
+            raise ValueError(f"queries[{i}] must be an object")
+        keywords = query.get("keywords", "Product Manager")
+        location = query.get("location", "Mumbai")
+        if not isinstance(keywords, str) or not isinstance(location, str):
+            raise ValueError(f"queries[{i}] keywords and location must be strings")
+        queries.append(
+            {
+                "keywords": keywords,
+                "location": location,
+                "max_results": _max_results(
+                    query.get("max_results", default_max), f"queries[{i}].max_results"
+                ),
+            }
+        )
+    return queries
+
+
+def run_batch_scrape(queries, incremental=False, browser_profile=None, enrich=False):
+    def scrape_one(keywords, location, max_results):
+        jobs, cache_status, _ = run_scrape(
+            keywords, location, max_results, incremental, browser_profile
+        )
+        return jobs, cache_status
+
+    batch = batch_scheduler.run(
+        queries,
+        scrape_one,
+        key=lambda q: scrape_cache_key(q["keywords"], q["location"], q["max_results"]),
+    )
+    if enrich:
+        from enrichment import enrich_jobs
+
+        # Enrich once, after cross-query deduplication
+        results = batch["results"]
+        enriched = iter(enrich_jobs([job for r in results for job in r["jobs"]], debug=True))
+        for result in results:
+            result["jobs"] = [next(enriched) for _ in result["jobs"]]
+    return batch
+
+
+def _scrape_batch_task(payload):
+    return run_batch_scrape(
+        _batch_queries(payload),
+        bool(payload.get("incremental", False)),
+        payload.get("browser_profile"),
+        bool(payload.get("enrich", False)),
+    )
+
+
+def _apply_task(payload):
+    email = os.getenv("NAUKRI_EMAIL")
+    password = os.getenv("NAUKRI_PASSWORD")
+    if not email or not password:
+        raise RuntimeError("NAUKRI_EMAIL and NAUKRI_PASSWORD env vars are required")
+    from naukri_scrapper import apply_to_naukri_job
+
+    return apply_to_naukri_job(
+        job_url=payload["job_url"],
+        email=email,
+        password=password,
+        cover_letter=payload.get("cover_letter"),
+        debug=True,
+    )
+
+
+_task_queue = None
+_task_queue_lock = threading.Lock()
+
+
+def get_task_queue():
+    """The background task queue, created and started on first use."""
+    global _task_queue
+    with _task_queue_lock:
+        if _task_queue is None:
+            _task_queue = queue_from_env(
+                {
+                    "scrape": _scrape_task,
+                    "scrape_batch": _scrape_batch_task,
+                    "apply": _apply_task,
+                },
+                # Applying twice is worse than failing once
+                requeue_kinds=("scrape", "scrape_batch"),
+            )
+            _task_queue.start()
+        return _task_queue
+
+
+def enqueue(kind, data):
+    """
+    Queue ``data`` as a background task and answer 202, or 400 when its
+    ``priority`` is not an integer, or 429 when the queue is full.
+    """
+    priority = data.get("priority", 0)
+    if isinstance(priority, bool) or not isinstance(priority, (int, str)):
+        priority = None
+    try:
+        priority = int(priority)
+    except (TypeError, ValueError):
+        return (
+            jsonify({"success": False, "error": "priority must be an integer"}),
+            400,
+        )
+    try:
+        task_id = get_task_queue().submit(kind, data, priority=priority)
+    except QueueFull as e:
+        return (
+            jsonify({"success": False, "error": f"Task queue is full ({e})"}),
+            429,
+            {"Retry-After": "30"},
+        )
+    return (
+        jsonify(
+            {
+                "success": True,
+                "task_id": task_id,
+                "status_url": f"/tasks/{task_id}",
+            }
+        ),
+        202,
+    )
+
 
 @app.route("/scrape", methods=["POST"])
 def scrape():
-    """API endpoint to scrape jobs from Naukri based on keywords and location."""
+    """
+    API endpoint to scrape jobs from Naukri based on keywords and location.
+
+    With ``"async": true`` the scrape is queued and a task id is returned
+    immediately (poll ``/tasks/<id>``); ``"priority"`` orders queued tasks.
+    ``"browser_profile": "lite"`` scrapes with the lightweight browser that
+    skips images, fonts and stylesheets. ``"enrich": true`` adds each job's
+    description, skills and posted date from its detail page.
+
+    Each job id is returned once; ``dup_group`` links likely reposts across
+    searches and ``near_duplicate`` is true when the group was first seen
+    as another job (counted in ``near_duplicates``).
+
+    Under load the request is refused with 429 (503 while the server shuts
+    down or when every browser slot on the machine is taken) and a
+    ``Retry-After`` header; see ``admission`` and ``browser_budget``. A
+    results page that is still throttled or failing after its retries is
+    answered with 503 too, rather than with a short list of jobs.
+    """
     data = request.json or {}
     keywords = data.get("keywords", "Product Manager")
     location = data.get("location", "Mumbai")
     max_results = data.get("max_results", 20)
+    incremental = bool(data.get("incremental", False))
+    browser_profile = data.get("browser_profile")
+    enrich = bool(data.get("enrich", False))
 
     print("=== /scrape called ===")
     print("Incoming data:", data)
 
-    jobs = scrape_naukri_jobs(keywords, location, max_results, debug=True)
+    invalid = invalid_browser_profile(data)
+    if invalid:
+        return invalid
+
+    if data.get("async"):
+        return enqueue("scrape", data)
+
+    try:
+        jobs, cache_status, deduplicated = run_scrape(
+            keywords, location, max_results, incremental, browser_profile, enrich
+        )
+    except SingleFlightTimeout as e:
+        print("Scrape error:", e)
+        return jsonify({"success": False, "error": str(e)}), 504
+    except BrowserBudgetExhausted as e:
+        print("Scrape error:", e)
+        return overloaded_response(Overloaded(str(e), 503, admission.retry_after))
+    except RetriesExhausted as e:
+        print("Scrape error:", e)
+        return retries_exhausted_response(e)
+    except Exception as e:
+        print("Scrape error:", e)
+        return jsonify({"success": False, "error": str(e)}), 500
     print(
         f"Scrape finished. keywords={keywords!r}, "
-        f"location={location!r}, count={len(jobs)}"
+        f"location={location!r}, count={len(jobs)}, cache={cache_status}, "
+        f"deduplicated={deduplicated}"
+    )
+
+    cache_stats = result_cache.stats()
+    return jsonify(
+        {
+            "success": True,
+            "count": len(jobs),
+            "jobs": jobs,
+            "near_duplicates": sum(1 for job in jobs if job.get("near_duplicate")),
+            "cache": {
+                "status": cache_status,
+                "hits": cache_stats["hits"] + cache_stats["stale_hits"],
+                "misses": cache_stats["misses"],
+            },
+            "deduplicated": deduplicated,
+        }
+    )
+
+
+@app.route("/scrape/batch", methods=["POST"])
+def scrape_batch():
+    """
+    Scrape many keyword/location pairs in one call.
+
+    Expects JSON body:
+    {
+      "queries": [{"keywords": "...", "location": "...", "max_results": 20}, ...],
+      "max_results": 20,      # default for queries without their own
+      "incremental": false,   # optional
+      "browser_profile": "standard" | "lite",  # optional
+      "enrich": false,        # optional, add detail page fields to every job
+      "async": false          # optional, queue the batch and return a task id
+    }
+
+    Queries share the batch worker pool and per-host limits; job URLs are
+    deduplicated across the batch. Returns per-query ``results`` and
+    overall throughput ``stats``.
+    """
+    data = request.json or {}
+    try:
+        queries = _batch_queries(data)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    print("=== /scrape/batch called ===")
+    print(f"Incoming batch: {len(queries)} queries")
+
+    if not queries:
+        return jsonify({"success": False, "error": "queries must be a non-empty list"}), 400
+    if len(queries) > batch_scheduler.max_queries:
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "error": f"At most {batch_scheduler.max_queries} queries per batch",
+                }
+            ),
+            400,
+        )
+
+    invalid = invalid_browser_profile(data)
+    if invalid:
+        return invalid
+
+    if data.get("async"):
+        return enqueue("scrape_batch", data)
+
+    batch = run_batch_scrape(
+        queries,
+        bool(data.get("incremental", False)),
+        data.get("browser_profile"),
+        bool(data.get("enrich", False)),
+    )
+    stats = batch["stats"]
+    print(
+        f"Batch finished. queries={stats['queries']}, unique_jobs={stats['unique_jobs']}, "
+        f"duplicates={stats['duplicate_jobs']}, seconds={stats['seconds']}"
+    )
+    return jsonify({"success": stats["failed"] < stats["queries"], **batch})
+
+
+STREAM_STORE_BATCH = 50
+
+
+def _stream_event(payload, fmt, event=None):
+    data = json.dumps(payload)
+    if fmt == "sse":
+        prefix = f"event: {event}\n" if event else ""
+        return f"{prefix}data: {data}\n\n"
+    return data + "\n"
+
+
+@app.route("/scrape/stream", methods=["POST"])
+def scrape_stream():
+    """
+    Streaming variant of /scrape: each job is sent as soon as it is parsed.
+
+    Accepts the /scrape payload plus ``"format"``: "ndjson" (default) or
+    "sse" (also selected by ``Accept: text/event-stream``). The last line /
+    event is a summary with the count and time to first job; its
+    ``complete`` is false when the scrape stopped on an error event.
+    """
+    data = request.json or {}
+    keywords = data.get("keywords", "Product Manager")
+    location = data.get("location", "Mumbai")
+    max_results = data.get("max_results", 20)
+    incremental = bool(data.get("incremental", False))
+    browser_profile = data.get("browser_profile")
+    fmt = data.get("format")
+    if fmt is None:
+        fmt = "sse" if request.accept_mimetypes.best == "text/event-stream" else "ndjson"
+
+    print("=== /scrape/stream called ===")
+    print("Incoming data:", data)
+
+    invalid = invalid_browser_profile(data)
+    if invalid:
+        return invalid
+
+    cached = None
+    if not incremental:
+        cached, cache_status = result_cache.get(
+            scrape_cache_key(keywords, location, max_results)
+        )
+        if cache_status == "miss":
+            cached = None
+
+    def generate():
+        started = time.monotonic()
+        first_job_at = None
+        count = 0
+        pending = []
+        complete = True
+        if cached is not None:
+            source = iter(cached)
+        else:
+            source = get_backend()(
+                keywords,
+                location,
+                max_results,
+                debug=True,
+                incremental=incremental,
+                browser_profile=browser_profile,
+            )
+        try:
+            for job in source:
+                if first_job_at is None:
+                    first_job_at = time.monotonic() - started
+                    print(f"[Stream] Time to first job: {first_job_at:.3f}s")
+                count += 1
+                yield _stream_event(job, fmt, event="job")
+                if cached is None:
+                    pending.append(job)
+                    if len(pending) >= STREAM_STORE_BATCH:
+                        get_job_store().upsert_jobs(pending)
+                        pending = []
+        except (BrowserBudgetExhausted, RetriesExhausted) as e:
+            # Headers are already sent, so report it in the stream instead of a 503
+            print("[Stream] Error:", e)
+            complete = False
+            yield _stream_event(
+                {"error": str(e), "retry_after": _retry_after(e)}, fmt, event="error"
+            )
+        finally:
+            if pending:
+                get_job_store().upsert_jobs(pending)
+        total = time.monotonic() - started
+        print(f"[Stream] Sent {count} jobs in {total:.3f}s")
+        yield _stream_event(
+            {
+                "done": True,
+                "complete": complete,
+                "count": count,
+                "cached": cached is not None,
+                "time_to_first_job": round(first_job_at, 3) if first_job_at is not None else None,
+                "total_time": round(total, 3),
+            },
+            fmt,
+            event="done",
+        )
+
+    mimetype = "text/event-stream" if fmt == "sse" else "application/x-ndjson"
+    return Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    """
+    Query previously scraped jobs without re-scraping.
+
+    Query parameters (all optional):
+      company, location  exact, case-insensitive match
+      q                  substring of the job title
+      since              only jobs seen at or after this epoch timestamp
+      limit              page size (default 50, max 500)
+      cursor             ``next_cursor`` from the previous page
+    """
+    args = request.args
+    try:
+        limit = min(max(int(args.get("limit", 50)), 1), 500)
+        since = float(args["since"]) if args.get("since") else None
+        jobs, next_cursor = get_job_store().query_jobs(
+            company=args.get("company"),
+            location=args.get("location"),
+            q=args.get("q"),
+            since=since,
+            limit=limit,
+            cursor=args.get("cursor"),
+        )
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    return jsonify(
+        {
+            "success": True,
+            "count": len(jobs),
+            "jobs": jobs,
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@app.route("/export", methods=["GET"])
+def export_jobs():
+    """
+    Stream stored jobs as a Parquet, Arrow IPC stream or CSV file.
+
+    Query parameters (all optional):
+      format                           "parquet" (default), "arrow" or "csv"
+      company, location, q, since      filters, as for /jobs
+      batch_size                       jobs per row group / record batch (default 5000)
+      compression                      Parquet codec (default "zstd")
+
+    Jobs are read and encoded one batch at a time, so large exports are
+    sent in chunks without being held in memory.
+    """
+    # pyarrow is only loaded once something is exported
+    import export
+
+    args = request.args
+    fmt = args.get("format", "parquet")
+    compression = args.get("compression", "zstd")
+    try:
+        export.check_format(fmt, compression)
+        batch_size = min(max(int(args.get("batch_size", 5000)), 1), 50000)
+        since = float(args["since"]) if args.get("since") else None
+    except export.ExportUnavailable as e:
+        return jsonify({"success": False, "error": str(e)}), 501
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    batches = get_job_store().iter_jobs(
+        batch_size,
+        company=args.get("company"),
+        location=args.get("location"),
+        q=args.get("q"),
+        since=since,
+    )
+    chunks = export.iter_export(fmt, batches, compression)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=export.CONTENT_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="jobs.{export.EXTENSIONS[fmt]}"'
+        },
+    )
+
+
+@app.route("/scrape/async", methods=["POST"])
+async def scrape_async():
+    """
+    Same payload as /scrape, served by the asyncio requests/BeautifulSoup
+    backend. Never starts a browser.
+    """
+    data = request.json or {}
+    keywords = data.get("keywords", "Product Manager")
+    location = data.get("location", "Mumbai")
+    max_results = data.get("max_results", 20)
+
+    print("=== /scrape/async called ===")
+    print("Incoming data:", data)
+
+    from async_scraper import scrape_naukri_jobs_async
+
+    try:
+        jobs = await scrape_naukri_jobs_async(keywords, location, max_results, debug=True)
+    except RetriesExhausted as e:
+        print("Scrape error:", e)
+        return retries_exhausted_response(e)
+
     return jsonify(
         {
             "success": True,
@@ -44,6 +660,8 @@ def apply():
       "cover_letter": "..."  # optional
     }
 
+    Add ``"async": true`` to queue the apply and get a task id back.
+
     NOTE: This is intended to run on your local machine where Selenium/Chrome
     are available. Do not expose publicly without proper auth.
     """
@@ -58,6 +676,9 @@ def apply():
     if not job_url:
         return jsonify({"success": False, "error": "job_url is required"}), 400
 
+    if data.get("async"):
+        return enqueue("apply", data)
+
     email = os.getenv("NAUKRI_EMAIL")
     password = os.getenv("NAUKRI_PASSWORD")
 
@@ -72,6 +693,8 @@ def apply():
             500,
         )
 
+    from naukri_scrapper import apply_to_naukri_job
+
     try:
         result = apply_to_naukri_job(
             job_url=job_url,
@@ -81,16 +704,303 @@ def apply():
             debug=True,
         )
         return jsonify({"success": True, **result})
+    except BrowserBudgetExhausted as e:
+        print("Apply error:", e)
+        return overloaded_response(Overloaded(str(e), 503, admission.retry_after))
     except Exception as e:
         print("Apply error:", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route("/apply/batch", methods=["POST"])
+def apply_batch():
+    """
+    Apply to many Naukri job URLs with a single login.
+
+    Expects JSON body:
+    {
+      "jobs": [
+        {"job_url": "...", "cover_letter": "..."},  # cover_letter optional
+        ...
+      ]
+    }
+
+    Failures on individual jobs are reported per job and do not stop the
+    batch. Same local-only caveat as /apply.
+    """
+
+    data = request.json or {}
+    applications = data.get("jobs") or []
+
+    print("=== /apply/batch called ===")
+    print(f"Incoming data: {len(applications)} jobs")
+
+    if not isinstance(applications, list) or not applications:
+        return jsonify({"success": False, "error": "jobs must be a non-empty list"}), 400
+    if not all(isinstance(a, dict) for a in applications):
+        return jsonify({"success": False, "error": "each job must be an object"}), 400
+
+    email = os.getenv("NAUKRI_EMAIL")
+    password = os.getenv("NAUKRI_PASSWORD")
+
+    if not email or not password:
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "error": "NAUKRI_EMAIL and NAUKRI_PASSWORD env vars are required",
+                }
+            ),
+            500,
+        )
+
+    from naukri_scrapper import apply_to_naukri_jobs
+
+    try:
+        result = apply_to_naukri_jobs(applications, email, password, debug=True)
+        return jsonify({"success": True, **result})
+    except BrowserBudgetExhausted as e:
+        print("Batch apply error:", e)
+        return overloaded_response(Overloaded(str(e), 503, admission.retry_after))
+    except Exception as e:
+        print("Batch apply error:", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route("/tasks/<task_id>", methods=["GET"])
+def task_status(task_id):
+    """Status (and result, once finished) of a queued /scrape or /apply."""
+    task = get_task_queue().get(task_id)
+    if task is None:
+        return jsonify({"success": False, "error": "Unknown task"}), 404
+    return jsonify({"success": True, **task})
+
+
+@app.route("/tasks/<task_id>", methods=["DELETE"])
+def cancel_task(task_id):
+    """Cancel a queued task; a running task is discarded when it finishes."""
+    status = get_task_queue().cancel(task_id)
+    if status is None:
+        return jsonify({"success": False, "error": "Unknown task"}), 404
+    return jsonify({"success": True, "task_id": task_id, "status": status})
+
+
+@app.route("/tasks", methods=["GET"])
+def task_stats():
+    return jsonify(get_task_queue().stats())
+
+
+@app.route("/pool/stats", methods=["GET"])
+def driver_pool_stats():
+    """Live/idle/in-use counts and recycle counters for each driver pool."""
+    return jsonify(pool_stats())
+
+
+@app.route("/cache/stats", methods=["GET"])
+def cache_stats():
+    """Hit/miss/eviction counters and size of the /scrape result cache."""
+    return jsonify(result_cache.stats())
+
+
+@app.route("/scrape/coalescing", methods=["GET"])
+def scrape_coalescing_stats():
+    """How many /scrape requests were served by another request's in-flight run."""
+    return jsonify(scrape_flight.stats())
+
+
+@app.before_request
+def _start_timer():
+    g.request_started = time.perf_counter()
+
+
+def _retry_after(e):
+    """Seconds a client should wait before retrying after ``e``."""
+    retry_after = getattr(e, "retry_after", None)
+    if isinstance(e, RetriesExhausted) and retry_after:
+        return max(1, int(retry_after))
+    return admission.retry_after
+
+
+def retries_exhausted_response(e):
+    """503 for a scrape whose pages were still failing after their retries."""
+    return overloaded_response(Overloaded(str(e), 503, _retry_after(e)))
+
+
+def overloaded_response(e):
+    """429/503 JSON error with a Retry-After header for an ``Overloaded``."""
+    return (
+        jsonify({"success": False, "error": str(e)}),
+        e.status,
+        {"Retry-After": str(e.retry_after)},
+    )
+
+
+@app.before_request
+def _admit():
+    """Hold an admission slot for the whole request (streams included)."""
+    if request.endpoint not in ADMITTED_ENDPOINTS:
+        return None
+    # Queued requests only touch the task queue, which has its own limit
+    data = request.get_json(silent=True)
+    if isinstance(data, dict) and data.get("async"):
+        return None
+    try:
+        admission.admit()
+    except Overloaded as e:
+        print(f"[Admission] Rejected {request.path}: {e}")
+        return overloaded_response(e)
+    g.admitted = True
+    return None
+
+
+@app.teardown_request
+def _release_admission(exc):
+    if g.pop("admitted", False):
+        admission.release()
+
+
+@app.after_request
+def _record_latency(response):
+    started = g.pop("request_started", None)
+    if started is not None:
+        metrics.HTTP_REQUEST_SECONDS.labels(
+            endpoint=request.url_rule.rule if request.url_rule else "unmatched",
+            method=request.method,
+            status=response.status_code,
+        ).observe(time.perf_counter() - started)
+    return response
+
+
+def _flatten_stats(stats, prefix=""):
+    """``{"scrape": {"live": 1}}`` -> ``{"scrape_live": 1}`` for gauge collectors."""
+    flat = {}
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            flat.update(_flatten_stats(value, f"{prefix}{key}_"))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+metrics.register_collector(
+    "naukri_driver_pool", "Driver pool counters, keyed by <pool>_<stat>.",
+    lambda: _flatten_stats(pool_stats()),
+)
+metrics.register_collector(
+    "naukri_result_cache", "/scrape result cache counters.",
+    lambda: _flatten_stats(result_cache.stats()),
+)
+metrics.register_collector(
+    "naukri_scrape_coalescing", "/scrape single-flight counters.",
+    lambda: _flatten_stats(scrape_flight.stats()),
+)
+metrics.register_collector(
+    "naukri_page_readiness", "Results page readiness wait statistics.",
+    lambda: _flatten_stats(readiness_stats()),
+)
+metrics.register_collector(
+    "naukri_batch_scheduler", "/scrape/batch scheduler counters.",
+    lambda: _flatten_stats(batch_scheduler.stats()),
+)
+metrics.register_collector(
+    "naukri_host_limiter", "Per-host page load slots, keyed by stat or active_<host>.",
+    lambda: _flatten_stats(get_host_limiter().stats()),
+)
+metrics.register_collector(
+    "naukri_rate_limiter", "Shared request rate limiter state (tokens, effective rate, retries).",
+    lambda: get_rate_limiter().stats(),
+)
+metrics.register_collector(
+    "naukri_strategy_cache", "Learned selector/field strategy order counters.",
+    lambda: {
+        key: value
+        for key, value in get_strategy_cache().stats().items()
+        if key != "preferred"
+    },
+)
+metrics.register_collector(
+    "naukri_enrichment", "Job detail enrichment counters.",
+    # Empty until a request has loaded (and used) the enricher
+    lambda: sys.modules["enrichment"].enrichment_stats() if "enrichment" in sys.modules else {},
+)
+metrics.register_collector(
+    "naukri_dedup", "Near-duplicate job index size and counters.",
+    lambda: get_dedup_index().stats(),
+)
+metrics.register_collector(
+    "naukri_admission", "Per-worker admission control for browser endpoints.",
+    admission.stats,
+)
+metrics.register_collector(
+    "naukri_browser_budget", "Machine-wide browser slots (shared by all workers).",
+    lambda: get_browser_budget().stats(),
+)
+metrics.register_collector(
+    "naukri_task_queue", "Background task queue counters.",
+    lambda: _flatten_stats(_task_queue.stats()) if _task_queue else {},
+)
+
+
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """
+    Per-phase scrape/apply timings and component counters (Prometheus text
+    format). Under gunicorn these cover every worker (see ``metrics``).
+    """
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
 @app.route("/health", methods=["GET"])
 def health():
     return jsonify({"status": "ok"})
 
 
+def _prewarm_scrape_pool():
+    warm = int(os.getenv("DRIVER_POOL_WARM", 1))
+    if warm <= 0 or default_backend() != "selenium" or not browser_available():
+        return
+    from naukri_scrapper import get_scrape_pool
+
+    try:
+        started = get_scrape_pool().warm(warm)
+        print(f"Pre-warmed {started} Chrome driver(s)")
+    except Exception as e:
+        print("Driver pre-warm failed (simple scraper will be used):", e)
+
+
+def start_worker():
+    """Per-process startup: pre-warm drivers, resume queued tasks and share metrics."""
+    metrics.start_sync()
+    threading.Thread(target=_prewarm_scrape_pool, daemon=True).start()
+    # Resume any tasks left queued by a previous run
+    get_task_queue()
+
+
+def shutdown(timeout=None):
+    """
+    Graceful stop: new browser requests get 503 while in-flight ones and
+    running tasks finish (for up to ``timeout`` seconds in total), then
+    every driver is quit.
+    """
+    timeout = SHUTDOWN_TIMEOUT if timeout is None else timeout
+    deadline = time.monotonic() + timeout
+    started = time.monotonic()
+    drained = admission.drain(timeout)
+    if _task_queue is not None:
+        _task_queue.stop(max(0, deadline - time.monotonic()))
+    close_pools(max(0, deadline - time.monotonic()))
+    print(
+        f"[Shutdown] {'Drained' if drained else 'Timed out draining'} in-flight requests, "
+        f"drivers closed after {time.monotonic() - started:.1f}s"
+    )
+
+
 if __name__ == "__main__":
+    # Development server; use gunicorn (see gunicorn.conf.py) in production
     port = int(os.getenv("PORT", 5000))
-    app.run(host="0.0.0.0", port=port)
\ No newline at end of file
+    start_worker()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        app.run(host="0.0.0.0", port=port, threaded=True)
+    finally:
+        shutdown()
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+asyncio version of the requests/BeautifulSoup scraper.
+
+Pages are fetched with aiohttp over a bounded connection pool and parsed in
+an executor, so the event loop only ever waits on sockets. One process can
+run hundreds of keyword/location searches at once with ``scrape_many_async``.
+
+    async with AsyncScraper() as scraper:
+        jobs = await scraper.scrape("Product Manager", "Mumbai", 40)
+
+``iter_naukri_jobs_async`` runs one scrape to completion on its own event
+loop, so synchronous callers can use this scraper as the "async" backend
+(``backends``).
+
+Configuration (environment variables):
+  ASYNC_POOL_LIMIT          max open connections (default 100)
+  ASYNC_POOL_LIMIT_PER_HOST max open connections per host (default 20)
+  ASYNC_PARSE_EXECUTOR      "thread" (default) or "process"
+  ASYNC_PARSE_WORKERS       parser workers (default: CPU count)
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import aiohttp
+
+from naukri_scrapper import (
+    RESULTS_PER_PAGE,
+    SIMPLE_HEADERS,
+    _filter_known,
+    _parse_simple_page,
+    build_search_url,
+    results_page_url,
+)
+from rate_limiter import RetriesExhausted, RetryableError, check_status, get_rate_limiter
+from dedup import get_dedup_index
+from job_store import get_job_store
+
+
+def _make_executor():
+    workers = int(os.getenv("ASYNC_PARSE_WORKERS", os.cpu_count() or 4))
+    if os.getenv("ASYNC_PARSE_EXECUTOR", "thread") == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="naukri-parse")
+
+
+class AsyncScraper:
+    """Owns an aiohttp session and a parser executor for a batch of scrapes."""
+
+    def __init__(self, limit=None, limit_per_host=None, executor=None, timeout=20, debug=False):
+        self.limit = limit or int(os.getenv("ASYNC_POOL_LIMIT", 100))
+        self.limit_per_host = limit_per_host or int(os.getenv("ASYNC_POOL_LIMIT_PER_HOST", 20))
+        self.timeout = timeout
+        self.debug = debug
+        self.session = None
+        self.executor = executor
+        self._owns_executor = executor is None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=SIMPLE_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        if self.executor is None:
+            self.executor = _make_executor()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+
+    async def _fetch_page(self, url, location, limit):
+        if self.debug:
+            print(f"[Async] Fetching URL: {url}")
+
+        async def fetch():
+            async with self.session.get(url) as resp:
+                check_status(resp.status, resp.headers.get("Retry-After"))
+                resp.raise_for_status()
+                return await resp.text()
+
+        try:
+            html = await get_rate_limiter().call_async(
+                fetch,
+                retry_on=(aiohttp.ClientConnectionError, asyncio.TimeoutError),
+                debug=self.debug,
+            )
+        except (RetryableError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise RetriesExhausted(url, e) from e
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _parse_simple_page, html, location, limit
+        )
+
+    async def scrape_url(self, url, location, max_results=20, max_pages=10, store=None):
+        """
+        Async equivalent of ``scrape_naukri_jobs_simple``: fetch as many pages
+        as ``max_results`` needs concurrently, merge them in page order and
+        stop at the first empty page. Raises ``RetriesExhausted`` when a
+        page is still throttled or failing after its retries.
+
+        With a ``store`` (a ``JobStore``) the scrape is incremental: each
+        merged page is recorded in the store, only jobs it did not have are
+        returned, and merging stops at the first page that was all known.
+        """
+        jobs = []
+        dedup = get_dedup_index().session()
+        loop = asyncio.get_running_loop()
+        page = 1
+
+        while len(jobs) < max_results and page <= max_pages:
+            needed = -(-(max_results - len(jobs)) // RESULTS_PER_PAGE)
+            pages = list(range(page, min(page + needed, max_pages + 1)))
+            results = await asyncio.gather(
+                *(
+                    self._fetch_page(results_page_url(url, p), location, max_results)
+                    for p in pages
+                ),
+                return_exceptions=True,
+            )
+
+            exhausted = False
+            for p, page_jobs in zip(pages, results):
+                if isinstance(page_jobs, RetriesExhausted):
+                    raise page_jobs
+                if isinstance(page_jobs, Exception):
+                    if self.debug:
+                        print(f"[Async] Error fetching page {p}: {page_jobs}")
+                    page_jobs = []
+                if not page_jobs:
+                    exhausted = True
+                    break
+                if store is not None:
+                    page_jobs, all_known = await loop.run_in_executor(
+                        None, _filter_known, store, page_jobs
+                    )
+                    if all_known:
+                        if self.debug:
+                            print(f"[Async] Page {p} is already known, stopping")
+                        exhausted = True
+                        break
+                for job in page_jobs:
+                    if not dedup.accept(job):
+                        continue
+                    jobs.append(job)
+                    if len(jobs) >= max_results:
+                        break
+                if len(jobs) >= max_results:
+                    break
+            if exhausted:
+                break
+            page = pages[-1] + 1
+
+        if self.debug:
+            print(f"[Async] Returning {len(jobs)} jobs for {url}")
+        return jobs[:max_results]
+
+    async def scrape(self, keywords, location, max_results=20, max_pages=10, store=None):
+        url = build_search_url(keywords, location)
+        return await self.scrape_url(url, location, max_results, max_pages, store)
+
+
+async def scrape_naukri_jobs_async(keywords, location, max_results=20, debug=False):
+    """One-off async scrape with its own session; prefer ``AsyncScraper`` for many."""
+    async with AsyncScraper(debug=debug) as scraper:
+        return await scraper.scrape(keywords, location, max_results)
+
+
+def iter_naukri_jobs_async(
+    keywords,
+    location,
+    max_results=20,
+    debug=False,
+    store=None,
+    incremental=False,
+    max_pages=10,
+    **browser_options,
+):
+    """
+    Synchronous iterator over an async scrape: the "async" backend. Takes
+    the same arguments as the other backends; all pages are fetched before
+    the first job is yielded and browser-only options are ignored. In
+    incremental mode pages are recorded in the store as they are merged,
+    like ``iter_naukri_jobs_simple`` does.
+    """
+    if incremental and store is None:
+        store = get_job_store()
+
+    async def scrape():
+        async with AsyncScraper(debug=debug) as scraper:
+            return await scraper.scrape(
+                keywords, location, max_results, max_pages, store if incremental else None
+            )
+
+    yield from asyncio.run(scrape())
+
+
+async def scrape_many_async(queries, concurrency=50, debug=False):
+    """
+    Run many searches concurrently over one session.
+
+    ``queries`` is a list of dicts with ``keywords``, ``location`` and an
+    optional ``max_results``. Returns a list of ``{"query", "jobs"}`` (or
+    ``{"query", "error"}``) dicts in the same order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncScraper(debug=debug) as scraper:
+
+        async def run(query):
+            async with semaphore:
+                try:
+                    jobs = await scraper.scrape(
+                        query["keywords"],
+                        query["location"],
+                        query.get("max_results", 20),
+                    )
+                    return {"query": query, "jobs": jobs}
+                except Exception as e:
+                    return {"query": query, "error": str(e)}
+
+        return await asyncio.gather(*(run(q) for q in queries))
@@ -0,0 +1,155 @@
+"""
+Registry of scrape backends, each imported only when first used.
+
+A backend is registered as ``"module:attribute"`` and resolved on the first
+``get_backend(name)`` call, so a process that only ever scrapes over HTTP
+never imports Selenium or webdriver-manager, and aiohttp is not loaded
+until the asyncio backend is used:
+
+  selenium  naukri_scrapper.iter_naukri_jobs (pooled Chrome, falls back to simple)
+  simple    naukri_scrapper.iter_naukri_search_simple (requests + BeautifulSoup)
+  async     async_scraper.iter_naukri_jobs_async (aiohttp on a private event loop)
+
+Every backend has one signature, ``(keywords, location, max_results=20,
+debug=False, **options)``, and is a plain (synchronous) iterator of job
+dicts, so any of them can be chosen with ``SCRAPE_BACKEND``. Add one with
+``register_backend("name", "module:function")``.
+
+Whether this machine can run a browser at all is checked once per process
+(``browser_available``) by looking for the Chrome binary, so deployments
+without Chrome go straight to the simple backend instead of failing a
+driver start on every request. ``chromedriver_path`` likewise resolves the
+driver once per process rather than once per pool.
+
+Configuration (environment variables):
+  SCRAPE_BACKEND     backend for scrapes: "auto" (default; selenium when Chrome
+                     is installed, else simple) or a registered name
+  CHROME_BINARY      Chrome/Chromium executable (default: searched on PATH)
+  CHROMEDRIVER_PATH  chromedriver to use instead of resolving one with webdriver-manager
+"""
+
+import importlib
+import importlib.util
+import os
+import shutil
+import threading
+
+from metrics import SCRAPE_PHASE_SECONDS, timed
+
+_registry = {}  # name -> "module:attribute"
+_loaded = {}
+_lock = threading.Lock()
+
+CHROME_BINARIES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+)
+CHROME_APP_PATHS = (
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+)
+
+
+def register_backend(name, target):
+    """Register ``target`` (``"module:attribute"``) as backend ``name``."""
+    if ":" not in target:
+        raise ValueError(f"Backend target must be 'module:attribute', got {target!r}")
+    with _lock:
+        _registry[name] = target
+        _loaded.pop(name, None)
+
+
+def backend_names():
+    with _lock:
+        return sorted(_registry)
+
+
+def loaded_backends():
+    """Names of the backends imported so far in this process."""
+    with _lock:
+        return sorted(_loaded)
+
+
+def get_backend(name=None):
+    """The backend called ``name`` (default ``default_backend()``), importing it on first use."""
+    name = name or default_backend()
+    with _lock:
+        backend = _loaded.get(name)
+        if backend is not None:
+            return backend
+        target = _registry.get(name)
+    if target is None:
+        raise ValueError(f"Unknown scrape backend {name!r}, expected one of {backend_names()}")
+    module_name, attribute = target.split(":", 1)
+    backend = getattr(importlib.import_module(module_name), attribute)
+    with _lock:
+        _loaded[name] = backend
+    return backend
+
+
+# ---------------------------------------------------------------------- #
+# Browser detection and driver resolution
+# ---------------------------------------------------------------------- #
+_browser = None
+_driver_path = None
+_driver_lock = threading.Lock()
+
+
+def chrome_binary():
+    """Path of the Chrome binary this process would launch, or None."""
+    configured = os.getenv("CHROME_BINARY")
+    if configured:
+        return configured if os.path.exists(configured) else None
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    for path in CHROME_APP_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def browser_available():
+    """True when Selenium is installed and a Chrome binary was found (checked once)."""
+    global _browser
+    if _browser is None:
+        _browser = importlib.util.find_spec("selenium") is not None and chrome_binary() is not None
+        if not _browser:
+            print("[Backends] No Chrome binary found; scraping with the simple backend")
+    return _browser
+
+
+def default_backend():
+    configured = os.getenv("SCRAPE_BACKEND", "auto")
+    if configured != "auto":
+        return configured
+    return "selenium" if browser_available() else "simple"
+
+
+def chromedriver_path():
+    """
+    The chromedriver executable, resolved once per process:
+    ``CHROMEDRIVER_PATH`` if set, otherwise webdriver-manager (which checks
+    the installed Chrome version and may download a driver).
+    """
+    global _driver_path
+    with _driver_lock:
+        if _driver_path is None:
+            path = os.getenv("CHROMEDRIVER_PATH")
+            if not path:
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                with timed(SCRAPE_PHASE_SECONDS, phase="driver_install"):
+                    path = ChromeDriverManager().install()
+            _driver_path = path
+        return _driver_path
+
+
+register_backend("selenium", "naukri_scrapper:iter_naukri_jobs")
+register_backend("simple", "naukri_scrapper:iter_naukri_search_simple")
+register_backend("async", "async_scraper:iter_naukri_jobs_async")
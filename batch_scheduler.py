@@ -0,0 +1,127 @@
+"""
+Scheduler for multi-query scrape batches (``POST /scrape/batch``).
+
+Queries from every batch share one bounded worker pool, so a batch of fifty
+keyword x city combinations does not start fifty scrapes at once; the
+per-host limit in ``host_limits`` further caps page loads against one site.
+Identical queries in a batch run once, jobs are deduplicated across the
+whole batch by Naukri job id (``dedup.job_key``; the URL for jobs without
+one), the first query in request order keeps a job, and the result carries
+per-query groups plus overall throughput.
+
+Configuration (environment variables):
+  BATCH_WORKERS      queries scraped concurrently across all batches (default 4)
+  BATCH_MAX_QUERIES  max queries accepted in one batch (default 100)
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dedup import job_key
+
+
+class BatchScheduler:
+    def __init__(self, workers=4, max_queries=100):
+        self.workers = max(1, int(workers))
+        self.max_queries = int(max_queries)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="batch-scrape"
+        )
+        self._lock = threading.Lock()
+        self._stats = {"batches": 0, "queries": 0, "queries_executed": 0, "errors": 0}
+
+    def run(self, queries, scrape, key=None):
+        """
+        Scrape every query and return ``{"results": [...], "stats": {...}}``.
+
+        ``queries`` are dicts with ``keywords``, ``location`` and optional
+        ``max_results``; ``scrape(keywords, location, max_results)`` returns
+        ``(jobs, cache_status)``. ``key(query)`` identifies duplicate queries.
+        """
+        if len(queries) > self.max_queries:
+            raise ValueError(f"At most {self.max_queries} queries per batch")
+        key = key or (lambda q: (q["keywords"], q["location"], q["max_results"]))
+        started = time.monotonic()
+
+        def run_one(query):
+            query_started = time.monotonic()
+            outcome = {"jobs": [], "cache": None, "error": None}
+            try:
+                outcome["jobs"], outcome["cache"] = scrape(
+                    query["keywords"], query["location"], query["max_results"]
+                )
+            except Exception as e:
+                outcome["error"] = str(e)
+            outcome["seconds"] = round(time.monotonic() - query_started, 3)
+            return outcome
+
+        futures = {}
+        for query in queries:
+            k = key(query)
+            if k not in futures:
+                futures[k] = self._executor.submit(run_one, query)
+
+        seen = set()
+        results = []
+        total_jobs = 0
+        for query in queries:
+            outcome = futures[key(query)].result()
+            unique = []
+            duplicates = 0
+            for job in outcome["jobs"]:
+                total_jobs += 1
+                identity = job_key(job)
+                if identity in seen:
+                    duplicates += 1
+                    continue
+                seen.add(identity)
+                unique.append(job)
+            results.append(
+                {
+                    "keywords": query["keywords"],
+                    "location": query["location"],
+                    "max_results": query["max_results"],
+                    "success": outcome["error"] is None,
+                    "count": len(unique),
+                    "duplicates": duplicates,
+                    "jobs": unique,
+                    "cache": outcome["cache"],
+                    "seconds": outcome["seconds"],
+                    **({"error": outcome["error"]} if outcome["error"] else {}),
+                }
+            )
+
+        elapsed = time.monotonic() - started
+        errors = sum(1 for r in results if not r["success"])
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["queries"] += len(queries)
+            self._stats["queries_executed"] += len(futures)
+            self._stats["errors"] += errors
+        return {
+            "results": results,
+            "stats": {
+                "queries": len(queries),
+                "queries_executed": len(futures),
+                "failed": errors,
+                "jobs": total_jobs,
+                "unique_jobs": len(seen),
+                "duplicate_jobs": total_jobs - len(seen),
+                "seconds": round(elapsed, 3),
+                "queries_per_sec": round(len(queries) / elapsed, 2) if elapsed else None,
+                "jobs_per_sec": round(len(seen) / elapsed, 2) if elapsed else None,
+            },
+        }
+
+    def stats(self):
+        with self._lock:
+            return {"workers": self.workers, "max_queries": self.max_queries, **self._stats}
+
+
+def scheduler_from_env():
+    return BatchScheduler(
+        workers=int(os.getenv("BATCH_WORKERS", 4)),
+        max_queries=int(os.getenv("BATCH_MAX_QUERIES", 100)),
+    )
@@ -0,0 +1,57 @@
+"""
+One login per job (``apply_to_naukri_job`` in a loop) vs a single login for
+the whole batch (``apply_to_naukri_jobs``) against a local stand-in site.
+
+    python benchmarks/bench_apply.py --jobs 10
+
+Requires a local Chrome.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import FixtureServer, standin_site_routes  # noqa: E402
+from naukri_scrapper import (  # noqa: E402
+    apply_to_naukri_job,
+    apply_to_naukri_jobs,
+    get_apply_pool,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=10)
+    args = parser.parse_args()
+
+    with FixtureServer(standin_site_routes(args.jobs)) as server:
+        login_url = server.base_url + "/nlogin/login"
+        urls = [f"{server.base_url}/job-listings-standin-{i}" for i in range(args.jobs)]
+
+        started = time.perf_counter()
+        for url in urls:
+            apply_to_naukri_job(url, "user@example.com", "secret", "Hello", login_url=login_url)
+        single = time.perf_counter() - started
+        print(f"one login per job: {single:.2f}s ({single / len(urls):.2f}s/job)")
+
+        # Include a bad URL to show the batch carries on after a failure
+        applications = [{"job_url": url, "cover_letter": "Hello"} for url in urls]
+        applications.insert(1, {"job_url": server.base_url + "/missing"})
+        report = apply_to_naukri_jobs(applications, "user@example.com", "secret", login_url=login_url)
+        print(
+            f"batch: {report['total_seconds']:.2f}s, applied={report['applied']}, "
+            f"failed={report['failed']}, logins={report['logins']} "
+            f"({report['login_seconds']:.2f}s logging in)"
+        )
+        for result in report["results"]:
+            status = "ok " if result["success"] else "ERR"
+            print(f"  {status} {result['seconds']:6.2f}s {result['job_url']}")
+
+    get_apply_pool().close()
+
+
+if __name__ == "__main__":
+    main()
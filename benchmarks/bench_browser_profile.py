@@ -0,0 +1,117 @@
+"""
+Compare the "standard" and "lite" scrape browser profiles on a results page
+that pulls in stylesheets, fonts, images and tracker scripts.
+
+Reports ``driver.get`` time, time until tuples are ready, jobs extracted and
+the resident memory of the Chrome process tree for each profile.
+
+    python benchmarks/bench_browser_profile.py --asset-latency 0.1 --runs 5
+
+Requires a local Chrome (uses the scraper's driver pools). Linux only for
+the memory column (reads /proc).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import FixtureServer, heavy_page_routes  # noqa: E402
+from naukri_scrapper import (  # noqa: E402
+    BROWSER_PROFILES,
+    extract_jobs_from_html,
+    get_scrape_pool,
+)
+from page_readiness import wait_for_tuples  # noqa: E402
+
+
+def _children(pid):
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid:
+            children.append(int(entry))
+    return children
+
+
+def _tree_rss_mb(pid):
+    """Resident memory of ``pid`` and all its descendants, in MB."""
+    total_kb = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+        stack.extend(_children(current))
+    return round(total_kb / 1024, 1)
+
+
+def bench_profile(profile, url, runs, count):
+    pool = get_scrape_pool(profile)
+    lease = pool.acquire()
+    driver = lease.driver
+    loads, readies, jobs = [], [], 0
+    try:
+        for _ in range(runs):
+            driver.get("about:blank")
+            started = time.perf_counter()
+            driver.get(url)
+            loaded = time.perf_counter()
+            wait_for_tuples(driver, target_count=count)
+            ready = time.perf_counter()
+            jobs = len(extract_jobs_from_html(driver.page_source, "Mumbai", count))
+            loads.append(loaded - started)
+            readies.append(ready - started)
+        rss = _tree_rss_mb(driver.service.process.pid)
+    finally:
+        pool.release(lease)
+        pool.close()
+    return {
+        "profile": profile,
+        "load_ms": round(min(loads) * 1000, 1),
+        "ready_ms": round(min(readies) * 1000, 1),
+        "jobs": jobs,
+        "rss_mb": rss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--asset-latency", type=float, default=0.05)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    routes = heavy_page_routes(args.count, args.images, args.asset_latency)
+    with FixtureServer(routes) as server:
+        results = [
+            bench_profile(profile, server.base_url + "/jobs", args.runs, args.count)
+            for profile in BROWSER_PROFILES
+        ]
+
+    print(f"Best of {args.runs}, {args.images} images, asset latency {args.asset_latency}s")
+    print(f"{'profile':<10} {'get ms':>9} {'ready ms':>9} {'jobs':>5} {'Chrome RSS MB':>14}")
+    for r in results:
+        print(
+            f"{r['profile']:<10} {r['load_ms']:>9} {r['ready_ms']:>9} "
+            f"{r['jobs']:>5} {r['rss_mb']:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark the compiled field classifier against the old per-span loops.
+
+Span texts are pulled out of the fixture result pages up front, so only
+classification is timed:
+
+  legacy    the substring/city-list loop ``_parse_job_tuple`` used per span
+  labels    ``classify_spans`` over every span on the page (classification only)
+  per-tuple ``classify_fields`` once per tuple, including min/max range parsing
+  batched   ``classify_batch`` once per page, including min/max range parsing
+
+It also lists texts where the legacy rules and the classifier disagree,
+e.g. the old ``'pa'`` substring check treating "Japan" as a salary.
+
+    python benchmarks/bench_classifier.py --tuples 20 100 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from field_classifier import classify, classify_batch, classify_fields, classify_spans  # noqa: E402
+from fixtures import results_page  # noqa: E402
+from naukri_scrapper import JOB_SELECTORS  # noqa: E402
+
+TRICKY_TEXTS = [
+    "Pune",
+    "Japan",
+    "Spanish speaking",
+    "Hybrid - Bengaluru",
+    "Gurugram",
+    "12-18 LPA",
+    "3-5 Lacs P.A.",
+    "Fresher",
+    "Company Paid Relocation",
+]
+
+
+def _legacy_fields(texts, location):
+    """The per-span loop ``_parse_job_tuple`` used before the classifier."""
+    experience = 'Not specified'
+    salary = 'Not disclosed'
+    job_location = location
+    for text in texts:
+        text = text.strip()
+        text_lower = text.lower()
+        if 'yr' in text_lower or 'year' in text_lower or 'exp' in text_lower:
+            if experience == 'Not specified':
+                experience = text
+        elif 'lakh' in text_lower or 'crore' in text_lower or 'salary' in text_lower or 'pa' in text_lower:
+            if salary == 'Not disclosed':
+                salary = text
+        elif any(city in text_lower for city in ['bangalore', 'mumbai', 'delhi', 'hyderabad', 'pune', 'chennai', 'gurgaon', 'noida']):
+            job_location = text
+    return {'experience': experience, 'salary': salary, 'location': job_location}
+
+
+def _legacy_label(text):
+    fields = _legacy_fields([text], None)
+    if fields['experience'] != 'Not specified':
+        return 'experience'
+    if fields['salary'] != 'Not disclosed':
+        return 'salary'
+    if fields['location'] is not None:
+        return 'location'
+    return None
+
+
+def _page_spans(html):
+    page = BeautifulSoup(html, "lxml")
+    return [[span.text for span in e.find_all("span")] for e in page.select(JOB_SELECTORS[0])]
+
+
+def _best_of(fn, runs):
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tuples", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"Span classification (best of {args.runs})")
+    for n in args.tuples:
+        groups = _page_spans(results_page(n))
+        spans = [t for g in groups for t in g]
+        legacy = _best_of(lambda: [_legacy_fields(g, "Mumbai") for g in groups], args.runs)
+        labels = _best_of(lambda: classify_spans(spans), args.runs)
+        per_tuple = _best_of(lambda: [classify_fields(g, "Mumbai") for g in groups], args.runs)
+        batched = _best_of(lambda: classify_batch(groups, "Mumbai"), args.runs)
+        print(
+            f"  {n:>5} tuples / {len(spans):>5} spans: legacy {legacy * 1000:7.2f} ms | "
+            f"labels {labels * 1000:7.2f} ms | per-tuple {per_tuple * 1000:7.2f} ms | "
+            f"batched {batched * 1000:7.2f} ms"
+        )
+
+    print("\nLegacy vs compiled rules:")
+    for text in TRICKY_TEXTS:
+        old, new = _legacy_label(text), classify(text)
+        marker = "" if old == new else "  <-- differs"
+        print(f"  {text!r:<28} legacy={old!s:<11} classifier={new!s:<11}{marker}")
+
+
+if __name__ == "__main__":
+    main()
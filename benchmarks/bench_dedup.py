@@ -0,0 +1,122 @@
+"""
+Benchmark the near-duplicate index: insert throughput, lookup cost against
+a brute-force scan, memory per job and repost detection quality.
+
+Generates ``--jobs`` distinct postings (random title / company / city /
+experience / salary combinations) and re-adds ``--repost-share`` of them
+under new job ids with the usual repost noise ("Sr." for "Senior", "Urgent Hiring -" prefixes,
+company suffixes, case and punctuation changes):
+
+    python benchmarks/bench_dedup.py --jobs 200000 --repost-share 0.2
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import CITIES  # noqa: E402
+from dedup import DedupIndex, job_fingerprint  # noqa: E402
+
+LEVELS = ["", "Senior ", "Junior ", "Lead ", "Principal ", "Associate ", "Staff "]
+ROLES = [
+    "Product Manager", "Data Scientist", "Backend Engineer", "Frontend Developer",
+    "DevOps Engineer", "Business Analyst", "QA Engineer", "Android Developer",
+    "iOS Developer", "Data Engineer", "ML Engineer", "Engineering Manager",
+    "UX Designer", "Technical Writer", "Sales Manager", "HR Executive",
+]
+AREAS = ["", " - Payments", " - Growth", " - Platform", " - Search", " - Ads", " - Risk", " - Cloud"]
+
+
+def make_jobs(count, rng):
+    jobs = []
+    for i in range(count):
+        lo = rng.randrange(12)
+        jobs.append(
+            {
+                "title": rng.choice(LEVELS) + rng.choice(ROLES) + rng.choice(AREAS),
+                "company": f"Company {rng.randrange(count // 4 + 1)} Technologies",
+                "location": rng.choice(CITIES),
+                "experience": f"{lo}-{lo + rng.choice((2, 3, 5))} Yrs",
+                "salary": f"{lo * 4 + 3}-{lo * 6 + 8} Lacs PA",
+                "url": f"https://www.naukri.com/job-listings-{i}-{100000000 + i}",
+            }
+        )
+    return jobs
+
+
+def repost(job, i, rng):
+    title = job["title"]
+    if title.startswith("Senior ") and rng.random() < 0.5:
+        title = "Sr. " + title[len("Senior "):]
+    if rng.random() < 0.3:
+        title = "Urgent Hiring - " + title
+    if rng.random() < 0.3:
+        title = title.upper()
+    company = job["company"] + rng.choice(["", " Pvt Ltd", " Private Limited", " Ltd."])
+    return {**job, "title": title, "company": company, "url": f"https://www.naukri.com/repost-{i}-{900000000 + i}"}
+
+
+def index_bytes(index):
+    """Memory held by the index's arrays and band tables."""
+    size = sum(
+        sys.getsizeof(a) for a in (index._fingerprints, index._keys, index._groups)
+    )
+    for table in index._bands:
+        size += sys.getsizeof(table) + sum(sys.getsizeof(bucket) for bucket in table.values())
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=200000)
+    parser.add_argument("--repost-share", type=float, default=0.2)
+    parser.add_argument("--scan-sample", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    originals = make_jobs(args.jobs, rng)
+    picked = rng.sample(range(args.jobs), int(args.jobs * args.repost_share))
+    reposts = [(i, repost(originals[i], n, rng)) for n, i in enumerate(picked)]
+
+    index = DedupIndex()
+    started = time.perf_counter()
+    groups = [index.add(job).group for job in originals]
+    insert_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    detected = 0
+    for i, job in reposts:
+        match = index.add(job)
+        detected += match.near_duplicate and match.group == groups[i]
+    repost_seconds = time.perf_counter() - started
+
+    # Distinct postings that landed in the same group (true duplicates among
+    # the random originals count as false positives here)
+    merged = args.jobs - len(set(groups))
+
+    # Lookup cost: band candidates vs comparing against every fingerprint
+    fingerprints = index._fingerprints
+    sample = [job_fingerprint(job) for _, job in reposts[: args.scan_sample]]
+    started = time.perf_counter()
+    for fp in sample:
+        sum(1 for other in fingerprints if (fp ^ other).bit_count() <= index.max_distance)
+    scan_ms = (time.perf_counter() - started) / max(1, len(sample)) * 1000
+
+    stats = index.stats()
+    print(f"{args.jobs} postings + {len(reposts)} reposts")
+    print(f"  insert          {insert_seconds / args.jobs * 1e6:8.1f} us/job")
+    print(f"  repost lookup   {repost_seconds / max(1, len(reposts)) * 1e6:8.1f} us/job")
+    print(f"  brute-force     {scan_ms * 1000:8.1f} us/lookup")
+    print(f"  candidates      {stats['candidates'] / stats['lookups']:8.1f} per lookup")
+    print(f"  arrays          {stats['array_bytes'] / len(index):8.1f} bytes/job")
+    print(f"  index total     {index_bytes(index) / len(index):8.1f} bytes/job (incl. band tables)")
+    print(f"  reposts found   {detected}/{len(reposts)} ({detected / max(1, len(reposts)):.1%})")
+    print(f"  merged distinct {merged}/{args.jobs} ({merged / args.jobs:.2%})")
+
+
+if __name__ == "__main__":
+    main()
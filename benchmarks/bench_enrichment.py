@@ -0,0 +1,76 @@
+"""
+Benchmark job-detail enrichment: sequential fetching vs the bounded pool,
+and what the detail cache saves on repeat runs.
+
+Serves ``--jobs`` detail pages (with ETags) after ``--latency`` seconds each
+and enriches the jobs of a matching results page:
+
+  sequential   one fetch at a time, empty cache (the old per-job loop)
+  concurrent   ``--workers`` fetches at once, empty cache
+  revalidate   cache warm but stale: conditional requests, 304s
+  fresh        cache warm and fresh: no requests at all
+
+    python benchmarks/bench_enrichment.py --jobs 40 --workers 8 --latency 0.1
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import FixtureServer, job_description_routes, results_page  # noqa: E402
+from enrichment import DetailCache, Enricher  # noqa: E402
+from naukri_scrapper import extract_jobs_from_html  # noqa: E402
+
+
+def run(label, jobs, server, cache_path, workers, fresh_ttl):
+    enricher = Enricher(DetailCache(cache_path), workers=workers, fresh_ttl=fresh_ttl)
+    before = dict(server.served)
+    started = time.perf_counter()
+    enriched = enricher.enrich(jobs)
+    elapsed = time.perf_counter() - started
+    complete = sum(1 for job in enriched if job["description"] and job["skills"])
+    return {
+        "mode": label,
+        "seconds": elapsed,
+        "full": server.served["full"] - before["full"],
+        "not_modified": server.served["not_modified"] - before["not_modified"],
+        "kb": (server.served["bytes"] - before["bytes"]) / 1024,
+        "complete": complete,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, FixtureServer(
+        job_description_routes(args.jobs), latency=args.latency, etags=True
+    ) as server:
+        page = results_page(args.jobs, base_url=server.base_url)
+        jobs = extract_jobs_from_html(page, "Mumbai", args.jobs)
+        warm = os.path.join(tmp, "warm.db")
+        rows = [
+            run("sequential", jobs, server, os.path.join(tmp, "seq.db"), 1, 0),
+            run("concurrent", jobs, server, warm, args.workers, 0),
+            run("revalidate", jobs, server, warm, args.workers, 0),
+            run("fresh", jobs, server, warm, args.workers, 3600),
+        ]
+
+    print(f"{len(jobs)} jobs, {args.workers} workers, {args.latency}s per response")
+    print(f"{'mode':<11} {'seconds':>8} {'200s':>5} {'304s':>5} {'KB':>8} {'complete':>9}")
+    for r in rows:
+        print(
+            f"{r['mode']:<11} {r['seconds']:>8.2f} {r['full']:>5} {r['not_modified']:>5} "
+            f"{r['kb']:>8.1f} {r['complete']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark bulk export formats: file size, export time and read-back time
+for JSON (the ``/jobs`` paging format), CSV, Arrow IPC and Parquet.
+
+Fills a temporary ``JobStore`` with ``--jobs`` synthetic postings and
+exports all of them through ``export.export_jobs``:
+
+    python benchmarks/bench_export.py --jobs 200000
+
+Arrow and Parquet rows are skipped when pyarrow is not installed.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import CITIES  # noqa: E402
+import export  # noqa: E402
+from job_store import JobStore  # noqa: E402
+
+TITLES = ["Product Manager", "Data Scientist", "Backend Engineer", "QA Engineer", "Data Engineer"]
+
+
+def fill_store(store, count, rng):
+    now = time.time()
+    jobs = [
+        {
+            "url": f"https://www.naukri.com/job-listings-{i}",
+            "title": rng.choice(TITLES),
+            "company": f"Company {rng.randrange(count // 20 + 1)}",
+            "experience": f"{rng.randrange(0, 8)}-{rng.randrange(8, 15)} Yrs",
+            "salary": f"{rng.randrange(3, 20)}-{rng.randrange(20, 40)} Lacs PA",
+            "location": rng.choice(CITIES),
+            "platform": "Naukri",
+        }
+        for i in range(count)
+    ]
+    for start in range(0, count, 10000):
+        store.upsert_jobs(jobs[start:start + 10000], seen_at=now - rng.random() * 86400)
+
+
+def export_json(store, batch_size):
+    out = io.BytesIO()
+    for jobs in store.iter_jobs(batch_size):
+        out.write(json.dumps(jobs).encode("utf-8"))
+    return out.getvalue()
+
+
+def read_back(fmt, data):
+    if fmt == "json":
+        return len(json.loads(data))
+    if fmt == "csv":
+        return sum(1 for _ in csv.reader(io.StringIO(data.decode("utf-8")))) - 1
+    if fmt == "arrow":
+        return export.pa.ipc.open_stream(data).read_all().num_rows
+    return export.pq.read_table(export.pa.BufferReader(data)).num_rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    variants = [("json", None), ("csv", None)]
+    if export.pa is not None:
+        variants += [("arrow", None), ("parquet", "snappy"), ("parquet", "zstd")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = JobStore(os.path.join(tmp, "jobs.db"))
+        fill_store(store, args.jobs, random.Random(7))
+
+        rows = []
+        for fmt, compression in variants:
+            started = time.perf_counter()
+            if fmt == "json":
+                # A single page, so the output is one JSON array
+                data = export_json(store, args.jobs)
+            else:
+                out = io.BytesIO()
+                export.export_jobs(
+                    out, fmt, store=store, batch_size=args.batch_size, compression=compression or "zstd"
+                )
+                data = out.getvalue()
+            write_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            count = read_back(fmt, data)
+            read_seconds = time.perf_counter() - started
+            label = f"{fmt}/{compression}" if compression else fmt
+            rows.append((label, len(data), write_seconds, read_seconds, count))
+
+    print(f"{args.jobs} jobs, {args.batch_size} per page")
+    print(f"{'format':<15} {'MB':>8} {'bytes/job':>10} {'export s':>9} {'read s':>7} {'rows':>8}")
+    for label, size, write_seconds, read_seconds, count in rows:
+        print(
+            f"{label:<15} {size / 1e6:>8.2f} {size / args.jobs:>10.1f} "
+            f"{write_seconds:>9.2f} {read_seconds:>7.2f} {count:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark single-pass snapshot extraction against the per-element path.
+
+Without a browser the per-element path is emulated the way it behaves in
+``scrape_naukri_jobs``: every tuple's outerHTML is parsed with its own
+``html.parser`` BeautifulSoup. With ``--chrome`` both real extraction modes
+run against the same page served locally, so WebDriver round trips are
+included in the timings.
+
+    python benchmarks/bench_extraction.py --tuples 20 100 1000
+    python benchmarks/bench_extraction.py --tuples 20 --chrome
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from fixtures import FixtureServer, results_page  # noqa: E402
+from naukri_scrapper import (  # noqa: E402
+    JOB_SELECTORS,
+    _collect_jobs,
+    _element_candidates,
+    extract_jobs_from_html,
+    get_scrape_pool,
+)
+from page_readiness import wait_for_tuples  # noqa: E402
+
+
+def _best_of(fn, runs):
+    best = None
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _outer_html(html):
+    """What ``get_attribute('outerHTML')`` returns for each tuple."""
+    page = BeautifulSoup(html, "html.parser")
+    return [str(e) for e in page.select(JOB_SELECTORS[0])]
+
+
+def _per_element_offline(fragments, max_results):
+    """Old path without the browser: one html.parser soup per tuple."""
+    candidates = (
+        (BeautifulSoup(frag, "html.parser"), lambda: "", lambda: None)
+        for frag in fragments[: max_results * 3]
+    )
+    return _collect_jobs(candidates, "Mumbai", max_results)[0]
+
+
+def bench_offline(sizes, runs):
+    print("Offline parse + extract (best of %d)" % runs)
+    for n in sizes:
+        html = results_page(n)
+        fragments = _outer_html(html)
+        old, old_jobs = _best_of(lambda: _per_element_offline(fragments, n), runs)
+        new, new_jobs = _best_of(lambda: extract_jobs_from_html(html, "Mumbai", n), runs)
+        assert old_jobs == new_jobs, "extraction modes disagree"
+        print(
+            f"  {n:>5} tuples: per-element {old * 1000:8.1f} ms | "
+            f"snapshot {new * 1000:8.1f} ms | speedup {old / new:5.1f}x"
+        )
+
+
+def bench_chrome(sizes, runs):
+    from naukri_scrapper import By
+
+    print("Chrome, page already rendered (best of %d)" % runs)
+    pool = get_scrape_pool()
+    lease = pool.acquire()
+    driver = lease.driver
+    try:
+        for n in sizes:
+            with FixtureServer({"/jobs": results_page(n)}) as server:
+                driver.get(server.base_url + "/jobs")
+                wait_for_tuples(driver, target_count=n)
+
+                def elements():
+                    found = driver.find_elements(By.CSS_SELECTOR, JOB_SELECTORS[0])
+                    found = [e for e in found if "shimmer" not in (e.get_attribute("class") or "")]
+                    return _collect_jobs(_element_candidates(found[: n * 3]), "Mumbai", n)[0]
+
+                def snapshot():
+                    return extract_jobs_from_html(driver.page_source, "Mumbai", n)
+
+                old, _ = _best_of(elements, runs)
+                new, _ = _best_of(snapshot, runs)
+                print(
+                    f"  {n:>5} tuples: elements {old * 1000:8.1f} ms | "
+                    f"snapshot {new * 1000:8.1f} ms | speedup {old / new:5.1f}x"
+                )
+    finally:
+        pool.release(lease)
+        pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tuples", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--chrome", action="store_true")
+    args = parser.parse_args()
+
+    bench_offline(args.tuples, args.runs)
+    if args.chrome:
+        bench_chrome(args.tuples, args.runs)
+
+
+if __name__ == "__main__":
+    main()
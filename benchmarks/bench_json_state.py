@@ -0,0 +1,123 @@
+"""
+Benchmark the embedded-JSON fast path against DOM extraction, and check
+both produce the same jobs.
+
+Fixture pages carry their jobs both as tuples and as JSON (an embedded
+``window._initialState`` holding a search API response, or JSON-LD), so the
+two paths can be compared job by job:
+
+    python benchmarks/bench_json_state.py --tuples 20 100 1000
+
+Saved pages and search API responses can be checked the same way:
+
+    python benchmarks/bench_json_state.py --page saved/results.html
+    python benchmarks/bench_json_state.py --payload saved/search.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import ld_json_results_page, state_results_page  # noqa: E402
+from json_state import jobs_from_api_payload, jobs_from_html  # noqa: E402
+from naukri_scrapper import extract_jobs_from_html  # noqa: E402
+
+# Salary text differs by source ("6-10 Lakhs PA" vs "₹ 600000-1000000 P.A."),
+# so jobs are compared on the parsed values
+COMPARED_KEYS = (
+    "title",
+    "company",
+    "location",
+    "url",
+    "experience_min",
+    "experience_max",
+    "salary_min",
+    "salary_max",
+)
+
+PAGES = {"state": state_results_page, "ld+json": ld_json_results_page}
+
+
+def _best_of(fn, runs):
+    best = None
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _mismatches(dom_jobs, json_jobs):
+    if len(dom_jobs) != len(json_jobs):
+        return [f"count {len(dom_jobs)} (DOM) != {len(json_jobs)} (JSON)"]
+    problems = []
+    for dom, js in zip(dom_jobs, json_jobs):
+        for key in COMPARED_KEYS:
+            if dom.get(key) != js.get(key):
+                problems.append(f"{dom['url']}: {key} {dom.get(key)!r} != {js.get(key)!r}")
+    return problems
+
+
+def compare_page(html, max_results, runs=1):
+    dom_time, dom_jobs = _best_of(
+        lambda: extract_jobs_from_html(html, "Mumbai", max_results, use_json=False), runs
+    )
+    json_time, json_jobs = _best_of(
+        lambda: extract_jobs_from_html(html, "Mumbai", max_results), runs
+    )
+    return dom_time, json_time, _mismatches(dom_jobs, json_jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tuples", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--page", help="saved results page to check instead of fixtures")
+    parser.add_argument("--payload", help="saved search API response (JSON) to decode")
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, encoding="utf-8") as f:
+            jobs = jobs_from_api_payload(json.load(f), "Mumbai")
+        print(f"{args.payload}: {len(jobs or [])} jobs")
+        for job in (jobs or [])[:5]:
+            print(f"  {job['title']} | {job['company']} | {job['location']} | {job['url']}")
+        return
+
+    if args.page:
+        with open(args.page, encoding="utf-8") as f:
+            html = f.read()
+        found = jobs_from_html(html, "Mumbai")
+        print(f"{args.page}: payload {found[1] if found else 'none'}")
+        dom_time, json_time, problems = compare_page(html, 1000)
+        print(f"  DOM {dom_time * 1000:.1f} ms | JSON {json_time * 1000:.1f} ms")
+        for problem in problems[:20]:
+            print(f"  mismatch: {problem}")
+        return
+
+    failed = False
+    print(f"DOM vs embedded JSON extraction (best of {args.runs})")
+    for source, make_page in PAGES.items():
+        for n in args.tuples:
+            html = make_page(n)
+            dom_time, json_time, problems = compare_page(html, n, args.runs)
+            print(
+                f"  {source:<8} {n:>5} jobs: DOM {dom_time * 1000:8.1f} ms | "
+                f"JSON {json_time * 1000:8.1f} ms | speedup {dom_time / json_time:6.1f}x"
+                + (f" | {len(problems)} MISMATCHES" if problems else "")
+            )
+            for problem in problems[:5]:
+                print(f"    {problem}")
+            failed = failed or bool(problems)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
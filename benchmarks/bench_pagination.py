@@ -0,0 +1,48 @@
+"""
+Sequential vs concurrent pagination in ``scrape_naukri_jobs_simple``.
+
+Serves a paginated result set from a local fixture server with artificial
+per-request latency and scrapes it with different worker counts.
+
+    python benchmarks/bench_pagination.py --total 200 --max-results 100 --latency 0.3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import FixtureServer, paginated_routes  # noqa: E402
+from naukri_scrapper import scrape_naukri_jobs_simple  # noqa: E402
+
+PATH = "/product-manager-jobs-in-mumbai"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--total", type=int, default=200)
+    parser.add_argument("--max-results", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    routes = paginated_routes(PATH, args.total)
+    with FixtureServer(routes, latency=args.latency) as server:
+        url = server.base_url + PATH
+        for workers in args.workers:
+            started = time.perf_counter()
+            jobs = scrape_naukri_jobs_simple(url, "Mumbai", args.max_results, workers=workers)
+            elapsed = time.perf_counter() - started
+            ordered = [int(j["url"].rsplit("-", 1)[1]) for j in jobs] == sorted(
+                int(j["url"].rsplit("-", 1)[1]) for j in jobs
+            )
+            print(
+                f"workers={workers}: {len(jobs)} jobs in {elapsed:.2f}s "
+                f"({len(jobs) / elapsed:.0f} jobs/s, ordered={ordered})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compare the old fixed sleeps with ``wait_for_tuples`` on a local page that
+renders its tuples after a configurable delay.
+
+    python benchmarks/bench_readiness.py --delay-ms 800 --count 20
+
+Requires a local Chrome (uses the scraper's driver pool).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import FixtureServer, results_page  # noqa: E402
+from naukri_scrapper import get_scrape_pool  # noqa: E402
+from page_readiness import TUPLE_SELECTOR, wait_for_tuples  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--delay-ms", type=int, default=800)
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    page = results_page(args.count, delay_ms=args.delay_ms)
+    pool = get_scrape_pool()
+    lease = pool.acquire()
+    driver = lease.driver
+    try:
+        with FixtureServer({"/jobs": page}) as server:
+            for run in range(args.runs):
+                driver.get(server.base_url + "/jobs")
+                result = wait_for_tuples(driver, target_count=args.count)
+                rendered = len(driver.find_elements("css selector", TUPLE_SELECTOR))
+                print(
+                    f"run {run}: readiness={result['reason']} waited={result['waited']}s "
+                    f"rendered={rendered}/{args.count} (fixed sleeps would wait >= 8s)"
+                )
+
+                driver.get(server.base_url + "/jobs")
+                started = time.monotonic()
+                time.sleep(5)
+                time.sleep(3)
+                print(f"run {run}: fixed sleeps waited={time.monotonic() - started:.3f}s")
+    finally:
+        pool.release(lease)
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
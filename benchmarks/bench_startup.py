@@ -0,0 +1,121 @@
+"""
+Benchmark import time and cold start of the app with lazily loaded backends.
+
+Every measurement runs in a fresh interpreter (``--runs`` times, median):
+
+  import      ``import app``, and which heavy modules it loaded
+  cold start  process start -> ``import app`` -> first /scrape answered
+              (test client, simple backend, against a local stand-in site)
+
+"eager" pre-imports the modules the app used to load at import time
+(the scraper with requests/BeautifulSoup and the cryptography-backed
+session store, Selenium WebDriver, webdriver-manager, aiohttp, pyarrow)
+to show what lazy loading saves:
+
+    python benchmarks/bench_startup.py --runs 7
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fixtures import FixtureServer, paginated_routes  # noqa: E402
+
+HEAVY_MODULES = (
+    "naukri_scrapper",
+    "bs4",
+    "requests",
+    "cryptography",
+    "selenium.webdriver",
+    "webdriver_manager.chrome",
+    "aiohttp",
+    "pyarrow",
+)
+EAGER_IMPORTS = """import naukri_scrapper, enrichment, session_store
+import selenium.webdriver, webdriver_manager.chrome, aiohttp
+try:
+    import pyarrow.parquet
+except ImportError:
+    pass
+"""
+
+IMPORT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+{eager}import app
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+COLD_START_SCRIPT = """
+{eager}import app
+response = app.app.test_client().post(
+    "/scrape", json={{"keywords": "Product Manager", "location": "Mumbai", "max_results": 20}}
+)
+assert response.status_code == 200 and response.json["count"] == 20, response.json
+"""
+
+
+def run_child(script, env):
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode:
+        raise RuntimeError(result.stderr)
+    return elapsed, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, FixtureServer(
+        paginated_routes("/product-manager-jobs-in-mumbai", 20)
+    ) as site:
+        env = {
+            **os.environ,
+            "NAUKRI_BASE_URL": site.base_url,
+            "JOB_STORE_PATH": os.path.join(tmp, "jobs.db"),
+            "TASK_QUEUE_PATH": os.path.join(tmp, "tasks.db"),
+            "ENRICH_CACHE_PATH": os.path.join(tmp, "details.db"),
+            "DEDUP_INDEX_PATH": "",
+            "STRATEGY_CACHE_PATH": "",
+            "PYTHONDONTWRITEBYTECODE": "1",
+        }
+        rows = []
+        for mode, eager in (("lazy", ""), ("eager", EAGER_IMPORTS)):
+            imports, loaded = [], []
+            for _ in range(args.runs):
+                _, out = run_child(IMPORT_SCRIPT.format(eager=eager, heavy=HEAVY_MODULES), env)
+                report = json.loads(out.strip().splitlines()[-1])
+                imports.append(report["seconds"])
+                loaded = report["loaded"]
+            cold = []
+            for _ in range(args.runs):
+                # A fresh store each run so every first request really scrapes
+                env["JOB_STORE_PATH"] = os.path.join(tmp, f"jobs-{mode}-{len(cold)}.db")
+                cold.append(run_child(COLD_START_SCRIPT.format(eager=eager), env)[0])
+            rows.append((mode, statistics.median(imports), statistics.median(cold), loaded))
+
+    print(f"median of {args.runs} fresh interpreters")
+    print(f"{'mode':<6} {'import app':>11} {'cold start':>11}  heavy modules loaded")
+    for mode, import_seconds, cold_seconds, loaded in rows:
+        print(
+            f"{mode:<6} {import_seconds * 1000:>9.0f}ms {cold_seconds * 1000:>9.0f}ms  "
+            f"{', '.join(loaded) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
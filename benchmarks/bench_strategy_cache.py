@@ -0,0 +1,96 @@
+"""
+Selector probes and field lookups per page with and without the learned
+strategy order (``strategy_cache``).
+
+Runs single-pass DOM extraction over the fixture page and over "drifted"
+copies whose tuples no longer match the first selectors / field strategies,
+and counts the attempts made. In the WebDriver path every selector probe is
+a ``find_elements`` round trip, so the saved probes are also shown as time
+at ``--rtt-ms`` per round trip.
+
+    python benchmarks/bench_strategy_cache.py --tuples 20 --pages 20
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import results_page  # noqa: E402
+import naukri_scrapper as ns  # noqa: E402
+from strategy_cache import get_strategy_cache  # noqa: E402
+
+
+def layouts(count):
+    page = results_page(count)
+    div = page.replace("<article", "<div").replace("</article>", "</div>")
+    no_title_attr = re.sub(r' title="[^"]*"', "", div)
+    no_comp_class = re.sub(r'class="[^"]*comp[^"]*"', 'class="org"', no_title_attr)
+    return {
+        "typical": page,
+        "div tuples": div,
+        "no title attr": no_title_attr,
+        "no comp class": no_comp_class,
+    }
+
+
+def run(html, count, pages, learned):
+    cache = get_strategy_cache()
+    cache.reset()
+    cache.min_samples = 3 if learned else 10**9
+    attempts = {"selector": 0, "fields": 0}
+    record = cache.record
+
+    def counting_record(tally, defaults=None):
+        for (slot, _), tries in tally.tries.items():
+            attempts["selector" if slot == "selector" else "fields"] += tries
+        record(tally, defaults)
+
+    cache.record = counting_record
+    try:
+        # Warm-up pages to learn from (not counted)
+        for _ in range(3):
+            ns.extract_jobs_from_html(html, "Mumbai", count, use_json=False)
+        attempts.update(selector=0, fields=0)
+        started = time.perf_counter()
+        for _ in range(pages):
+            jobs = ns.extract_jobs_from_html(html, "Mumbai", count, use_json=False)
+        elapsed = time.perf_counter() - started
+    finally:
+        cache.record = record
+    return {
+        "probes": attempts["selector"] / pages,
+        "lookups": attempts["fields"] / pages,
+        "ms": elapsed / pages * 1000,
+        "jobs": jobs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tuples", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=5.0, help="WebDriver round trip")
+    args = parser.parse_args()
+
+    print(f"Per page, {args.tuples} tuples, {args.pages} pages after 3 warm-up pages")
+    print(
+        f"{'layout':<15} {'order':<8} {'probes':>7} {'lookups':>8} "
+        f"{'parse ms':>9} {'probe RTT ms':>13} {'same jobs':>10}"
+    )
+    for name, html in layouts(args.tuples).items():
+        default = run(html, args.tuples, args.pages, learned=False)
+        learned = run(html, args.tuples, args.pages, learned=True)
+        for label, r in (("default", default), ("learned", learned)):
+            print(
+                f"{name:<15} {label:<8} {r['probes']:>7.1f} {r['lookups']:>8.1f} "
+                f"{r['ms']:>9.1f} {r['probes'] * args.rtt_ms:>13.1f} "
+                f"{str(r['jobs'] == default['jobs']):>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
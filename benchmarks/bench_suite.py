@@ -0,0 +1,258 @@
+"""
+Offline benchmark suite for the scraping and parsing paths.
+
+Runs every extraction strategy against a corpus of result pages served by a
+local HTTP server and reports, per strategy and page:
+
+  jobs/sec, p50/p95 latency, peak RSS and time spent in the HTML parser
+
+Each (strategy, page) case runs in a fresh subprocess so peak RSS is not
+polluted by earlier cases. The corpus is the synthetic small / typical /
+huge pages from ``fixtures.py`` (plus "state", a typical page that also
+embeds its jobs as JSON); add real saved pages with ``--corpus-dir``
+(every ``*.html`` file in it becomes a page).
+
+    python benchmarks/bench_suite.py --json bench.json
+    python benchmarks/bench_suite.py --compare bench.json   # exit 1 on regression
+
+Strategies:
+  simple        scrape_naukri_jobs_simple over HTTP (fetch + parse)
+  json          embedded JSON fast path, DOM when the page has no payload
+  snapshot      single-pass extract_jobs_from_html on the page source (DOM only)
+  per_element   one html.parser soup per tuple, as the WebDriver element path does
+  bs4_fallback  the link-based BeautifulSoup fallback inside scrape_naukri_jobs
+  selenium      scrape_naukri_jobs page handling in Chrome (only with --chrome)
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixtures import FixtureServer, results_page, state_results_page  # noqa: E402
+
+SYNTHETIC_PAGES = {"small": 5, "typical": 20, "huge": 1200}
+STRATEGIES = ["simple", "json", "snapshot", "per_element", "bs4_fallback"]
+REGRESSION_THRESHOLD = 0.10
+
+
+def load_corpus(corpus_dir=None):
+    corpus = {name: results_page(count) for name, count in SYNTHETIC_PAGES.items()}
+    corpus["state"] = state_results_page(SYNTHETIC_PAGES["typical"])
+    if corpus_dir:
+        for path in sorted(glob.glob(os.path.join(corpus_dir, "*.html"))):
+            with open(path, encoding="utf-8") as f:
+                corpus[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return corpus
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class _ParserTimer:
+    """Wraps BeautifulSoup construction in naukri_scrapper to time parsing."""
+
+    def __init__(self):
+        import naukri_scrapper
+
+        self.module = naukri_scrapper
+        self.original = naukri_scrapper.BeautifulSoup
+        self.seconds = 0.0
+
+    def __enter__(self):
+        original = self.original
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.seconds += time.perf_counter() - started
+
+        self.module.BeautifulSoup = timed
+        return self
+
+    def __exit__(self, *exc):
+        self.module.BeautifulSoup = self.original
+
+
+def _strategy_fn(strategy, html, url, max_results):
+    """A zero-argument callable that runs ``strategy`` once and returns jobs."""
+    import naukri_scrapper as ns
+
+    if strategy == "simple":
+        return lambda: ns.scrape_naukri_jobs_simple(url, "Mumbai", max_results, workers=1, max_pages=1)
+    if strategy == "json":
+        return lambda: ns.extract_jobs_from_html(html, "Mumbai", max_results)
+    if strategy == "snapshot":
+        return lambda: ns.extract_jobs_from_html(html, "Mumbai", max_results, use_json=False)
+    if strategy == "per_element":
+        page = ns.BeautifulSoup(html, "html.parser")
+        fragments = [str(e) for e in page.select(ns.JOB_SELECTORS[0])]
+
+        def per_element():
+            candidates = (
+                (ns.BeautifulSoup(frag, "html.parser"), lambda: "", lambda: None)
+                for frag in fragments[: max_results * 3]
+            )
+            return ns._collect_jobs(candidates, "Mumbai", max_results)[0]
+
+        return per_element
+    if strategy == "bs4_fallback":
+        return lambda: ns._parse_job_links(ns.BeautifulSoup(html, "html.parser"), "Mumbai", max_results)
+    if strategy == "selenium":
+        lease = ns.get_scrape_pool().acquire()
+
+        def selenium():
+            return list(ns._iter_page(lease.driver, url, "Mumbai", max_results, "snapshot"))
+
+        return selenium
+    raise ValueError(f"Unknown strategy {strategy!r}")
+
+
+def _run_case(strategy, html, url, runs, queue):
+    """Child process body: run one case and report its measurements."""
+    try:
+        max_results = max(1, html.count("<article"))
+        fn = _strategy_fn(strategy, html, url, max_results)
+        fn()  # warm-up (imports, connection setup, parser caches)
+
+        latencies = []
+        jobs = 0
+        with _ParserTimer() as parser:
+            for _ in range(runs):
+                started = time.perf_counter()
+                jobs += len(fn())
+                latencies.append(time.perf_counter() - started)
+
+        total = sum(latencies)
+        queue.put(
+            {
+                "jobs_per_run": jobs // runs,
+                "jobs_per_sec": round(jobs / total, 1) if total else None,
+                "p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+                "p95_ms": round(_percentile(latencies, 95) * 1000, 3),
+                "parser_ms": round(parser.seconds / runs * 1000, 3),
+                # ru_maxrss is KiB on Linux
+                "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            }
+        )
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def run_suite(strategies, corpus, runs):
+    ctx = multiprocessing.get_context("spawn")
+    routes = {f"/{name}": html for name, html in corpus.items()}
+    results = []
+    with FixtureServer(routes) as server:
+        for page, html in corpus.items():
+            for strategy in strategies:
+                queue = ctx.Queue()
+                proc = ctx.Process(
+                    target=_run_case,
+                    args=(strategy, html, f"{server.base_url}/{page}", runs, queue),
+                )
+                proc.start()
+                measurement = queue.get()
+                proc.join()
+                results.append({"strategy": strategy, "page": page, **measurement})
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def print_table(results):
+    print(
+        f"{'page':<10} {'strategy':<13} {'jobs':>5} {'jobs/s':>9} {'p50 ms':>9} "
+        f"{'p95 ms':>9} {'parser ms':>10} {'RSS MB':>7}"
+    )
+    for r in results:
+        if "error" in r:
+            print(f"{r['page']:<10} {r['strategy']:<13} ERROR {r['error']}")
+            continue
+        print(
+            f"{r['page']:<10} {r['strategy']:<13} {r['jobs_per_run']:>5} "
+            f"{r['jobs_per_sec']:>9} {r['p50_ms']:>9} {r['p95_ms']:>9} "
+            f"{r['parser_ms']:>10} {r['peak_rss_mb']:>7}"
+        )
+
+
+def compare(results, baseline_path, threshold=REGRESSION_THRESHOLD):
+    """Print p50 deltas against a previous ``--json`` run; return True on regression."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {(r["strategy"], r["page"]): r for r in baseline["results"] if "error" not in r}
+
+    regressed = False
+    print(f"\nCompared with {baseline.get('commit') or baseline_path}:")
+    for r in results:
+        old = previous.get((r["strategy"], r["page"]))
+        if old is None or "error" in r:
+            continue
+        delta = (r["p50_ms"] - old["p50_ms"]) / old["p50_ms"] if old["p50_ms"] else 0.0
+        flag = ""
+        if delta > threshold:
+            flag = "  <-- regression"
+            regressed = True
+        print(f"  {r['page']:<10} {r['strategy']:<13} p50 {old['p50_ms']:>9} -> {r['p50_ms']:>9} ({delta:+.1%}){flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES)
+    parser.add_argument("--chrome", action="store_true", help="also run the selenium strategy")
+    parser.add_argument("--corpus-dir", help="directory of saved result pages (*.html)")
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    parser.add_argument("--compare", help="previous --json output to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    strategies = list(args.strategies)
+    if args.chrome and "selenium" not in strategies:
+        strategies.append("selenium")
+
+    results = run_suite(strategies, load_corpus(args.corpus_dir), args.runs)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "commit": _git_commit(),
+                    "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "runs": args.runs,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\nWrote {args.json}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+Synthetic Naukri pages and a local HTTP server for the benchmark scripts.
+
+The markup mirrors the structure the scrapers look for (``article.cust-job-tuple``
+tuples with a title link, a ``comp-name`` company link and experience /
+salary / location spans) so results are comparable to the live site without
+any network access.
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The local fixture server needs no politeness limit; see rate_limiter.py
+os.environ.setdefault("SCRAPE_RATE", "0")
+# Benchmarks start from empty learned state (strategy order, dedup index)
+# and leave none behind
+os.environ.setdefault("STRATEGY_CACHE_PATH", "")
+os.environ.setdefault("DEDUP_INDEX_PATH", "")
+
+TITLES = [
+    "Senior Product Manager",
+    "Product Manager - Payments",
+    "Associate Product Manager",
+    "Group Product Manager",
+    "Technical Product Manager",
+    "Product Owner",
+]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+CITIES = ["Bangalore", "Mumbai", "Hyderabad", "Pune", "Gurgaon", "Chennai"]
+
+
+def _job_fields(i):
+    title = TITLES[i % len(TITLES)]
+    lo = 2 + i % 8
+    return {
+        "title": title,
+        "company": COMPANIES[(i // len(TITLES)) % len(COMPANIES)],
+        "city": CITIES[i % len(CITIES)],
+        "lo": lo,
+        "slug": title.lower().replace(" ", "-"),
+    }
+
+
+def job_tuple_html(i, base_url="https://www.naukri.com"):
+    """Markup for the ``i``-th job tuple; deterministic for a given ``i``."""
+    fields = _job_fields(i)
+    title, company, city = fields["title"], fields["company"], fields["city"]
+    lo, slug = fields["lo"], fields["slug"]
+    return f"""
+<article class="cust-job-tuple layout-wrapper" data-job-id="{100000 + i}">
+  <div class="jobTupleHeader">
+    <div class="info fleft">
+      <a class="title ellipsis" title="{title}" href="{base_url}/job-listings-{slug}-{100000 + i}">{title}</a>
+      <div class="companyInfo subheading">
+        <a class="comp-name mw-25" title="{company}" href="{base_url}/{company.lower().replace(' ', '-')}-jobs">{company}</a>
+        <span class="star-rating"><span class="main-2">{3 + i % 2}.{i % 10}</span></span>
+      </div>
+    </div>
+  </div>
+  <div class="row3">
+    <span class="exp-wrap"><span class="expwdth">{lo}-{lo + 4} Yrs</span></span>
+    <span class="sal-wrap"><span class="sal">{lo * 3}-{lo * 5} Lakhs PA</span></span>
+    <span class="loc-wrap"><span class="locWdth">{city}</span></span>
+  </div>
+  <div class="row4"><span class="job-desc">Own the roadmap, work with engineering and design.</span></div>
+</article>"""
+
+
+def results_page(count, start=0, delay_ms=None, shimmer=5, base_url="https://www.naukri.com"):
+    """
+    A search results page with ``count`` tuples starting at index ``start``.
+
+    With ``delay_ms`` the page first shows ``shimmer`` placeholder tuples and
+    only renders the real tuples from script after the delay, like the live
+    site does once its search XHR returns.
+    """
+    tuples = "".join(job_tuple_html(i, base_url) for i in range(start, start + count))
+    if delay_ms is None:
+        body = f'<div class="list">{tuples}</div>'
+    else:
+        placeholders = '<article class="cust-job-tuple shimmer"></article>' * shimmer
+        body = f"""
+<div class="list" id="list">{placeholders}</div>
+<script>
+  setTimeout(function () {{
+    document.getElementById("list").innerHTML = {json.dumps(tuples)};
+  }}, {int(delay_ms)});
+</script>"""
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Jobs</title></head>
+<body>
+<header><a href="/">naukri</a></header>
+{body}
+</body></html>"""
+
+
+def search_api_payload(count, start=0):
+    """
+    The search XHR response for ``count`` jobs starting at ``start``: the same
+    jobs ``results_page`` renders, in the API's ``jobDetails`` shape.
+    """
+    details = []
+    for i in range(start, start + count):
+        fields = _job_fields(i)
+        lo = fields["lo"]
+        details.append(
+            {
+                "title": fields["title"],
+                "jobId": str(100000 + i),
+                "companyName": fields["company"],
+                "jdURL": f"/job-listings-{fields['slug']}-{100000 + i}",
+                "placeholders": [
+                    {"type": "experience", "label": f"{lo}-{lo + 4} Yrs"},
+                    {"type": "salary", "label": f"{lo * 3}-{lo * 5} Lakhs PA"},
+                    {"type": "location", "label": fields["city"]},
+                ],
+                "footerPlaceholderLabel": "3 Days Ago",
+                "tagsAndSkills": "Product Management,Roadmap,Agile",
+            }
+        )
+    return {"noOfJobs": 1200, "jobDetails": details}
+
+
+def state_results_page(count, start=0):
+    """``results_page`` that also embeds its jobs as ``window._initialState``."""
+    state = {"searchPage": {"jobsAPI": search_api_payload(count, start)}, "user": {}}
+    script = f"<script>window._initialState = {json.dumps(state)};</script>"
+    return results_page(count, start).replace("</head>", script + "</head>")
+
+
+def ld_json_results_page(count, start=0):
+    """``results_page`` that also carries its jobs as JSON-LD ``JobPosting`` items."""
+    postings = []
+    for i in range(start, start + count):
+        fields = _job_fields(i)
+        lo = fields["lo"]
+        postings.append(
+            {
+                "@type": "ListItem",
+                "position": i + 1,
+                "item": {
+                    "@context": "https://schema.org",
+                    "@type": "JobPosting",
+                    "title": fields["title"],
+                    "url": f"https://www.naukri.com/job-listings-{fields['slug']}-{100000 + i}",
+                    "hiringOrganization": {"@type": "Organization", "name": fields["company"]},
+                    "jobLocation": {
+                        "@type": "Place",
+                        "address": {"@type": "PostalAddress", "addressLocality": fields["city"]},
+                    },
+                    "experienceRequirements": f"{lo}-{lo + 4} Yrs",
+                    "baseSalary": {
+                        "@type": "MonetaryAmount",
+                        "currency": "INR",
+                        "value": {"minValue": lo * 300000, "maxValue": lo * 500000},
+                    },
+                },
+            }
+        )
+    payload = {"@context": "https://schema.org", "@type": "ItemList", "itemListElement": postings}
+    script = f'<script type="application/ld+json">{json.dumps(payload)}</script>'
+    return results_page(count, start).replace("</head>", script + "</head>")
+
+
+def paginated_routes(path, total, per_page=20):
+    """
+    Routes for ``path``, ``path-2``, ``path-3``, ... holding ``total`` jobs.
+    Pages past the end are served with no tuples, like the live site.
+    """
+    pages = max(1, -(-total // per_page))
+    routes = {}
+    for page in range(1, pages + 2):
+        start = (page - 1) * per_page
+        count = max(0, min(per_page, total - start))
+        route = path if page == 1 else f"{path}-{page}"
+        routes[route] = results_page(count, start=start)
+    return routes
+
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><body>
+<form onsubmit="return false;">
+  <input name="username" type="text">
+  <input name="password" type="password">
+  <button type="button" onclick="document.cookie = 'nauk_at=standin; path=/'; location.href = '/home';">Login</button>
+</form>
+</body></html>"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><body>
+<header data-ga-track="Main Navigation"><a href="/">naukri</a></header>
+<div>Welcome back</div>
+</body></html>"""
+
+
+def job_detail_page(i):
+    """A job page whose Apply button reveals a cover-letter box and a confirmation."""
+    title = TITLES[i % len(TITLES)]
+    return f"""<!DOCTYPE html>
+<html><body>
+<header data-ga-track="Main Navigation"><a href="/">naukri</a></header>
+<h1>{title}</h1>
+<div id="apply-area">
+  <button id="apply-button" onclick="
+    var box = document.createElement('textarea');
+    box.name = 'coverLetter';
+    box.placeholder = 'Cover Letter';
+    document.getElementById('apply-area').appendChild(box);
+    setTimeout(function () {{
+      var done = document.createElement('div');
+      done.textContent = 'Application submitted';
+      document.body.appendChild(done);
+    }}, 300);
+  ">Apply</button>
+</div>
+</body></html>"""
+
+
+SKILLS = ["Roadmap", "Agile", "SQL", "Python", "Stakeholder Management", "A/B Testing", "JIRA"]
+
+
+def job_description_page(i, ld_json=True, posted="3 days ago"):
+    """
+    A job detail page with description, key-skill chips and a posted label
+    in the live site's markup; with ``ld_json`` the same data is also in a
+    JSON-LD ``JobPosting``.
+    """
+    fields = _job_fields(i)
+    skills = [SKILLS[(i + k) % len(SKILLS)] for k in range(4)]
+    description = (
+        f"<p>We are hiring a {fields['title']} at {fields['company']}.</p>"
+        "<ul><li>Own the roadmap</li><li>Work with engineering and design</li></ul>"
+    )
+    chips = "".join(f'<a class="styles_chip__7YCfG" href="#"><span>{s}</span></a>' for s in skills)
+    script = ""
+    if ld_json:
+        posting = {
+            "@context": "https://schema.org",
+            "@type": "JobPosting",
+            "title": fields["title"],
+            "description": description,
+            "skills": ", ".join(skills),
+            "datePosted": "2024-05-01",
+            "hiringOrganization": {"@type": "Organization", "name": fields["company"]},
+        }
+        script = f'<script type="application/ld+json">{json.dumps(posting)}</script>'
+    return f"""<!DOCTYPE html>
+<html><head><title>{fields['title']}</title>{script}</head><body>
+<section class="styles_job-header-container__GGpkb">
+  <h1>{fields['title']}</h1>
+  <div class="styles_jhc__jd-stats__KrId0">
+    <span class="styles_jhc__stat__PgY67"><label>Posted:</label><span>{posted}</span></span>
+    <span class="styles_jhc__stat__PgY67"><label>Openings:</label><span>2</span></span>
+  </div>
+</section>
+<section class="styles_job-desc-container__txpYf">
+  <div class="styles_JDC__dang-inner-html__h0K4t">{description}</div>
+  <div class="styles_key-skill__GIPn_"><div>Key Skills</div>{chips}</div>
+</section>
+</body></html>"""
+
+
+def job_description_routes(count, ld_json=True):
+    """``/job-listings-<slug>-<id>`` detail pages matching ``results_page(count)``."""
+    routes = {}
+    for i in range(count):
+        fields = _job_fields(i)
+        routes[f"/job-listings-{fields['slug']}-{100000 + i}"] = job_description_page(i, ld_json)
+    return routes
+
+
+def _slow(body, delay):
+    def route(path):
+        time.sleep(delay)
+        return body
+
+    return route
+
+
+def heavy_page_routes(count=20, images=20, asset_latency=0.05, asset_kb=64):
+    """
+    ``/jobs`` as a results page that also pulls in stylesheets, web fonts,
+    one image per tuple and tracker scripts, each served after
+    ``asset_latency`` seconds, like the live site's page weight.
+    """
+    filler = "/*" + "x" * (asset_kb * 1024) + "*/"
+    head = """
+<link rel="stylesheet" href="/static/app.css">
+<link rel="stylesheet" href="/static/vendor.css">
+<script src="/static/analytics.js"></script>
+<script src="/static/ads.js"></script>"""
+    imgs = "".join(f'<img src="/static/logo-{i}.png" width="40">' for i in range(images))
+    page = results_page(count).replace("</head>", head + "</head>").replace(
+        "</body>", imgs + "</body>"
+    )
+    css = "@font-face { font-family: ui; src: url(/static/ui.woff2); }\nbody { font-family: ui; }\n" + filler
+    routes = {
+        "/jobs": page,
+        "/static/app.css": _slow(css, asset_latency),
+        "/static/vendor.css": _slow(filler, asset_latency),
+        "/static/ui.woff2": _slow(b"\0" * asset_kb * 1024, asset_latency),
+        "/static/analytics.js": _slow("// analytics\n" + filler, asset_latency),
+        "/static/ads.js": _slow("// ads\n" + filler, asset_latency),
+    }
+    for i in range(images):
+        routes[f"/static/logo-{i}.png"] = _slow(b"\x89PNG" + b"\0" * asset_kb * 1024, asset_latency)
+    return routes
+
+
+def standin_site_routes(job_count=10):
+    """Login page, logged-in home page and ``job_count`` job pages."""
+    routes = {"/nlogin/login": LOGIN_PAGE, "/home": HOME_PAGE}
+    for i in range(job_count):
+        routes[f"/job-listings-standin-{i}"] = job_detail_page(i)
+    return routes
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        route = self.server.routes.get(self.path.split("?")[0])
+        if route is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = route(self.path) if callable(route) else route
+        if isinstance(body, int):
+            self.send_response(body)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        etag = None
+        if self.server.etags:
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.server.served["not_modified"] += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+        self.server.served["full"] += 1
+        self.server.served["bytes"] += len(body)
+        content_type = mimetypes.guess_type(self.path.split("?")[0])[0] or "text/html"
+        if content_type.startswith("text/") or content_type.endswith("javascript"):
+            content_type += "; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    Serve ``routes`` (path -> html string, status code or ``callable(path)``)
+    on localhost, optionally sleeping ``latency`` seconds before each response. With
+    ``etags`` responses carry an ETag and matching If-None-Match requests
+    get a 304. ``served`` counts full responses, 304s and body bytes.
+
+        with FixtureServer({"/jobs": results_page(20)}) as server:
+            requests.get(server.base_url + "/jobs")
+    """
+
+    def __init__(self, routes=None, handler=_Handler, latency=0.0, etags=False):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.etags = etags
+        self.httpd.served = self.served = {"full": 0, "not_modified": 0, "bytes": 0}
+        self.httpd.routes = dict(routes or {})
+        self.routes = self.httpd.routes
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,212 @@
+"""
+Load test for the production server mode against a local stand-in site.
+
+Serves search results pages from a ``FixtureServer`` (``--latency`` seconds
+per response), starts the app under gunicorn (or the Flask dev server with
+``--server dev``) pointed at it through ``NAUKRI_BASE_URL``, and fires
+``--requests`` distinct /scrape calls from ``--concurrency`` clients:
+
+    python benchmarks/load_test.py --requests 200 --concurrency 48 --workers 2
+
+Reports status codes, latency of served vs shed requests, Retry-After
+headers and the admission / browser budget counters. It then starts a few
+more scrapes, sends SIGTERM mid-flight and checks that they still complete
+and that the server exits within the drain window.
+
+Without Chrome every scrape takes the simple (requests) backend, so the
+browser budget is only exercised on a machine with Chrome installed.
+"""
+
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fixtures import FixtureServer, paginated_routes  # noqa: E402
+
+LOCATION = "Mumbai"
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def keywords(i):
+    return f"Role {i}"
+
+
+def site_routes(queries, per_query):
+    routes = {}
+    for i in range(queries):
+        path = f"/{keywords(i).lower().replace(' ', '-')}-jobs-in-{LOCATION.lower()}"
+        routes.update(paginated_routes(path, per_query))
+    return routes
+
+
+def start_server(args, base_url, tmp, port):
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "NAUKRI_BASE_URL": base_url,
+        "WEB_CONCURRENCY": str(args.workers),
+        "WEB_THREADS": str(args.threads),
+        "ADMISSION_MAX_IN_FLIGHT": str(args.max_in_flight),
+        "ADMISSION_MAX_WAITING": str(args.max_waiting),
+        "ADMISSION_WAIT_TIMEOUT": str(args.wait_timeout),
+        "SHUTDOWN_TIMEOUT": str(args.shutdown_timeout),
+        "BROWSER_BUDGET_DIR": os.path.join(tmp, "budget"),
+        "DRIVER_POOL_WARM": "0",
+        "JOB_STORE_PATH": os.path.join(tmp, "jobs.db"),
+        "TASK_QUEUE_PATH": os.path.join(tmp, "tasks.db"),
+        "ENRICH_CACHE_PATH": os.path.join(tmp, "details.db"),
+        "DEDUP_INDEX_PATH": "",
+        "STRATEGY_CACHE_PATH": "",
+        "METRICS_SYNC_INTERVAL": "0.5",
+    }
+    if args.server == "gunicorn":
+        cmd = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app:app"]
+        cmd[-1:-1] = ["--access-logfile", os.devnull]
+    else:
+        cmd = [sys.executable, "app.py"]
+    log = open(os.path.join(tmp, "server.log"), "wb")
+    process = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            requests.get(url + "/health", timeout=5)
+            return process, url
+        except requests.RequestException:
+            if process.poll() is not None:
+                break
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"Server did not start, see {log.name}")
+
+
+def scrape(url, i, max_results):
+    started = time.perf_counter()
+    try:
+        response = requests.post(
+            url + "/scrape",
+            json={"keywords": keywords(i), "location": LOCATION, "max_results": max_results},
+            timeout=300,
+        )
+        status, retry_after = response.status_code, response.headers.get("Retry-After")
+        count = response.json().get("count", 0) if status == 200 else 0
+    except requests.RequestException:
+        status, retry_after, count = "error", None, 0
+    return status, time.perf_counter() - started, retry_after, count
+
+
+def percentile(values, p):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def gauges(url, prefixes, machine_wide=("naukri_browser_budget",)):
+    """
+    Collector gauges over the server's workers (one ``pid`` label each):
+    summed, except ``machine_wide`` ones that every worker reports in full.
+    """
+    values = Counter()
+    for line in requests.get(url + "/metrics", timeout=10).text.splitlines():
+        for prefix in prefixes:
+            if line.startswith(prefix + "{"):
+                key = line.split('key="', 1)[1].split('"', 1)[0]
+                name, value = f"{prefix}.{key}", float(line.rsplit(" ", 1)[1])
+                if prefix in machine_wide:
+                    values[name] = max(values[name], value)
+                else:
+                    values[name] += value
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server", choices=("gunicorn", "dev"), default="gunicorn")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=48)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--max-in-flight", type=int, default=4)
+    parser.add_argument("--max-waiting", type=int, default=4)
+    parser.add_argument("--wait-timeout", type=float, default=2)
+    parser.add_argument("--shutdown-timeout", type=float, default=20)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--max-results", type=int, default=20)
+    parser.add_argument("--drain-requests", type=int, default=4)
+    args = parser.parse_args()
+
+    total = args.requests + args.drain_requests
+    with tempfile.TemporaryDirectory() as tmp, FixtureServer(
+        site_routes(total, args.max_results), latency=args.latency
+    ) as site:
+        process, url = start_server(args, site.base_url, tmp, free_port())
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(args.concurrency) as pool:
+                results = list(
+                    pool.map(lambda i: scrape(url, i, args.max_results), range(args.requests))
+                )
+            elapsed = time.perf_counter() - started
+            time.sleep(1)  # let every worker publish its metrics snapshot
+            counters = gauges(url, ("naukri_admission", "naukri_browser_budget"))
+
+            # Graceful drain: SIGTERM while scrapes are in flight
+            with ThreadPoolExecutor(args.drain_requests) as pool:
+                futures = [
+                    pool.submit(scrape, url, args.requests + i, args.max_results)
+                    for i in range(args.drain_requests)
+                ]
+                time.sleep(args.latency / 2)
+                process.send_signal(signal.SIGTERM)
+                stopping = time.perf_counter()
+                drained = [f.result() for f in futures]
+            exit_code = process.wait(args.shutdown_timeout + 30)
+            stop_seconds = time.perf_counter() - stopping
+        finally:
+            if process.poll() is None:
+                process.kill()
+
+    statuses = Counter(status for status, _, _, _ in results)
+    served = [seconds for status, seconds, _, _ in results if status == 200]
+    shed = [seconds for status, seconds, _, _ in results if status in (429, 503)]
+    retry_after = sum(1 for status, _, header, _ in results if status in (429, 503) and header)
+
+    print(
+        f"{args.requests} /scrape calls, {args.concurrency} clients, server={args.server} "
+        f"workers={args.workers} in_flight<={args.max_in_flight}/worker, site latency {args.latency}s"
+    )
+    print(f"  statuses        {dict(statuses)}")
+    print(f"  throughput      {statuses[200] / elapsed:.1f} served/s over {elapsed:.1f}s")
+    print(f"  served latency  p50 {percentile(served, 50):.2f}s  p95 {percentile(served, 95):.2f}s")
+    print(f"  shed latency    p50 {percentile(shed, 50):.2f}s  p95 {percentile(shed, 95):.2f}s")
+    print(f"  Retry-After     {retry_after}/{len(shed)} shed responses")
+    print(f"  jobs returned   {sum(count for _, _, _, count in results)}")
+    for key, value in sorted(counters.items()):
+        print(f"  {key:<40} {value:g}")
+    drained_ok = sum(1 for status, _, _, _ in drained if status == 200)
+    print(
+        f"  drain           {drained_ok}/{len(drained)} in-flight scrapes completed after SIGTERM, "
+        f"exit code {exit_code} after {stop_seconds:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
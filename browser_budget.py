@@ -0,0 +1,170 @@
+"""
+Machine-wide cap on live Chrome browsers, shared by every server worker.
+
+Each driver pool caps its own browsers, but a multi-worker server has one
+set of pools per process, so a burst could still start workers x pools x
+size Chromes and exhaust memory. The budget is ``slots`` lock files in a
+shared directory: a browser holds an exclusive ``flock`` on one slot file
+for as long as it is alive. Locks belong to the process, so a worker that
+crashes gives its slots back without any cleanup.
+
+    slot = get_browser_budget().acquire(timeout=10)   # BrowserBudgetExhausted
+    ...
+    get_browser_budget().release(slot)
+
+Idle pooled drivers keep their slot, so keep ``BROWSER_BUDGET_SLOTS`` at
+least workers x ``DRIVER_POOL_WARM``.
+
+Configuration (environment variables):
+  BROWSER_BUDGET_SLOTS    max live browsers on this machine, 0 disables (default 4)
+  BROWSER_BUDGET_DIR      directory for the slot lock files (default <tmp>/naukri-browser-budget)
+  BROWSER_BUDGET_TIMEOUT  seconds to wait for a free slot before giving up (default 10)
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: slots are only shared within one process
+    fcntl = None
+
+
+class BrowserBudgetExhausted(Exception):
+    """Raised when every browser slot stayed taken for the whole timeout."""
+
+
+class BudgetSlot:
+    __slots__ = ("index", "fd")
+
+    def __init__(self, index, fd):
+        self.index = index
+        self.fd = fd
+
+
+class BrowserBudget:
+    def __init__(self, slots=4, lock_dir=None, timeout=10.0, poll_interval=0.05):
+        self.slots = max(0, int(slots))
+        self.lock_dir = lock_dir or os.path.join(tempfile.gettempdir(), "naukri-browser-budget")
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._taken = set()  # slot indexes held by this process (no fcntl)
+        self._held = 0
+        self._stats = {"acquired": 0, "waited": 0, "exhausted": 0, "wait_seconds": 0.0}
+        if self.slots and fcntl is not None:
+            os.makedirs(self.lock_dir, exist_ok=True)
+
+    @property
+    def enabled(self):
+        return self.slots > 0
+
+    def _try_slot(self, index):
+        if fcntl is None:
+            if index in self._taken:
+                return None
+            self._taken.add(index)
+            return BudgetSlot(index, None)
+        fd = os.open(os.path.join(self.lock_dir, f"slot-{index}.lock"), os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return None
+        return BudgetSlot(index, fd)
+
+    def try_acquire(self):
+        """A free slot, or None when all are taken. Always succeeds when disabled."""
+        if not self.enabled:
+            return BudgetSlot(-1, None)
+        # Start at a per-process offset so workers do not all contend for slot 0
+        offset = os.getpid() % self.slots
+        with self._lock:
+            for i in range(self.slots):
+                slot = self._try_slot((offset + i) % self.slots)
+                if slot is not None:
+                    self._held += 1
+                    self._stats["acquired"] += 1
+                    return slot
+        return None
+
+    def acquire(self, timeout=None):
+        """Wait up to ``timeout`` seconds for a slot; raises ``BrowserBudgetExhausted``."""
+        timeout = self.timeout if timeout is None else timeout
+        slot = self.try_acquire()
+        if slot is not None:
+            return slot
+        started = time.monotonic()
+        while slot is None and time.monotonic() - started < timeout:
+            time.sleep(self.poll_interval)
+            slot = self.try_acquire()
+        waited = time.monotonic() - started
+        with self._lock:
+            self._stats["waited"] += 1
+            self._stats["wait_seconds"] += waited
+            if slot is None:
+                self._stats["exhausted"] += 1
+        if slot is None:
+            raise BrowserBudgetExhausted(
+                f"All {self.slots} browser slots are in use (waited {waited:.1f}s)"
+            )
+        return slot
+
+    def release(self, slot):
+        if slot is None or slot.index < 0:
+            return
+        with self._lock:
+            self._held -= 1
+            if slot.fd is None:
+                self._taken.discard(slot.index)
+                return
+        fcntl.flock(slot.fd, fcntl.LOCK_UN)
+        os.close(slot.fd)
+
+    def available(self):
+        """Free slots right now, across all processes (a racy snapshot)."""
+        if not self.enabled:
+            return 0
+        free = 0
+        with self._lock:
+            for i in range(self.slots):
+                slot = self._try_slot(i)
+                if slot is None:
+                    continue
+                free += 1
+                if slot.fd is None:
+                    self._taken.discard(i)
+                else:
+                    fcntl.flock(slot.fd, fcntl.LOCK_UN)
+                    os.close(slot.fd)
+        return free
+
+    def stats(self):
+        available = self.available()
+        with self._lock:
+            return {
+                "slots": self.slots,
+                "held": self._held,
+                "available": available,
+                **self._stats,
+            }
+
+
+_default_budget = None
+_default_lock = threading.Lock()
+
+
+def get_browser_budget():
+    """The process-wide budget, configured from the environment on first use."""
+    global _default_budget
+    with _default_lock:
+        if _default_budget is None:
+            _default_budget = BrowserBudget(
+                slots=int(os.getenv("BROWSER_BUDGET_SLOTS", 4)),
+                lock_dir=os.getenv("BROWSER_BUDGET_DIR") or None,
+                timeout=float(os.getenv("BROWSER_BUDGET_TIMEOUT", 10)),
+            )
+        return _default_budget
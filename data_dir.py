@@ -0,0 +1,58 @@
+"""
+Where the app keeps its local state: the job store, task queue, detail and
+strategy caches, dedup index and saved login sessions.
+
+Every state file defaults to a fixed name inside one directory, so nothing
+is written to the working directory and a deployment only has to mount (or
+back up) that directory. Each file's own variable (``JOB_STORE_PATH`` etc.)
+still overrides its location.
+
+    path = state_path("JOB_STORE_PATH", "jobs.db")
+
+Stores that several processes (gunicorn workers) rewrite whole hold
+``state_lock(path)`` while they merge with the file on disk and replace it,
+so one worker's write does not drop another's entries.
+
+Configuration (environment variables):
+  NAUKRI_DATA_DIR  directory for state files, created on first use (default ".naukri_data")
+"""
+
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes are only serialised within one process
+    fcntl = None
+
+
+def data_dir():
+    """The state directory, created if it does not exist yet."""
+    path = os.getenv("NAUKRI_DATA_DIR", ".naukri_data")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def state_path(env_var, name):
+    """
+    ``env_var`` when it is set (an empty value is passed through; some
+    stores read it as "persistence off"), else ``name`` in ``data_dir()``.
+    """
+    configured = os.getenv(env_var)
+    if configured is not None:
+        return configured
+    return os.path.join(data_dir(), name)
+
+
+@contextmanager
+def state_lock(path):
+    """Hold an exclusive lock on ``path`` (via ``<path>.lock``) across processes."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
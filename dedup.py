@@ -0,0 +1,415 @@
+"""
+Near-duplicate job detection across every scrape.
+
+The same posting turns up under many keyword/city searches and as reposts
+with new URLs ("Sr. Product Manager - Acme Pvt Ltd" vs "Senior Product
+Manager | ACME"). Each job is reduced to a 64-bit weighted SimHash of its
+normalised title, company, location, experience, salary and (when present)
+the start of its description, and two jobs are near-duplicates when their
+fingerprints differ in at most ``max_distance`` bits. Normalising folds the
+usual repost noise ("Sr." for "Senior", "Urgent Hiring -" prefixes, legal
+suffixes such as "Pvt Ltd", the company repeated in the title, case and
+punctuation), so a plain repost hashes exactly like the original. The job
+id is not part of the fingerprint: a repost always has a new one.
+
+Near-duplicate detection only annotates: similar-looking postings at one
+company are often genuinely different jobs, so nothing is ever dropped for
+being "close". Only an exact repeat of a job (same Naukri job id, or the
+same URL when it has none) is removed.
+
+Fingerprints, job id hashes and group ids live in fixed-width ``array``s
+(8 + 8 + 4 bytes per job) plus four 16-bit LSH band tables (4 x 4 bytes per
+job). By pigeonhole, fingerprints within 3 bits agree exactly on at least
+one band, so a lookup only compares against the jobs sharing a band value
+instead of scanning the index. No strings are kept, so memory stays around
+36 bytes per job however many are indexed.
+
+A job's group is the first job seen with a matching fingerprint. Its id
+(``dup_group``) is the hex hash of that first job's identity, so it is
+stable across restarts and processes. ``DedupSession`` is the per-scrape
+view: it drops exact repeats already returned by the same call and marks
+every job with ``dup_group`` and ``near_duplicate`` (the group was first
+seen as another job).
+
+Several processes (gunicorn workers) can share one index file: ``flush``
+merges the entries saved there by others before replacing it.
+
+Configuration (environment variables):
+  DEDUP_INDEX_PATH    index file; persistence is off when empty
+                      (default dedup_index.bin in NAUKRI_DATA_DIR, see ``data_dir``)
+  DEDUP_MAX_DISTANCE  max differing fingerprint bits for a near-duplicate, 0-3 (default 2)
+"""
+
+import atexit
+import hashlib
+import os
+import re
+import struct
+import threading
+import time
+from array import array
+from functools import lru_cache
+
+from data_dir import state_lock, state_path
+
+BANDS = 4
+BAND_BITS = 64 // BANDS
+_BAND_MASK = (1 << BAND_BITS) - 1
+_MAGIC = b"NKDEDUP2"
+DESCRIPTION_WORDS = 32
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+# Naukri job URLs end in the posting's numeric id: ...-3-to-5-years-120325001234
+_JOB_ID_RE = re.compile(r"-(\d{6,})(?:[/?#]|$)")
+# Legal-form suffixes, dropped from company names and from titles that
+# carry the company ("Sr. Product Manager - Acme Pvt Ltd")
+_LEGAL_SUFFIXES = frozenset("pvt private ltd limited llp inc incorporated".split())
+_TITLE_NOISE = _LEGAL_SUFFIXES | frozenset(
+    "urgent urgently hiring opening openings immediate immediately joiner joiners "
+    "required requirement wanted vacancy job for the a an and of in at with".split()
+)
+_TITLE_SYNONYMS = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "mgr": "manager",
+    "engg": "engineering",
+    "dev": "developer",
+    "asst": "assistant",
+    "exec": "executive",
+}
+_COMPANY_NOISE = _LEGAL_SUFFIXES | frozenset("corp corporation co company the".split())
+# Votes each feature kind casts in the SimHash: the title and company say
+# which job it is; location, experience and salary separate openings for
+# the same role; description words only nudge the fingerprint.
+FEATURE_WEIGHTS = {"t": 3, "c": 8, "l": 2, "e": 2, "s": 1, "d": 1}
+
+
+def _words(text):
+    return _WORD_RE.findall((text or "").lower().replace(".", " "))
+
+
+def normalize(title, company, location):
+    """``(title_words, company_words, location_words)`` with noise dropped."""
+    company_words = tuple(w for w in _words(company) if w not in _COMPANY_NOISE)
+    # Reposts often append the company to the title
+    title_words = tuple(
+        _TITLE_SYNONYMS.get(w, w)
+        for w in _words(title)
+        if w not in _TITLE_NOISE and w not in company_words
+    )
+    location_words = tuple(sorted(set(_words(location))))
+    return title_words, company_words, location_words
+
+
+# SimHash counts, for each of the 64 bit positions, the weight of the
+# features that have that bit set. Each feature hash is widened to one byte
+# per bit so that adding the widened ints (times their weights) counts all
+# 64 positions at once; the total weight must stay below 128 per lane.
+_MAX_WEIGHT = 127
+_LANES = bytes.maketrans(b"01", b"\x00\x01")
+_LANE_ONES = int.from_bytes(b"\x01" * 64, "big")
+_LANE_HIGH_BITS = int.from_bytes(b"\x80" * 64, "big")
+_LANE_TO_BIT = bytes.maketrans(b"\x00\x80", b"01")
+
+
+@lru_cache(maxsize=1 << 16)
+def _feature_lanes(feature):
+    """The feature's 64-bit hash with every bit widened to its own byte."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    bits = format(int.from_bytes(digest, "big"), "064b").encode("ascii")
+    return int.from_bytes(bits.translate(_LANES), "big")
+
+
+def job_id(url):
+    """The numeric Naukri job id at the end of ``url``, or None."""
+    match = _JOB_ID_RE.search(url or "")
+    return match.group(1) if match else None
+
+
+def job_key(job):
+    """A job's exact identity: its Naukri job id, else its URL."""
+    url = job.get("url") or ""
+    return job_id(url) or url
+
+
+def _range_key(text):
+    return "-".join(_NUMBER_RE.findall(text or ""))
+
+
+def _features(job):
+    """The job's SimHash features, most important first."""
+    title_words, company_words, location_words = normalize(
+        job.get("title"), job.get("company"), job.get("location")
+    )
+    features = ["c:" + " ".join(company_words)]
+    features += [f"t:{w}" for w in title_words]
+    features += [f"t:{a} {b}" for a, b in zip(title_words, title_words[1:])]
+    features += [f"l:{w}" for w in location_words]
+    features.append("e:" + _range_key(job.get("experience")))
+    features.append("s:" + _range_key(job.get("salary")))
+    description = _words(job.get("description"))[:DESCRIPTION_WORDS]
+    features += [f"d:{a} {b}" for a, b in zip(description, description[1:])]
+    return features
+
+
+def simhash(job):
+    """64-bit weighted SimHash of a job's normalised fields (see ``_features``)."""
+    counts = total = 0
+    for feature in _features(job):
+        weight = FEATURE_WEIGHTS[feature[0]]
+        if total + weight > _MAX_WEIGHT:
+            break
+        counts += _feature_lanes(feature) * weight
+        total += weight
+    # A bit is set when features with more than half the weight set it.
+    # Biasing every lane by (128 - threshold) moves that decision into the
+    # lane's top bit.
+    threshold = total // 2 + 1
+    counts += (128 - threshold) * _LANE_ONES
+    bits = (counts & _LANE_HIGH_BITS).to_bytes(64, "big").translate(_LANE_TO_BIT)
+    return int(bits, 2)
+
+
+def job_fingerprint(job):
+    return simhash(job)
+
+
+def key_hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class Match:
+    """Where a job landed in the index."""
+
+    __slots__ = ("group", "near_duplicate", "new")
+
+    def __init__(self, group, near_duplicate, new):
+        self.group = group  # stable id of the job's duplicate group
+        self.near_duplicate = near_duplicate  # group was first seen as another job
+        self.new = new  # the job was not in the index before
+
+
+class DedupIndex:
+    def __init__(self, path=None, max_distance=2, persist_interval=30.0):
+        if not 0 <= max_distance < BANDS:
+            raise ValueError(f"max_distance must be between 0 and {BANDS - 1}")
+        self.path = path
+        self.max_distance = max_distance
+        self.persist_interval = persist_interval
+
+        self._fingerprints = array("Q")
+        self._keys = array("Q")  # key_hash of each entry's job_key
+        self._groups = array("I")  # index of each entry's group leader
+        self._bands = [{} for _ in range(BANDS)]  # band value -> array("I") of entries
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_persist = 0.0
+        self._stats = {
+            "lookups": 0,
+            "candidates": 0,
+            "groups": 0,
+            "near_duplicates": 0,
+            "dropped": 0,
+        }
+
+        if self.path:
+            self._load()
+            atexit.register(self.flush)
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    def _band_keys(self, fingerprint):
+        return [(fingerprint >> (band * BAND_BITS)) & _BAND_MASK for band in range(BANDS)]
+
+    def _append(self, fingerprint, key, group):
+        index = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        self._keys.append(key)
+        self._groups.append(group)
+        for table, key in zip(self._bands, self._band_keys(fingerprint)):
+            bucket = table.get(key)
+            if bucket is None:
+                table[key] = bucket = array("I")
+            bucket.append(index)
+        return index
+
+    def add(self, job):
+        """Index ``job`` (if it is new) and return its ``Match``."""
+        fingerprint = job_fingerprint(job)
+        identity = key_hash(job_key(job))
+        with self._lock:
+            self._stats["lookups"] += 1
+            leader = None
+            seen = set()
+            for table, key in zip(self._bands, self._band_keys(fingerprint)):
+                for i in table.get(key, ()):
+                    if i in seen:
+                        continue
+                    seen.add(i)
+                    if (fingerprint ^ self._fingerprints[i]).bit_count() > self.max_distance:
+                        continue
+                    if self._keys[i] == identity:
+                        return self._match(self._groups[i], identity, new=False)
+                    if leader is None or self._groups[i] < leader:
+                        leader = self._groups[i]
+            self._stats["candidates"] += len(seen)
+            index = self._append(fingerprint, identity, 0 if leader is None else leader)
+            if leader is None:
+                self._groups[index] = leader = index
+                self._stats["groups"] += 1
+            else:
+                self._stats["near_duplicates"] += 1
+            self._dirty = True
+            match = self._match(leader, identity, new=True)
+        self._maybe_persist()
+        return match
+
+    def _match(self, leader, identity, new):
+        leader_key = self._keys[leader]
+        return Match(f"{leader_key:016x}", leader_key != identity, new)
+
+    def session(self):
+        return DedupSession(self)
+
+    def record_dropped(self):
+        with self._lock:
+            self._stats["dropped"] += 1
+
+    def stats(self):
+        with self._lock:
+            entries = len(self._fingerprints)
+            return {
+                **self._stats,
+                "entries": entries,
+                "buckets": sum(len(table) for table in self._bands),
+                "array_bytes": entries * (8 + 8 + 4 + 4 * BANDS),
+                "max_distance": self.max_distance,
+            }
+
+    # ------------------------------------------------------------------ #
+    # Persistence
+    # ------------------------------------------------------------------ #
+    def _read(self):
+        """``(fingerprints, keys, groups)`` arrays saved at ``path``, or None."""
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    return None
+                (count,) = struct.unpack("<Q", f.read(8))
+                fingerprints, keys, groups = array("Q"), array("Q"), array("I")
+                fingerprints.fromfile(f, count)
+                keys.fromfile(f, count)
+                groups.fromfile(f, count)
+        except OSError:
+            return None
+        except (EOFError, struct.error) as e:
+            print(f"[Dedup] Ignoring truncated index {self.path}: {e}")
+            return None
+        return fingerprints, keys, groups
+
+    def _merge(self, saved):
+        """
+        Add the saved entries whose jobs are not indexed yet, keeping their
+        groups (a saved group index is mapped to where its leader ended up).
+        Call with ``_lock`` held.
+        """
+        fingerprints, keys, groups = saved
+        indexed = {key: i for i, key in enumerate(self._keys)}
+        placed = []  # saved index -> index here
+        for i, (fingerprint, key, group) in enumerate(zip(fingerprints, keys, groups)):
+            index = indexed.get(key)
+            if index is None:
+                # Leaders precede their members, so ``group`` is already placed
+                leader = placed[group] if group < i else len(self._fingerprints)
+                index = self._append(fingerprint, key, leader)
+                indexed[key] = index
+                if index == leader:
+                    self._stats["groups"] += 1
+            placed.append(index)
+
+    def _load(self):
+        saved = self._read()
+        if saved is None:
+            return
+        self._last_persist = time.time()
+        self._merge(saved)
+
+    def _maybe_persist(self):
+        if self.path and time.time() - self._last_persist >= self.persist_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the index to ``path`` (atomically) if it changed. Entries other
+        processes saved there in the meantime are merged in first, under
+        ``state_lock``, so concurrent workers do not overwrite each other.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+        try:
+            with state_lock(self.path):
+                saved = self._read()
+                with self._lock:
+                    if saved is not None:
+                        self._merge(saved)
+                    count = len(self._fingerprints)
+                    data = [
+                        _MAGIC,
+                        struct.pack("<Q", count),
+                        self._fingerprints.tobytes(),
+                        self._keys.tobytes(),
+                        self._groups.tobytes(),
+                    ]
+                    self._dirty = False
+                    self._last_persist = time.time()
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.writelines(data)
+                os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[Dedup] Could not persist index to {self.path}: {e}")
+
+
+class DedupSession:
+    """
+    One scrape's view of the index: ``accept(job)`` returns False for an
+    exact repeat (same ``job_key``) this session already returned, and
+    otherwise annotates the job with ``dup_group`` and ``near_duplicate``.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self._keys = set()
+
+    def accept(self, job):
+        key = job_key(job)
+        if key in self._keys:
+            self.index.record_dropped()
+            return False
+        self._keys.add(key)
+        match = self.index.add(job)
+        job["dup_group"] = match.group
+        job["near_duplicate"] = match.near_duplicate
+        return True
+
+
+_default_index = None
+_default_lock = threading.Lock()
+
+
+def get_dedup_index():
+    """The process-wide index, configured from the environment on first use."""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = DedupIndex(
+                path=state_path("DEDUP_INDEX_PATH", "dedup_index.bin") or None,
+                max_distance=int(os.getenv("DEDUP_MAX_DISTANCE", 2)),
+            )
+        return _default_index
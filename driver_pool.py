@@ -0,0 +1,316 @@
+"""
+Pool of pre-warmed Chrome WebDriver instances shared across requests.
+
+Starting Chrome costs several seconds (chromedriver itself is resolved once
+per process by ``backends.chromedriver_path``), so instead of launching a
+browser per call the scraper and apply helpers check a driver out of a
+named pool and hand it back when they are done. The pool caps the
+number of live browsers, health-checks idle drivers before handing them out
+and recycles a driver after a configurable number of uses or when it crashes.
+Every live driver also holds a slot of the machine-wide ``browser_budget``,
+so several server workers together stay under one browser limit.
+
+Configuration (environment variables):
+  DRIVER_POOL_SIZE              max live drivers per pool (default 2)
+  DRIVER_POOL_WARM              drivers to start ahead of time (default 1)
+  DRIVER_POOL_MAX_USES          recycle a driver after this many checkouts (default 50)
+  DRIVER_POOL_CHECKOUT_TIMEOUT  seconds to wait for a free driver (default 60)
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+from backends import chromedriver_path
+from browser_budget import BrowserBudgetExhausted, get_browser_budget
+from metrics import SCRAPE_PHASE_SECONDS, timed
+
+
+class DriverPoolTimeout(Exception):
+    """Raised when no driver could be checked out within the timeout."""
+
+
+class DriverLease:
+    """A driver checked out of a pool. Set ``broken`` to force a recycle."""
+
+    def __init__(self, driver, created_at, slot=None):
+        self.driver = driver
+        self.created_at = created_at
+        self.slot = slot
+        self.uses = 0
+        self.broken = False
+
+
+class DriverPool:
+    """
+    Bounded pool of Chrome drivers built from ``options_factory()``.
+    ``setup(driver)``, when given, runs once on every new driver (e.g. to
+    send DevTools commands that options cannot express). ``budget`` is
+    the ``BrowserBudget`` every new driver must get a slot from.
+    """
+
+    def __init__(
+        self,
+        name,
+        options_factory,
+        size=2,
+        max_uses=50,
+        checkout_timeout=60,
+        debug=False,
+        setup=None,
+        budget=None,
+    ):
+        self.name = name
+        self.options_factory = options_factory
+        self.setup = setup
+        self.budget = budget
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.checkout_timeout = checkout_timeout
+        self.debug = debug
+
+        self._idle = deque()
+        self._leased = set()
+        self._live = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self._stats = {
+            "created": 0,
+            "recycled": 0,
+            "crashed": 0,
+            "health_check_failures": 0,
+            "checkouts": 0,
+            "checkout_timeouts": 0,
+            "create_failures": 0,
+            "budget_exhausted": 0,
+            "checkout_wait_seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Driver lifecycle
+    # ------------------------------------------------------------------ #
+    def _create_driver(self):
+        # Imported here so processes that never start a browser never load them
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        service = Service(chromedriver_path())
+        with timed(SCRAPE_PHASE_SECONDS, phase="driver_startup"):
+            driver = webdriver.Chrome(service=service, options=self.options_factory())
+        if self.setup is not None:
+            try:
+                self.setup(driver)
+            except Exception:
+                driver.quit()
+                raise
+        return driver
+
+    def _quit(self, lease):
+        try:
+            lease.driver.quit()
+        except Exception:
+            pass
+        if self.budget is not None:
+            self.budget.release(lease.slot)
+            lease.slot = None
+
+    def is_healthy(self, lease):
+        try:
+            lease.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _new_lease(self):
+        """Start a driver for a slot already reserved in ``_live``."""
+        slot = None
+        try:
+            if self.budget is not None:
+                slot = self.budget.acquire()
+            driver = self._create_driver()
+        except Exception as e:
+            if self.budget is not None:
+                self.budget.release(slot)
+            with self._cond:
+                self._live -= 1
+                if isinstance(e, BrowserBudgetExhausted):
+                    self._stats["budget_exhausted"] += 1
+                else:
+                    self._stats["create_failures"] += 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["created"] += 1
+        if self.debug:
+            print(f"[DriverPool:{self.name}] Started new driver")
+        return DriverLease(driver, time.time(), slot)
+
+    def warm(self, count=1):
+        """Start up to ``count`` idle drivers ahead of time."""
+        started = 0
+        while started < count:
+            with self._cond:
+                if self._closed or self._live >= self.size:
+                    break
+                self._live += 1
+            lease = self._new_lease()
+            with self._cond:
+                self._idle.append(lease)
+                self._cond.notify()
+            started += 1
+        return started
+
+    # ------------------------------------------------------------------ #
+    # Checkout / return
+    # ------------------------------------------------------------------ #
+    def acquire(self, timeout=None):
+        """Check out a healthy driver, starting one if the pool has room."""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            lease = None
+            with self._cond:
+                while not self._idle and self._live >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["checkout_timeouts"] += 1
+                        raise DriverPoolTimeout(
+                            f"No driver available in pool {self.name!r} "
+                            f"after {timeout}s"
+                        )
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise DriverPoolTimeout(f"Pool {self.name!r} is closed")
+                if self._idle:
+                    lease = self._idle.popleft()
+                else:
+                    self._live += 1
+
+            if lease is None:
+                lease = self._new_lease()
+            elif not self.is_healthy(lease):
+                self._discard(lease, reason="health_check_failures")
+                continue
+
+            lease.uses += 1
+            with self._cond:
+                self._leased.add(lease)
+                self._stats["checkouts"] += 1
+                self._stats["checkout_wait_seconds"] += time.monotonic() - started
+            return lease
+
+    def release(self, lease):
+        """Return a driver to the pool, recycling it if needed."""
+        with self._cond:
+            if lease not in self._leased:
+                return  # already quit by close()
+            self._leased.discard(lease)
+        if lease.broken:
+            self._discard(lease, reason="crashed")
+            return
+        if lease.uses >= self.max_uses or self._closed:
+            self._discard(lease, reason="recycled")
+            return
+
+        from selenium.common.exceptions import WebDriverException
+
+        try:
+            # Drop the previous page so idle browsers do not hold its memory.
+            lease.driver.get("about:blank")
+        except WebDriverException:
+            self._discard(lease, reason="crashed")
+            return
+
+        with self._cond:
+            self._idle.append(lease)
+            self._cond.notify()
+
+    def _discard(self, lease, reason):
+        self._quit(lease)
+        with self._cond:
+            self._live -= 1
+            self._stats[reason] += 1
+            self._cond.notify()
+        if self.debug:
+            print(f"[DriverPool:{self.name}] Discarded driver ({reason})")
+
+    def close(self, timeout=0):
+        """
+        Quit all idle drivers and refuse further checkouts. Drivers still
+        checked out are quit when they come back; after ``timeout`` seconds
+        any that have not are quit where they are.
+        """
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for lease in idle:
+            self._quit(lease)
+
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._leased and time.monotonic() < deadline:
+                self._cond.wait(deadline - time.monotonic())
+            stragglers = list(self._leased)
+            self._leased.clear()
+            self._live -= len(stragglers)
+        for lease in stragglers:
+            if self.debug:
+                print(f"[DriverPool:{self.name}] Quitting driver still in use at shutdown")
+            self._quit(lease)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "name": self.name,
+                "size": self.size,
+                "max_uses": self.max_uses,
+                "live": self._live,
+                "idle": len(self._idle),
+                "in_use": self._live - len(self._idle),
+                **self._stats,
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(name, options_factory, setup=None):
+    """Return the shared pool called ``name``, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = DriverPool(
+                name,
+                options_factory,
+                size=int(os.getenv("DRIVER_POOL_SIZE", 2)),
+                max_uses=int(os.getenv("DRIVER_POOL_MAX_USES", 50)),
+                checkout_timeout=float(os.getenv("DRIVER_POOL_CHECKOUT_TIMEOUT", 60)),
+                setup=setup,
+                budget=get_browser_budget(),
+            )
+            _pools[name] = pool
+        return pool
+
+
+def pool_stats():
+    """Stats for every pool created so far, keyed by pool name."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.name: pool.stats() for pool in pools}
+
+
+def close_pools(timeout=0):
+    """Close every pool, giving checked-out drivers ``timeout`` seconds in total to come back."""
+    deadline = time.monotonic() + timeout
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close(max(0, deadline - time.monotonic()))
@@ -0,0 +1,367 @@
+"""
+Optional enrichment stage: add description, skills and posted date to scraped
+jobs by fetching their detail pages.
+
+Runs on the output of ``scrape_naukri_jobs`` / ``scrape_naukri_jobs_simple``:
+
+    jobs = enrich_jobs(scrape_naukri_jobs("Product Manager", "Mumbai"))
+
+Detail pages are fetched concurrently by a bounded thread pool over the
+scraper's keep-alive session, under the shared rate limit and per-host
+slots, and parsed by ``extract_job_details`` (JSON-LD ``JobPosting`` first,
+the page markup otherwise).
+
+Results are cached in SQLite. Each URL records the hash of its last body and
+the ETag / Last-Modified validators, and parsed details are stored once per
+body hash (content-addressed). A URL checked within ``fresh_ttl`` is not
+requested at all. After that it is revalidated with
+If-None-Match / If-Modified-Since, and a 304 reuses the stored details. A
+200 whose body hash is already known skips parsing.
+
+Every enriched job gets the keys ``description``, ``skills`` (list),
+``posted`` (as shown on the page) and ``posted_date`` (ISO date or None);
+they are None / empty when a detail page could not be read.
+
+Configuration (environment variables):
+  ENRICH_WORKERS     concurrent detail page fetches (default 8)
+  ENRICH_CACHE_PATH  SQLite database file for fetched details
+                     (default job_details.db in NAUKRI_DATA_DIR, see ``data_dir``)
+  ENRICH_FRESH_TTL   seconds a cached detail page is used without revalidation (default 3600)
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from bs4 import BeautifulSoup
+
+from data_dir import state_path
+from host_limits import get_host_limiter
+from json_state import job_postings
+from metrics import ENRICH_DETAILS, SCRAPE_PHASE_SECONDS, timed
+from naukri_scrapper import _make_soup, get_http_session
+from rate_limiter import check_status, get_rate_limiter
+
+EMPTY_DETAILS = {"description": None, "skills": [], "posted": None, "posted_date": None}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS detail_pages (
+    url           TEXT PRIMARY KEY,
+    content_hash  TEXT NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    checked_at    REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS detail_content (
+    content_hash  TEXT PRIMARY KEY,
+    details       TEXT NOT NULL,
+    stored_at     REAL NOT NULL
+);
+"""
+
+_RELATIVE_RE = re.compile(r"(\d+)\+?\s*(day|week|month)s?\s+ago", re.IGNORECASE)
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_UNIT_DAYS = {"day": 1, "week": 7, "month": 30}
+
+
+# ---------------------------------------------------------------------- #
+# Detail page extractor
+# ---------------------------------------------------------------------- #
+def posted_date(posted, fetched_at=None):
+    """
+    ISO date for a posted label: an ISO timestamp, "Just Now" / "Today" /
+    "Few Hours Ago", or "3 days ago" / "30+ days ago" relative to
+    ``fetched_at`` (epoch seconds, default now). None when not recognised.
+    """
+    if not posted:
+        return None
+    posted = posted.strip()
+    if _ISO_DATE_RE.match(posted):
+        return posted[:10]
+    day = datetime.date.fromtimestamp(fetched_at or time.time())
+    lowered = posted.lower()
+    if any(word in lowered for word in ("just now", "today", "hour", "minute")):
+        return day.isoformat()
+    match = _RELATIVE_RE.search(lowered)
+    if match:
+        days = int(match.group(1)) * _UNIT_DAYS[match.group(2).lower()]
+        return (day - datetime.timedelta(days=days)).isoformat()
+    return None
+
+
+def _html_text(fragment):
+    text = BeautifulSoup(fragment, "html.parser").get_text("\n")
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line) or None
+
+
+def _details_from_ld_json(html):
+    for posting in job_postings(html):
+        skills = posting.get("skills") or []
+        if isinstance(skills, str):
+            skills = [s.strip() for s in skills.split(",")]
+        return {
+            "description": _html_text(posting["description"]) if posting.get("description") else None,
+            "skills": [s for s in skills if isinstance(s, str) and s],
+            "posted": posting.get("datePosted"),
+        }
+    return {}
+
+
+def _class_contains(*needles):
+    return lambda x: x and any(n in str(x).lower() for n in needles)
+
+
+def _details_from_markup(html):
+    soup = _make_soup(html)
+    details = {}
+
+    desc = soup.find(["section", "div"], class_=_class_contains("dang-inner-html")) or soup.find(
+        ["section", "div"], class_=_class_contains("job-desc")
+    )
+    if desc:
+        details["description"] = _html_text(str(desc))
+
+    skills_box = soup.find(["div", "section"], class_=_class_contains("key-skill"))
+    if skills_box:
+        chips = skills_box.find_all(["a", "span"], class_=_class_contains("chip"))
+        details["skills"] = list(
+            dict.fromkeys(c.get_text(strip=True) for c in chips if c.get_text(strip=True))
+        )
+
+    for label in soup.find_all(["span", "label"], string=re.compile(r"posted", re.IGNORECASE)):
+        value = label.find_next_sibling("span")
+        text = value.get_text(strip=True) if value else label.get_text(strip=True)
+        text = re.sub(r"^posted\s*(on)?\s*:?\s*", "", text, flags=re.IGNORECASE)
+        if text:
+            details["posted"] = text
+            break
+    return details
+
+
+def extract_job_details(html, fetched_at=None):
+    """
+    ``description``, ``skills``, ``posted`` and ``posted_date`` from a job
+    detail page. JSON-LD is read first; fields it lacks come from the markup.
+    """
+    details = _details_from_ld_json(html)
+    if not details.get("description") or not details.get("skills") or not details.get("posted"):
+        for key, value in _details_from_markup(html).items():
+            if not details.get(key):
+                details[key] = value
+    result = {**EMPTY_DETAILS, **details}
+    result["skills"] = result["skills"] or []
+    result["posted_date"] = posted_date(result["posted"], fetched_at)
+    return result
+
+
+# ---------------------------------------------------------------------- #
+# Cache
+# ---------------------------------------------------------------------- #
+class DetailCache:
+    """Detail pages by URL (validators + body hash) and parsed details by body hash."""
+
+    def __init__(self, path="job_details.db"):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def lookup(self, url):
+        """The URL's row joined with its details (a dict), or None."""
+        row = self._conn().execute(
+            "SELECT p.content_hash, p.etag, p.last_modified, p.checked_at, c.details "
+            "FROM detail_pages p JOIN detail_content c USING (content_hash) WHERE p.url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        entry = dict(row)
+        entry["details"] = json.loads(entry["details"])
+        return entry
+
+    def content(self, content_hash):
+        row = self._conn().execute(
+            "SELECT details FROM detail_content WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def store(self, url, content_hash, etag, last_modified, details=None):
+        """Record ``url``'s latest body; ``details`` are stored if the hash is new."""
+        now = time.time()
+        conn = self._conn()
+        with self._write_lock, conn:
+            if details is not None:
+                conn.execute(
+                    "INSERT OR IGNORE INTO detail_content (content_hash, details, stored_at) "
+                    "VALUES (?, ?, ?)",
+                    (content_hash, json.dumps(details), now),
+                )
+            conn.execute(
+                "INSERT INTO detail_pages (url, content_hash, etag, last_modified, checked_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(url) DO UPDATE SET "
+                "content_hash = excluded.content_hash, etag = excluded.etag, "
+                "last_modified = excluded.last_modified, checked_at = excluded.checked_at",
+                (url, content_hash, etag, last_modified, now),
+            )
+
+    def touch(self, url):
+        """Mark ``url`` as revalidated now."""
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.execute(
+                "UPDATE detail_pages SET checked_at = ? WHERE url = ?", (time.time(), url)
+            )
+
+    def count(self):
+        conn = self._conn()
+        return {
+            "pages": conn.execute("SELECT COUNT(*) FROM detail_pages").fetchone()[0],
+            "contents": conn.execute("SELECT COUNT(*) FROM detail_content").fetchone()[0],
+        }
+
+
+# ---------------------------------------------------------------------- #
+# Enricher
+# ---------------------------------------------------------------------- #
+class Enricher:
+    def __init__(self, cache, session=None, workers=8, fresh_ttl=3600, timeout=20):
+        self.cache = cache
+        self.session = session or get_http_session()
+        self.workers = max(1, int(workers))
+        self.fresh_ttl = fresh_ttl
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="enrich")
+        self._lock = threading.Lock()
+        self._stats = {
+            "fresh": 0,
+            "not_modified": 0,
+            "reused": 0,
+            "fetched": 0,
+            "failed": 0,
+            "bytes_downloaded": 0,
+        }
+
+    def _count(self, outcome, downloaded=0):
+        ENRICH_DETAILS.labels(outcome=outcome).inc()
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats["bytes_downloaded"] += downloaded
+
+    def details(self, url, debug=False):
+        """
+        Details for one job URL and how they were obtained: "fresh" (cached,
+        no request), "not_modified" (304), "reused" (200 with a known body)
+        or "fetched" (new body, parsed).
+        """
+        cached = self.cache.lookup(url)
+        if cached and time.time() - cached["checked_at"] < self.fresh_ttl:
+            self._count("fresh")
+            return cached["details"], "fresh"
+
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        def fetch():
+            with get_host_limiter().slot(url), timed(SCRAPE_PHASE_SECONDS, phase="detail_fetch"):
+                resp = self.session.get(url, headers=headers, timeout=self.timeout)
+            check_status(resp.status_code, resp.headers.get("Retry-After"))
+            if resp.status_code != 304:
+                resp.raise_for_status()
+            return resp
+
+        resp = get_rate_limiter().call(
+            fetch, retry_on=(requests.Timeout, requests.ConnectionError), debug=debug
+        )
+        if resp.status_code == 304 and cached:
+            self.cache.touch(url)
+            self._count("not_modified")
+            return cached["details"], "not_modified"
+
+        body = resp.content
+        content_hash = hashlib.sha256(body).hexdigest()
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        known = self.cache.content(content_hash)
+        if known is not None:
+            self.cache.store(url, content_hash, etag, last_modified)
+            self._count("reused", len(body))
+            return known, "reused"
+
+        with timed(SCRAPE_PHASE_SECONDS, phase="detail_parse"):
+            details = extract_job_details(resp.text)
+        self.cache.store(url, content_hash, etag, last_modified, details)
+        self._count("fetched", len(body))
+        return details, "fetched"
+
+    def _safe_details(self, url, debug):
+        try:
+            return self.details(url, debug)[0]
+        except Exception as e:
+            if debug:
+                print(f"[Enrich] Could not read {url}: {e}")
+            self._count("failed")
+            return EMPTY_DETAILS
+
+    def enrich(self, jobs, debug=False):
+        """Copies of ``jobs`` with their detail fields, in the same order."""
+        urls = list(
+            dict.fromkeys(job["url"] for job in jobs if job.get("url", "N/A") != "N/A")
+        )
+        futures = {url: self._executor.submit(self._safe_details, url, debug) for url in urls}
+        details = {url: future.result() for url, future in futures.items()}
+        if debug:
+            print(f"[Enrich] {len(urls)} detail pages, {self.stats()}")
+        return [{**job, **details.get(job.get("url"), EMPTY_DETAILS)} for job in jobs]
+
+    def stats(self):
+        with self._lock:
+            return {"workers": self.workers, **self._stats}
+
+
+_default_enricher = None
+_default_lock = threading.Lock()
+
+
+def get_enricher():
+    """The process-wide enricher, configured from the environment on first use."""
+    global _default_enricher
+    with _default_lock:
+        if _default_enricher is None:
+            _default_enricher = Enricher(
+                DetailCache(state_path("ENRICH_CACHE_PATH", "job_details.db")),
+                workers=int(os.getenv("ENRICH_WORKERS", 8)),
+                fresh_ttl=float(os.getenv("ENRICH_FRESH_TTL", 3600)),
+            )
+        return _default_enricher
+
+
+def enrich_jobs(jobs, debug=False):
+    """Add detail fields to ``jobs`` with the process-wide enricher."""
+    return get_enricher().enrich(jobs, debug)
+
+
+def enrichment_stats():
+    """Enricher counters, empty until the first enrichment."""
+    return _default_enricher.stats() if _default_enricher else {}
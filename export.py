@@ -0,0 +1,233 @@
+"""
+Bulk export of stored jobs as Parquet, Arrow IPC or CSV.
+
+Jobs are read from the ``JobStore`` one keyset page at a time and written
+with typed columns, so analytics jobs do not have to re-parse JSON:
+
+  url, title, experience, salary          string
+  company, location, platform             dictionary<int32, string>
+  experience_min, experience_max          float32 (years)
+  salary_min, salary_max                  int64 (rupees per annum)
+  first_seen, last_seen                   timestamp[ms, UTC]
+  seen_count                              int32
+
+``iter_export`` yields the encoded file in chunks, one per page of jobs (a
+Parquet row group / an Arrow record batch / a block of CSV rows), so an
+export never holds more than one page in memory:
+
+    with open("jobs.parquet", "wb") as f:
+        export_jobs(f, "parquet", location="Mumbai")
+
+Parquet and Arrow need ``pyarrow``; CSV is always available.
+"""
+
+import csv
+import datetime
+import io
+
+from field_classifier import parse_experience, parse_salary
+from job_store import get_job_store
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only the CSV format works without it
+    pa = pq = None
+
+FORMATS = ("parquet", "arrow", "csv")
+CONTENT_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "csv": "text/csv; charset=utf-8",
+}
+EXTENSIONS = {"parquet": "parquet", "arrow": "arrows", "csv": "csv"}
+PARQUET_COMPRESSIONS = ("zstd", "snappy", "gzip", "brotli", "lz4", "none")
+
+COLUMNS = (
+    "url",
+    "title",
+    "company",
+    "location",
+    "platform",
+    "experience",
+    "experience_min",
+    "experience_max",
+    "salary",
+    "salary_min",
+    "salary_max",
+    "first_seen",
+    "last_seen",
+    "seen_count",
+)
+_DICTIONARY_COLUMNS = ("company", "location", "platform")
+
+if pa is not None:
+    _dictionary = pa.dictionary(pa.int32(), pa.string())
+    _timestamp = pa.timestamp("ms", tz="UTC")
+    SCHEMA = pa.schema(
+        [
+            ("url", pa.string()),
+            ("title", pa.string()),
+            ("company", _dictionary),
+            ("location", _dictionary),
+            ("platform", _dictionary),
+            ("experience", pa.string()),
+            ("experience_min", pa.float32()),
+            ("experience_max", pa.float32()),
+            ("salary", pa.string()),
+            ("salary_min", pa.int64()),
+            ("salary_max", pa.int64()),
+            ("first_seen", _timestamp),
+            ("last_seen", _timestamp),
+            ("seen_count", pa.int32()),
+        ]
+    )
+else:
+    SCHEMA = None
+
+
+class ExportUnavailable(RuntimeError):
+    """The requested format needs an optional dependency that is not installed."""
+
+
+def check_format(fmt, compression="zstd"):
+    """Raise ``ValueError`` / ``ExportUnavailable`` unless ``fmt`` can be written."""
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {list(FORMATS)}")
+    if fmt == "parquet" and compression not in PARQUET_COMPRESSIONS:
+        raise ValueError(f"compression must be one of {list(PARQUET_COMPRESSIONS)}")
+    if fmt != "csv" and pa is None:
+        raise ExportUnavailable(f"The {fmt} format requires pyarrow")
+
+
+def typed_columns(jobs):
+    """Column name -> list of typed values for ``jobs`` (store rows or scrape dicts)."""
+    columns = {name: [] for name in COLUMNS}
+    for job in jobs:
+        experience_min, experience_max = parse_experience(job.get("experience"))
+        salary_min, salary_max = parse_salary(job.get("salary"))
+        row = {
+            **job,
+            "experience_min": experience_min,
+            "experience_max": experience_max,
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+        }
+        for name in COLUMNS:
+            columns[name].append(row.get(name))
+    for name in ("first_seen", "last_seen"):
+        columns[name] = [None if t is None else round(t * 1000) for t in columns[name]]
+    return columns
+
+
+def record_batch(jobs):
+    """A ``pyarrow.RecordBatch`` of ``jobs`` with ``SCHEMA``."""
+    columns = typed_columns(jobs)
+    arrays = []
+    for field in SCHEMA:
+        if field.name in _DICTIONARY_COLUMNS:
+            arrays.append(pa.array(columns[field.name], pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(columns[field.name], field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=SCHEMA)
+
+
+class _ChunkSink:
+    """Write-only file object whose written bytes are collected by ``drain``."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self):
+        return True
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _iter_arrow(batches, fmt, compression):
+    sink = _ChunkSink()
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(sink, SCHEMA, compression=compression)
+        write = lambda batch: writer.write_table(pa.Table.from_batches([batch]))  # noqa: E731
+    else:
+        writer = pa.ipc.new_stream(sink, SCHEMA)
+        write = writer.write_batch
+    for jobs in batches:
+        write(record_batch(jobs))
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    writer.close()
+    yield sink.drain()
+
+
+def _csv_value(name, value):
+    if value is None:
+        return ""
+    if name in ("first_seen", "last_seen"):
+        return (
+            datetime.datetime.fromtimestamp(value / 1000, datetime.timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z")
+        )
+    return value
+
+
+def _iter_csv(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    for jobs in batches:
+        columns = typed_columns(jobs)
+        values = [[_csv_value(name, v) for v in columns[name]] for name in COLUMNS]
+        writer.writerows(zip(*values))
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    # A header-only file when there were no jobs
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_export(fmt, batches, compression="zstd"):
+    """
+    Encode ``batches`` (iterable of job lists) as ``fmt`` and yield the
+    output bytes chunk by chunk. ``compression`` applies to Parquet.
+    """
+    check_format(fmt, compression)
+    if fmt == "csv":
+        return _iter_csv(batches)
+    return _iter_arrow(batches, fmt, compression)
+
+
+def export_jobs(out, fmt, store=None, batch_size=5000, compression="zstd", **filters):
+    """
+    Write every stored job matching ``filters`` (see ``JobStore.query_jobs``)
+    to the binary file object ``out``. Returns the number of bytes written.
+    """
+    store = store or get_job_store()
+    written = 0
+    for chunk in iter_export(fmt, store.iter_jobs(batch_size, **filters), compression):
+        out.write(chunk)
+        written += len(chunk)
+    return written
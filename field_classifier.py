@@ -0,0 +1,185 @@
+"""
+Classify job-tuple span texts as experience, salary or location.
+
+All keyword rules are compiled once into a single whole-word keyword table
+driven by one tokenizer regex, so a tuple's spans (or a whole page of
+tuples, see ``classify_batch``) are classified in one pass over the joined
+text instead of a chain of substring checks and city lists per span.
+
+Precedence follows the original extraction loops: a span that mentions
+both is experience before salary before location. The first experience and
+salary spans win; the last location span wins.
+
+Salary and experience texts are also parsed into numeric ranges:
+
+    >>> parse_experience("2-5 Yrs")
+    (2, 5)
+    >>> parse_salary("5-8 Lacs PA")
+    (500000, 800000)
+"""
+
+import re
+from functools import lru_cache
+
+CITIES = (
+    "bangalore",
+    "bengaluru",
+    "mumbai",
+    "delhi",
+    "ncr",
+    "hyderabad",
+    "pune",
+    "chennai",
+    "gurgaon",
+    "gurugram",
+    "noida",
+    "kolkata",
+    "ahmedabad",
+    "remote",
+)
+
+EXPERIENCE = "experience"
+SALARY = "salary"
+LOCATION = "location"
+_FIELDS = (EXPERIENCE, SALARY, LOCATION)  # in precedence order
+
+# Whole-word keyword table. "pa" only counts as "per annum" on its own
+# ("PA", "p.a.", dots are stripped first), not inside "Pune" or "Japan".
+_KEYWORDS = {
+    **{word: 0 for word in ("yr", "yrs", "year", "years", "exp", "experience", "fresher", "freshers")},
+    **{word: 1 for word in ("lakh", "lakhs", "lac", "lacs", "crore", "crores", "salary", "lpa", "pa", "inr", "₹")},
+    **{city: 2 for city in CITIES},
+}
+_SEPARATOR = "\x00"
+_TOKEN_RE = re.compile(r"[a-z₹]+|\x00")
+
+_NUMBER_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_SALARY_UNITS = (("crore", 10_000_000), ("lakh", 100_000), ("lac", 100_000), ("lpa", 100_000))
+
+
+def _numbers(text):
+    return [float(n.replace(",", "")) for n in _NUMBER_RE.findall(text)]
+
+
+def _as_int(value):
+    return int(value) if value is not None and float(value).is_integer() else value
+
+
+def _range(numbers, open_ended):
+    if not numbers:
+        return None, None
+    low = numbers[0]
+    high = None if open_ended and len(numbers) == 1 else numbers[min(1, len(numbers) - 1)]
+    return low, high
+
+
+@lru_cache(maxsize=4096)
+def parse_experience(text):
+    """``"2-5 Yrs"`` -> ``(2, 5)``; ``"5+ Yrs"`` -> ``(5, None)``; fresher -> ``(0, 0)``."""
+    if not text:
+        return None, None
+    if "fresher" in text.lower() and not _NUMBER_RE.search(text):
+        return 0, 0
+    low, high = _range(_numbers(text), open_ended="+" in text)
+    return _as_int(low), _as_int(high)
+
+
+@lru_cache(maxsize=4096)
+def parse_salary(text):
+    """
+    Salary text -> ``(min, max)`` in rupees per annum, e.g. ``"5-8 Lacs PA"``
+    -> ``(500000, 800000)``. ``(None, None)`` when not disclosed.
+    """
+    if not text:
+        return None, None
+    lower = text.lower()
+    multiplier = 1
+    for unit, value in _SALARY_UNITS:
+        if unit in lower:
+            multiplier = value
+            break
+    low, high = _range(_numbers(text), open_ended="+" in text)
+    if low is None:
+        return None, None
+    return (
+        _as_int(round(low * multiplier)),
+        _as_int(round(high * multiplier)) if high is not None else None,
+    )
+
+
+def classify(text):
+    """The field ``text`` describes, or None."""
+    return classify_spans([text])[0]
+
+
+def classify_spans(texts):
+    """Classify each of ``texts`` in one tokenizer pass; returns a list of fields/None."""
+    texts = list(texts)
+    if not texts:
+        return []
+    labels = []
+    best = None
+    keywords = _KEYWORDS
+    joined = _SEPARATOR.join(texts).lower().replace(".", "")
+    for token in _TOKEN_RE.findall(joined):
+        if token == _SEPARATOR:
+            labels.append(None if best is None else _FIELDS[best])
+            best = None
+            continue
+        rank = keywords.get(token)
+        if rank is not None and (best is None or rank < best):
+            best = rank
+    labels.append(None if best is None else _FIELDS[best])
+    return labels
+
+
+def _fields_from_labels(texts, labels, location):
+    experience = None
+    salary = None
+    job_location = location
+    for text, label in zip(texts, labels):
+        if label == EXPERIENCE:
+            if experience is None:
+                experience = text
+        elif label == SALARY:
+            if salary is None:
+                salary = text
+        elif label == LOCATION:
+            job_location = text
+    experience_min, experience_max = parse_experience(experience)
+    salary_min, salary_max = parse_salary(salary)
+    return {
+        "experience": experience or "Not specified",
+        "salary": salary or "Not disclosed",
+        "location": job_location,
+        "experience_min": experience_min,
+        "experience_max": experience_max,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+    }
+
+
+def classify_fields(texts, location):
+    """
+    Job fields from one tuple's span ``texts``: experience/salary/location
+    strings plus the parsed ``experience_min/max`` and ``salary_min/max``.
+    """
+    texts = [t.strip() for t in texts]
+    return _fields_from_labels(texts, classify_spans(texts), location)
+
+
+def classify_batch(groups, location):
+    """
+    ``classify_fields`` for many tuples at once (a list of span-text lists,
+    e.g. every tuple on a page), using a single tokenizer pass for all of them.
+    """
+    groups = [[t.strip() for t in texts] for texts in groups]
+    labels = classify_spans(t for texts in groups for t in texts)
+    results = []
+    position = 0
+    for texts in groups:
+        results.append(
+            _fields_from_labels(texts, labels[position:position + len(texts)], location)
+        )
+        position += len(texts)
+    return results
@@ -0,0 +1,103 @@
+"""
+Production server settings. gunicorn reads this file from the working
+directory:
+
+    gunicorn app:app
+
+Threaded workers (``gthread``) keep the blocking Selenium/requests code
+as-is; each worker process has its own driver pools and admission limits,
+and all of them share the machine-wide browser budget (``browser_budget``).
+On SIGTERM a worker stops accepting connections, lets in-flight requests
+finish and then quits its drivers (``app.shutdown``).
+
+/metrics is answered by whichever worker gets the request, so the workers
+share a metrics directory (``METRICS_MULTIPROC_DIR``, see ``metrics``) and
+any of them reports totals for the whole server. Unless one is configured,
+a fresh temporary directory is used for each server run.
+
+Configuration (environment variables):
+  PORT                port to bind on all interfaces (default 5000)
+  WEB_CONCURRENCY     worker processes (default 2)
+  WEB_THREADS         request threads per worker (default 8)
+  WEB_TIMEOUT         seconds before a stuck worker is restarted (default 300)
+  SHUTDOWN_TIMEOUT    seconds to drain requests, tasks and drivers on stop (default 60)
+  METRICS_MULTIPROC_DIR  metrics snapshot directory, emptied on start (default: a temp dir)
+"""
+
+import glob
+import os
+import shutil
+import signal
+import tempfile
+import threading
+
+SHUTDOWN_TIMEOUT = float(os.getenv("SHUTDOWN_TIMEOUT", 60))
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+workers = int(os.getenv("WEB_CONCURRENCY", 2))
+worker_class = "gthread"
+threads = int(os.getenv("WEB_THREADS", 8))
+timeout = int(os.getenv("WEB_TIMEOUT", 300))
+# The master kills workers this long after SIGTERM; leave room to quit drivers
+graceful_timeout = int(SHUTDOWN_TIMEOUT) + 15
+keepalive = 5
+accesslog = "-"
+
+
+def on_starting(server):
+    # Workers inherit the environment, so they all find the same directory
+    directory = os.getenv("METRICS_MULTIPROC_DIR")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        # Counters from a previous server run would be added to this one's
+        for path in glob.glob(os.path.join(directory, "*.json")):
+            os.remove(path)
+    else:
+        server.metrics_tmp_dir = tempfile.mkdtemp(prefix="naukri-metrics-")
+        os.environ["METRICS_MULTIPROC_DIR"] = server.metrics_tmp_dir
+
+
+def on_exit(server):
+    tmp_dir = getattr(server, "metrics_tmp_dir", None)
+    if tmp_dir:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def post_worker_init(worker):
+    import app
+
+    app.start_worker()
+
+    # Start draining as soon as SIGTERM arrives rather than after gunicorn's
+    # own wait for open connections, so drivers are quit before the kill
+    handle_exit = worker.handle_exit
+
+    def drain_and_exit(sig, frame):
+        handle_exit(sig, frame)
+        if worker.shutdown_thread is None:
+            worker.shutdown_thread = threading.Thread(target=app.shutdown, daemon=True)
+            worker.shutdown_thread.start()
+
+    worker.shutdown_thread = None
+
+    signal.signal(signal.SIGTERM, drain_and_exit)
+
+
+def worker_exit(server, worker):
+    import metrics
+    from driver_pool import close_pools
+
+    thread = getattr(worker, "shutdown_thread", None)
+    if thread is not None:
+        thread.join(SHUTDOWN_TIMEOUT)
+    # Quit whatever the drain did not get to
+    close_pools()
+    # Keep this worker's final counts in the server-wide totals
+    metrics.write_snapshot()
+
+
+def worker_abort(worker):
+    # Timed-out worker: quit its browsers before it is killed
+    from driver_pool import close_pools
+
+    close_pools()
@@ -0,0 +1,78 @@
+"""
+Per-host concurrency limits for outgoing page loads.
+
+Every results-page fetch (requests or WebDriver) takes a slot for its host
+first, so however many scrapes run at once (a ``/scrape/batch`` fans out to
+many) no more than ``per_host`` requests hit one site concurrently.
+
+    with get_host_limiter().slot(url):
+        resp = session.get(url)
+
+Configuration (environment variables):
+  SCRAPE_PER_HOST_LIMIT  concurrent page loads per host (default 4)
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+class HostLimiter:
+    def __init__(self, per_host=4):
+        self.per_host = max(1, int(per_host))
+        self._semaphores = {}
+        self._active = {}
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited": 0, "wait_seconds": 0.0}
+
+    def _semaphore(self, host):
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return semaphore
+
+    @contextmanager
+    def slot(self, url):
+        """Hold one of ``url``'s host slots for the duration of the block."""
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._semaphore(host)
+        waited = 0.0
+        if not semaphore.acquire(blocking=False):
+            started = time.monotonic()
+            semaphore.acquire()
+            waited = time.monotonic() - started
+        with self._lock:
+            self._stats["acquired"] += 1
+            if waited:
+                self._stats["waited"] += 1
+                self._stats["wait_seconds"] += waited
+            self._active[host] = self._active.get(host, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active[host] -= 1
+            semaphore.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "per_host": self.per_host,
+                "active": {host: n for host, n in self._active.items() if n},
+                **self._stats,
+            }
+
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+
+def get_host_limiter():
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = HostLimiter(int(os.getenv("SCRAPE_PER_HOST_LIMIT", 4)))
+        return _default_limiter
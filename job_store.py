@@ -0,0 +1,224 @@
+"""
+SQLite-backed store of every job the scrapers have seen.
+
+Jobs are keyed by URL and carry first-seen / last-seen timestamps, so repeat
+scrapes only bump ``last_seen``. Clients can page through the store with
+``query_jobs`` (keyset pagination on ``last_seen, url``) instead of
+triggering new scrapes, and incremental scrapes use ``known_urls`` to stop as
+soon as they reach results that are already stored.
+
+Configuration (environment variables):
+  JOB_STORE_PATH  SQLite database file (default jobs.db in NAUKRI_DATA_DIR, see ``data_dir``)
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from data_dir import state_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    url         TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    company     TEXT,
+    experience  TEXT,
+    salary      TEXT,
+    location    TEXT,
+    platform    TEXT,
+    first_seen  REAL NOT NULL,
+    last_seen   REAL NOT NULL,
+    seen_count  INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs (first_seen);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen, url);
+"""
+
+_UPSERT = """
+INSERT INTO jobs (url, title, company, experience, salary, location, platform,
+                  first_seen, last_seen)
+VALUES (:url, :title, :company, :experience, :salary, :location, :platform,
+        :seen, :seen)
+ON CONFLICT(url) DO UPDATE SET
+    title      = excluded.title,
+    company    = excluded.company,
+    experience = excluded.experience,
+    salary     = excluded.salary,
+    location   = excluded.location,
+    platform   = excluded.platform,
+    last_seen  = excluded.last_seen,
+    seen_count = jobs.seen_count + 1
+"""
+
+_COLUMNS = (
+    "url",
+    "title",
+    "company",
+    "experience",
+    "salary",
+    "location",
+    "platform",
+    "first_seen",
+    "last_seen",
+    "seen_count",
+)
+
+# SQLite's default limit on host parameters is 999
+_IN_CHUNK = 500
+
+
+def _encode_cursor(last_seen, url):
+    raw = json.dumps([last_seen, url]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor):
+    try:
+        last_seen, url = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(last_seen), str(url)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+class JobStore:
+    def __init__(self, path="jobs.db"):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def upsert_jobs(self, jobs, seen_at=None):
+        """Insert or refresh ``jobs`` in one transaction. Returns the number of new URLs."""
+        if not jobs:
+            return 0
+        seen = seen_at or time.time()
+        rows = [
+            {
+                "url": job["url"],
+                "title": job.get("title", ""),
+                "company": job.get("company"),
+                "experience": job.get("experience"),
+                "salary": job.get("salary"),
+                "location": job.get("location"),
+                "platform": job.get("platform", "Naukri"),
+                "seen": seen,
+            }
+            for job in jobs
+            if job.get("url") and job["url"] != "N/A"
+        ]
+        conn = self._conn()
+        with self._write_lock, conn:
+            known = self._known(conn, [r["url"] for r in rows])
+            conn.executemany(_UPSERT, rows)
+        return len({r["url"] for r in rows} - known)
+
+    def _known(self, conn, urls):
+        known = set()
+        urls = list(dict.fromkeys(urls))
+        for i in range(0, len(urls), _IN_CHUNK):
+            chunk = urls[i : i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                row[0]
+                for row in conn.execute(
+                    f"SELECT url FROM jobs WHERE url IN ({placeholders})", chunk
+                )
+            )
+        return known
+
+    def known_urls(self, urls):
+        """Subset of ``urls`` that are already stored."""
+        return self._known(self._conn(), urls)
+
+    def query_jobs(
+        self,
+        company=None,
+        location=None,
+        q=None,
+        since=None,
+        limit=50,
+        cursor=None,
+    ):
+        """
+        Jobs ordered by most recently seen, ``limit`` at a time.
+
+        ``company`` and ``location`` match case-insensitively, ``q`` is a
+        substring of the title and ``since`` a minimum ``last_seen`` epoch.
+        Returns ``(jobs, next_cursor)``; pass ``next_cursor`` back to get the
+        following page (None when there are no more results).
+        """
+        where = []
+        params = []
+        if company:
+            where.append("company = ? COLLATE NOCASE")
+            params.append(company)
+        if location:
+            where.append("location = ? COLLATE NOCASE")
+            params.append(location)
+        if q:
+            where.append("title LIKE ?")
+            params.append(f"%{q}%")
+        if since is not None:
+            where.append("last_seen >= ?")
+            params.append(float(since))
+        if cursor:
+            last_seen, url = _decode_cursor(cursor)
+            where.append("(last_seen < ? OR (last_seen = ? AND url < ?))")
+            params.extend([last_seen, last_seen, url])
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM jobs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY last_seen DESC, url DESC LIMIT ?"
+        params.append(int(limit) + 1)
+
+        rows = self._conn().execute(sql, params).fetchall()
+        jobs = [dict(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and jobs:
+            next_cursor = _encode_cursor(jobs[-1]["last_seen"], jobs[-1]["url"])
+        return jobs, next_cursor
+
+    def iter_jobs(self, batch_size=1000, **filters):
+        """
+        Every job matching ``filters`` (see ``query_jobs``), as lists of up to
+        ``batch_size`` jobs read one keyset page at a time.
+        """
+        cursor = None
+        while True:
+            jobs, cursor = self.query_jobs(limit=batch_size, cursor=cursor, **filters)
+            if jobs:
+                yield jobs
+            if cursor is None:
+                return
+
+    def count(self):
+        return self._conn().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def get_job_store():
+    """Process-wide store at ``JOB_STORE_PATH``."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = JobStore(state_path("JOB_STORE_PATH", "jobs.db"))
+        return _default_store
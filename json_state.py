@@ -0,0 +1,240 @@
+"""
+Fast path: read jobs from the structured JSON a results page carries instead
+of walking its DOM.
+
+Three payload shapes are recognised, tried in this order:
+
+  search API   ``{"jobDetails": [{"title", "companyName", "jdURL",
+               "placeholders": [{"type": "experience", "label": ...}, ...]}]}``
+               as returned by the search XHR, or found anywhere inside an
+               embedded state object (``window._initialState``,
+               ``window.__INITIAL_STATE__``, ``__NEXT_DATA__``)
+  JSON-LD      ``<script type="application/ld+json">`` ``JobPosting`` items
+
+Payloads are located in the raw HTML with regular expressions and decoded
+with ``json``, so no DOM is built. Every job has the same keys as the DOM
+extractors produce. ``jobs_from_html`` returns None when the page carries no
+usable payload, which is the caller's cue to fall back to the DOM.
+"""
+
+import json
+import re
+
+from field_classifier import parse_experience, parse_salary
+
+BASE_URL = "https://www.naukri.com"
+
+_STATE_RE = re.compile(
+    r"(?:window\.)?(?:_initialState|__INITIAL_STATE__|__PRELOADED_STATE__)\s*=\s*"
+)
+_NEXT_DATA_RE = re.compile(
+    r"<script[^>]*\bid=[\"']__NEXT_DATA__[\"'][^>]*>(.*?)</script>", re.DOTALL | re.IGNORECASE
+)
+_LD_JSON_RE = re.compile(
+    r"<script[^>]*\btype=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+_decoder = json.JSONDecoder()
+
+
+def _absolute(url):
+    if not url:
+        return None
+    return url if url.startswith("http") else f"{BASE_URL}{url if url.startswith('/') else '/' + url}"
+
+
+def _job(title, company, experience, salary, job_location, url):
+    experience_min, experience_max = parse_experience(experience)
+    salary_min, salary_max = parse_salary(salary)
+    return {
+        "title": title.strip(),
+        "company": (company or "").strip() or "Not specified",
+        "experience": experience or "Not specified",
+        "salary": salary or "Not disclosed",
+        "location": job_location,
+        "experience_min": experience_min,
+        "experience_max": experience_max,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "url": url,
+        "platform": "Naukri",
+    }
+
+
+# ---------------------------------------------------------------------- #
+# Search API / embedded state
+# ---------------------------------------------------------------------- #
+def _find_job_details(node, depth=0):
+    """The first ``jobDetails`` list anywhere inside ``node``."""
+    if depth > 12:
+        return None
+    if isinstance(node, dict):
+        details = node.get("jobDetails")
+        if isinstance(details, list):
+            return details
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return None
+    for child in children:
+        if isinstance(child, (dict, list)):
+            found = _find_job_details(child, depth + 1)
+            if found is not None:
+                return found
+    return None
+
+
+def _placeholders(item):
+    labels = {}
+    for placeholder in item.get("placeholders") or []:
+        if isinstance(placeholder, dict) and placeholder.get("type"):
+            labels.setdefault(placeholder["type"].lower(), placeholder.get("label"))
+    return labels
+
+
+def jobs_from_api_payload(payload, location):
+    """Jobs from a search API response (or any object holding ``jobDetails``)."""
+    details = _find_job_details(payload)
+    if details is None:
+        return None
+    jobs = []
+    for item in details:
+        if not isinstance(item, dict):
+            continue
+        title = item.get("title") or item.get("jobTitle")
+        url = _absolute(item.get("jdURL") or item.get("jobUrl") or item.get("url"))
+        if not title or not url:
+            continue
+        labels = _placeholders(item)
+        jobs.append(
+            _job(
+                title,
+                item.get("companyName") or item.get("company"),
+                labels.get("experience") or item.get("experienceText"),
+                labels.get("salary") or item.get("salary"),
+                labels.get("location") or item.get("location") or location,
+                url,
+            )
+        )
+    return jobs
+
+
+def _embedded_states(html):
+    for match in _STATE_RE.finditer(html):
+        try:
+            state, _ = _decoder.raw_decode(html, match.end())
+        except ValueError:
+            continue
+        yield state
+    for match in _NEXT_DATA_RE.finditer(html):
+        try:
+            yield json.loads(match.group(1))
+        except ValueError:
+            continue
+
+
+# ---------------------------------------------------------------------- #
+# JSON-LD JobPosting
+# ---------------------------------------------------------------------- #
+def _iter_job_postings(node):
+    if isinstance(node, list):
+        for child in node:
+            yield from _iter_job_postings(child)
+    elif isinstance(node, dict):
+        kind = node.get("@type")
+        if kind == "JobPosting" or (isinstance(kind, list) and "JobPosting" in kind):
+            yield node
+        for key in ("@graph", "itemListElement", "item"):
+            if key in node:
+                yield from _iter_job_postings(node[key])
+
+
+def _posting_location(posting):
+    places = posting.get("jobLocation")
+    if isinstance(places, dict):
+        places = [places]
+    names = []
+    for place in places or []:
+        address = place.get("address") if isinstance(place, dict) else None
+        if isinstance(address, dict) and address.get("addressLocality"):
+            names.append(address["addressLocality"])
+    return ", ".join(names) or None
+
+
+def _posting_salary(posting):
+    salary = posting.get("baseSalary")
+    if not isinstance(salary, dict):
+        return None
+    value = salary.get("value")
+    if isinstance(value, dict):
+        low, high = value.get("minValue"), value.get("maxValue")
+        if low is None and value.get("value") is not None:
+            low = high = value["value"]
+        if low is None:
+            return None
+        currency = "₹ " if salary.get("currency", "INR") == "INR" else ""
+        return f"{currency}{low}-{high if high is not None else low} P.A."
+    return str(value) if value else None
+
+
+def _posting_experience(posting):
+    experience = posting.get("experienceRequirements")
+    if isinstance(experience, dict):
+        months = experience.get("monthsOfExperience")
+        if months is not None:
+            return f"{int(months) // 12} Yrs"
+        return experience.get("description")
+    return experience or None
+
+
+def job_postings(html):
+    """Every JSON-LD ``JobPosting`` object in ``html``."""
+    postings = []
+    for match in _LD_JSON_RE.finditer(html):
+        try:
+            postings.extend(_iter_job_postings(json.loads(match.group(1))))
+        except ValueError:
+            continue
+    return postings
+
+
+def jobs_from_ld_json(html, location):
+    """Jobs from the page's JSON-LD ``JobPosting`` items, or None if it has none."""
+    postings = job_postings(html)
+    if not postings:
+        return None
+    jobs = []
+    for posting in postings:
+        title = posting.get("title")
+        url = _absolute(posting.get("url"))
+        if not title or not url:
+            continue
+        organization = posting.get("hiringOrganization")
+        company = organization.get("name") if isinstance(organization, dict) else organization
+        jobs.append(
+            _job(
+                title,
+                company,
+                _posting_experience(posting),
+                _posting_salary(posting),
+                _posting_location(posting) or location,
+                url,
+            )
+        )
+    return jobs
+
+
+def jobs_from_html(html, location):
+    """
+    ``(jobs, source)`` from the first payload found in ``html``, where
+    ``source`` is "state" or "ld+json"; None when there is no payload.
+    """
+    for state in _embedded_states(html):
+        jobs = jobs_from_api_payload(state, location)
+        if jobs:
+            return jobs, "state"
+    jobs = jobs_from_ld_json(html, location)
+    if jobs:
+        return jobs, "ld+json"
+    return None
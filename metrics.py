@@ -0,0 +1,431 @@
+"""
+Minimal Prometheus-style metrics: counters, gauges and histograms rendered
+in the text exposition format by ``render()``.
+
+    SCRAPE_PHASE_SECONDS.labels(phase="page_load").observe(1.2)
+    with timed(SCRAPE_PHASE_SECONDS, phase="readiness_wait"):
+        ...
+
+Collectors registered with ``register_collector`` are called at render time
+and return ``{name: value}`` dicts of gauges, so components that already keep
+their own stats (driver pools, caches, queues) do not need to double-count.
+
+Under a multi-process server (gunicorn workers) each process only sees its
+own values, so a scrape of /metrics would get whichever worker answered.
+With ``METRICS_MULTIPROC_DIR`` set (``gunicorn.conf.py`` sets it up), every
+process writes a snapshot of its metrics to ``<dir>/<pid>.json`` every
+``METRICS_SYNC_INTERVAL`` seconds and on exit (``start_sync`` /
+``write_snapshot``), and ``render()`` merges all snapshots: counters and
+histograms are summed over every worker that ever ran (so totals never go
+backwards when one is replaced), while gauges and collectors are per-process
+state and are reported for live workers only, with a ``pid`` label. The
+answering worker's own numbers are always current; the others' are at most
+one sync interval old.
+
+Configuration (environment variables):
+  METRICS_MULTIPROC_DIR  directory shared by the server's processes; unset for
+                         a single process (default)
+  METRICS_SYNC_INTERVAL  seconds between snapshot writes per process (default 5)
+"""
+
+import glob
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_metrics = []
+_collectors = []
+_registry_lock = threading.Lock()
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _metrics.append(self)
+
+    def labels(self, **labels):
+        key = tuple((name, labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+            return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            lines.extend(child.render(self.name, key))
+        return lines
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def state(self):
+        return self.value
+
+    def render(self, name, key):
+        return _value_lines(name, key, self.value)
+
+
+class _GaugeChild(_CounterChild):
+    def set(self, value):
+        with self._lock:
+            self.value = value
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+
+class _HistogramChild:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+
+    def state(self):
+        with self._lock:
+            return {"counts": list(self.counts), "sum": self.sum, "count": self.count}
+
+    def render(self, name, key):
+        return _histogram_lines(name, key, self.buckets, self.state())
+
+
+def _value_lines(name, key, value):
+    return [f"{name}{_format_labels(key)} {_format_value(value)}"]
+
+
+def _histogram_lines(name, key, buckets, state):
+    lines = []
+    for bound, n in zip(buckets, state["counts"]):
+        labels = key + (("le", _format_value(float(bound))),)
+        lines.append(f"{name}_bucket{_format_labels(labels)} {n}")
+    count = state["count"]
+    lines.append(f"{name}_bucket{_format_labels(key + (('le', '+Inf'),))} {count}")
+    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(state['sum'])}")
+    lines.append(f"{name}_count{_format_labels(key)} {count}")
+    return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value):
+        self.labels().set(value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help_text, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value):
+        self.labels().observe(value)
+
+
+@contextmanager
+def timed(histogram, **labels):
+    """Observe the duration of the ``with`` block in ``histogram``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(**labels).observe(time.perf_counter() - started)
+
+
+def register_collector(name, help_text, collect):
+    """
+    Export ``collect()`` -> ``{label_value: number}`` as gauge ``name`` with
+    a single ``key`` label, evaluated at render time.
+    """
+    with _registry_lock:
+        _collectors.append((name, help_text, collect))
+
+
+def _collect(collect):
+    """A collector's numeric values, or {} when it fails."""
+    try:
+        values = collect()
+    except Exception:
+        return {}
+    return {
+        key: value
+        for key, value in values.items()
+        if not isinstance(value, bool) and isinstance(value, (int, float))
+    }
+
+
+def render():
+    """All metrics in Prometheus text exposition format."""
+    if multiproc_dir():
+        return _render_multiprocess()
+    with _registry_lock:
+        metrics = list(_metrics)
+        collectors = list(_collectors)
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    for name, help_text, collect in collectors:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for key, value in _collect(collect).items():
+            lines.extend(_value_lines(name, (("key", key),), value))
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------- #
+# Multi-process aggregation
+# ---------------------------------------------------------------------- #
+_sync_thread = None
+
+
+def multiproc_dir():
+    return os.getenv("METRICS_MULTIPROC_DIR") or None
+
+
+def snapshot():
+    """This process's metrics and collector values as JSON-serialisable data."""
+    with _registry_lock:
+        metrics = list(_metrics)
+        collectors = list(_collectors)
+    data = {"pid": os.getpid(), "metrics": [], "collectors": []}
+    for metric in metrics:
+        with metric._lock:
+            children = list(metric._children.items())
+        data["metrics"].append(
+            {
+                "name": metric.name,
+                "help": metric.help,
+                "kind": metric.kind,
+                "buckets": list(getattr(metric, "buckets", ())),
+                "children": [[list(map(list, key)), child.state()] for key, child in children],
+            }
+        )
+    for name, help_text, collect in collectors:
+        data["collectors"].append({"name": name, "help": help_text, "values": _collect(collect)})
+    return data
+
+
+def write_snapshot():
+    """Write this process's snapshot to ``METRICS_MULTIPROC_DIR`` (no-op when unset)."""
+    directory = multiproc_dir()
+    if not directory:
+        return
+    path = os.path.join(directory, f"{os.getpid()}.json")
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot(), f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[Metrics] Could not write snapshot to {path}: {e}")
+
+
+def start_sync(interval=None):
+    """Write snapshots every ``interval`` seconds in the background (multi-process mode only)."""
+    global _sync_thread
+    if not multiproc_dir():
+        return
+    interval = float(os.getenv("METRICS_SYNC_INTERVAL", 5)) if interval is None else interval
+
+    def sync():
+        while True:
+            write_snapshot()
+            time.sleep(interval)
+
+    with _registry_lock:
+        if _sync_thread is None:
+            _sync_thread = threading.Thread(target=sync, name="metrics-sync", daemon=True)
+            _sync_thread.start()
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _load_snapshots(directory):
+    snapshots = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+def _render_multiprocess():
+    write_snapshot()
+    snapshots = _load_snapshots(multiproc_dir())
+    me = os.getpid()
+    live_pids = {s["pid"] for s in snapshots if s["pid"] == me or _alive(s["pid"])}
+
+    merged = {}  # name -> {"help", "kind", "buckets", "children": {key: state}}
+    for snap in snapshots:
+        for metric in snap["metrics"]:
+            entry = merged.setdefault(metric["name"], {**metric, "children": {}})
+            is_live = snap["pid"] in live_pids
+            for key, state in metric["children"]:
+                key = tuple(map(tuple, key))
+                if metric["kind"] == "gauge":
+                    if is_live:
+                        entry["children"][key + (("pid", snap["pid"]),)] = state
+                elif metric["kind"] == "histogram":
+                    total = entry["children"].get(key)
+                    if total is None:
+                        entry["children"][key] = {
+                            "counts": list(state["counts"]),
+                            "sum": state["sum"],
+                            "count": state["count"],
+                        }
+                    else:
+                        total["counts"] = [a + b for a, b in zip(total["counts"], state["counts"])]
+                        total["sum"] += state["sum"]
+                        total["count"] += state["count"]
+                else:
+                    entry["children"][key] = entry["children"].get(key, 0) + state
+
+    lines = []
+    for name, entry in merged.items():
+        lines.append(f"# HELP {name} {entry['help']}")
+        lines.append(f"# TYPE {name} {entry['kind']}")
+        for key, state in entry["children"].items():
+            if entry["kind"] == "histogram":
+                lines.extend(_histogram_lines(name, key, entry["buckets"], state))
+            else:
+                lines.extend(_value_lines(name, key, state))
+
+    collectors = {}  # name -> (help, [(pid, values)])
+    for snap in snapshots:
+        if snap["pid"] not in live_pids:
+            continue
+        for collector in snap["collectors"]:
+            help_text, per_pid = collectors.setdefault(collector["name"], (collector["help"], []))
+            per_pid.append((snap["pid"], collector["values"]))
+    for name, (help_text, per_pid) in collectors.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for pid, values in per_pid:
+            for key, value in values.items():
+                lines.extend(_value_lines(name, (("key", key), ("pid", pid)), value))
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------- #
+# Metrics shared by the scraper, apply helpers and the API
+# ---------------------------------------------------------------------- #
+SCRAPE_PHASE_SECONDS = Histogram(
+    "naukri_scrape_phase_seconds",
+    "Time spent in each phase of a scrape.",
+    ["phase"],
+)
+SCRAPE_SELECTOR_MATCHES = Counter(
+    "naukri_scrape_selector_matches_total",
+    "Which job selector matched the results page (\"none\" when none did).",
+    ["selector"],
+)
+SCRAPE_FALLBACKS = Counter(
+    "naukri_scrape_fallbacks_total",
+    "Scrapes that fell back to a simpler extraction path.",
+    ["kind"],
+)
+SCRAPE_JOBS = Counter(
+    "naukri_scrape_jobs_total",
+    "Jobs extracted, by scraper backend.",
+    ["backend"],
+)
+ENRICH_DETAILS = Counter(
+    "naukri_enrich_details_total",
+    "Job detail lookups by outcome (fresh, not_modified, reused, fetched, failed).",
+    ["outcome"],
+)
+APPLY_STAGE_SECONDS = Histogram(
+    "naukri_apply_stage_seconds",
+    "Time spent in each stage of an apply.",
+    ["stage"],
+)
+APPLY_RESULTS = Counter(
+    "naukri_apply_results_total",
+    "Apply attempts by outcome.",
+    ["outcome"],
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "naukri_http_request_seconds",
+    "API request latency by endpoint and status.",
+    ["endpoint", "method", "status"],
+)
@@ -1,508 +1,1253 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+# Selenium (and cryptography, through ``session_store``) is imported inside
+# the functions that drive a browser, so the simple and async backends work
+# without them installed (see ``backends``)
+from bs4 import BeautifulSoup, FeatureNotFound
+from backends import browser_available
+from browser_budget import BrowserBudgetExhausted
+from driver_pool import get_pool
+from page_readiness import wait_for_tuples
+from job_store import get_job_store
+from field_classifier import classify, classify_batch, classify_fields
+from host_limits import get_host_limiter
+from json_state import jobs_from_html
+from rate_limiter import RetriesExhausted, RetryableError, check_status, get_rate_limiter
+from strategy_cache import StrategyTally, get_strategy_cache
+from dedup import get_dedup_index
+from metrics import (
+    APPLY_RESULTS,
+    APPLY_STAGE_SECONDS,
+    SCRAPE_FALLBACKS,
+    SCRAPE_JOBS,
+    SCRAPE_PHASE_SECONDS,
+    SCRAPE_SELECTOR_MATCHES,
+    timed,
+)
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
 import requests
 import json
+import os
+import threading
 import time
 
 
-def scrape_naukri_jobs_simple(url, location, max_results=20, debug=False):
+# "standard" loads pages like a normal browser; "lite" skips everything the
+# scraper never reads (images, fonts, stylesheets, trackers) and hands the page
+# over as soon as the DOM is parsed. SCRAPE_BROWSER_PROFILE sets the default.
+BROWSER_PROFILES = ("standard", "lite")
+DEFAULT_BROWSER_PROFILE = os.getenv("SCRAPE_BROWSER_PROFILE", "standard")
+
+LITE_BLOCKED_URLS = [
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*clarity.ms*",
+]
+
+
+def _scrape_chrome_options(profile="standard"):
+    """Headless Chrome options used by the scraper's driver pools."""
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    if os.getenv("CHROME_BINARY"):
+        chrome_options.binary_location = os.environ["CHROME_BINARY"]
+    chrome_options.add_argument("--headless")  # Run in background
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    chrome_options.add_argument(
+        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+    if profile == "lite":
+        # Return from driver.get once the DOM is parsed; readiness polling
+        # waits for the tuples themselves
+        chrome_options.page_load_strategy = "eager"
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+    return chrome_options
+
+
+def _lite_driver_setup(driver):
+    """Block stylesheets, fonts, media and trackers Chrome prefs do not cover."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LITE_BLOCKED_URLS})
+
+
+def _apply_chrome_options():
+    """Visible Chrome options used by the apply helper's driver pool."""
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    if os.getenv("CHROME_BINARY"):
+        chrome_options.binary_location = os.environ["CHROME_BINARY"]
+    # For local debugging it's helpful to see the browser; change to headless if desired
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    return chrome_options
+
+
+def get_scrape_pool(profile=None):
+    """The scrape driver pool for browser ``profile`` (see ``BROWSER_PROFILES``)."""
+    profile = profile or DEFAULT_BROWSER_PROFILE
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile {profile!r}, expected one of {BROWSER_PROFILES}")
+    if profile == "lite":
+        return get_pool(
+            "scrape-lite", lambda: _scrape_chrome_options("lite"), setup=_lite_driver_setup
+        )
+    return get_pool("scrape", _scrape_chrome_options)
+
+
+def get_apply_pool():
+    return get_pool("apply", _apply_chrome_options)
+
+
+SIMPLE_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+# Naukri shows 20 tuples per results page
+RESULTS_PER_PAGE = 20
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session(pool_size=8):
+    """Shared keep-alive ``requests.Session`` for the simple scraper."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(SIMPLE_HEADERS)
+            _http_session = session
+        return _http_session
+
+
+def _navigate(driver, url, debug=False):
+    """
+    ``driver.get(url)`` under the shared rate limit, retried on page-load
+    timeouts. Raises ``RetriesExhausted`` once the retries are used up.
+    """
+    from selenium.common.exceptions import TimeoutException
+
+    try:
+        get_rate_limiter().call(lambda: driver.get(url), retry_on=(TimeoutException,), debug=debug)
+    except TimeoutException as e:
+        raise RetriesExhausted(url, e) from e
+
+
+def normalize_query(keywords, location):
+    """``(search_query, location)`` exactly as they appear in the search URL."""
+    return keywords.lower().replace(" ", "-"), location.lower()
+
+
+# Origin of the search pages (a stand-in site for load tests)
+NAUKRI_BASE_URL = os.getenv("NAUKRI_BASE_URL", "https://www.naukri.com").rstrip("/")
+
+
+def build_search_url(keywords, location):
+    """Naukri search URL for a keywords/location pair."""
+    search_query, location = normalize_query(keywords, location)
+    return f"{NAUKRI_BASE_URL}/{search_query}-jobs-in-{location}"
+
+
+def results_page_url(url, page):
+    """URL of results page ``page`` (1-based): ``...-jobs-in-mumbai-2`` etc."""
+    if page <= 1:
+        return url
+    base, sep, query = url.partition("?")
+    return f"{base}-{page}{sep}{query}"
+
+
+def _parse_simple_page(html, location, limit, debug=False):
+    """
+    Jobs found on one results page, in page order, at most ``limit``. Uses
+    the same extraction as the browser path (embedded JSON, then job tuples,
+    then bare links), so both backends return identical fields.
+    """
+    return extract_jobs_from_html(html, location, limit, debug)
+
+
+def _filter_known(store, page_jobs):
+    """
+    Record ``page_jobs`` in ``store`` and drop the ones it already had.
+    Returns ``(new_jobs, all_known)``.
+    """
+    known = store.known_urls([job["url"] for job in page_jobs])
+    store.upsert_jobs(page_jobs)
+    new_jobs = [job for job in page_jobs if job["url"] not in known]
+    return new_jobs, not new_jobs
+
+
+def _fetch_simple_page(session, url, location, limit, debug=False):
+    if debug:
+        print(f"[Fallback] Fetching URL via requests: {url}")
+
+    def fetch():
+        with get_host_limiter().slot(url), timed(SCRAPE_PHASE_SECONDS, phase="http_fetch"):
+            resp = session.get(url, timeout=20)
+        check_status(resp.status_code, resp.headers.get("Retry-After"))
+        resp.raise_for_status()
+        return resp.text
+
+    try:
+        html = get_rate_limiter().call(
+            fetch, retry_on=(requests.Timeout, requests.ConnectionError), debug=debug
+        )
+    except (RetryableError, requests.Timeout, requests.ConnectionError) as e:
+        raise RetriesExhausted(url, e) from e
+    with timed(SCRAPE_PHASE_SECONDS, phase="parse"):
+        return _parse_simple_page(html, location, limit, debug)
+
+
+def iter_naukri_jobs_simple(
+    url,
+    location,
+    max_results=20,
+    debug=False,
+    workers=4,
+    max_pages=10,
+    session=None,
+    store=None,
+    incremental=False,
+):
+    """
+    Generator version of ``scrape_naukri_jobs_simple``: yields each job as
+    soon as its page has been fetched, parsed and merged in page order.
+    Raises ``RetriesExhausted`` when merging reaches a page that still
+    failed after its retries (the jobs of earlier pages have been yielded).
+    """
+    session = session or get_http_session()
+    workers = max(1, int(workers))
+    if incremental and store is None:
+        store = get_job_store()
+
+    count = 0
+    # Drops jobs (by job id) already returned by this call
+    dedup = get_dedup_index().session()
+    # page number -> list of jobs, None when the page does not exist (or
+    # could not be parsed), RetriesExhausted when it could not be fetched
+    page_results = {}
+    next_to_merge = 1
+    next_to_fetch = 1
+    last_page = max_pages
+    in_flight = {}
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    def fill():
+        nonlocal next_to_fetch
+        while (
+            len(in_flight) < workers
+            and next_to_fetch <= last_page
+            # Only fetch as many pages as the remaining results need
+            and count + RESULTS_PER_PAGE * (len(in_flight) + len(page_results))
+            < max_results
+        ):
+            page = next_to_fetch
+            future = executor.submit(
+                _fetch_simple_page,
+                session,
+                results_page_url(url, page),
+                location,
+                max_results,
+                debug,
+            )
+            in_flight[future] = page
+            next_to_fetch += 1
+
+    try:
+        fill()
+        done = False
+        while in_flight and not done:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                page = in_flight.pop(future)
+                try:
+                    page_results[page] = future.result()
+                except RetriesExhausted as e:
+                    page_results[page] = e
+                except Exception as e:
+                    if debug:
+                        print(f"[Fallback] Error fetching page {page}: {e}")
+                    page_results[page] = None
+
+            # Merge finished pages in order
+            while not done and next_to_merge in page_results:
+                page_jobs = page_results.pop(next_to_merge)
+                if isinstance(page_jobs, RetriesExhausted):
+                    # Ending here would pass for a short result set
+                    raise page_jobs
+                if not page_jobs:
+                    # Empty or missing page: there are no results beyond this one
+                    last_page = min(last_page, next_to_merge)
+                    done = True
+                    break
+                if incremental:
+                    page_jobs, all_known = _filter_known(store, page_jobs)
+                    if all_known:
+                        if debug:
+                            print(f"[Fallback] Page {next_to_merge} is already known, stopping")
+                        last_page = next_to_merge
+                        done = True
+                        break
+                for job in page_jobs:
+                    if not dedup.accept(job):
+                        continue
+                    count += 1
+                    SCRAPE_JOBS.labels(backend="simple").inc()
+                    yield job
+                    if count >= max_results:
+                        done = True
+                        break
+                next_to_merge += 1
+            done = done or next_to_merge > last_page
+            if not done:
+                fill()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if debug:
+        print(f"[Fallback] Returning {count} jobs from {next_to_merge - 1} page(s)")
+
+
+def scrape_naukri_jobs_simple(
+    url,
+    location,
+    max_results=20,
+    debug=False,
+    workers=4,
+    max_pages=10,
+    session=None,
+    store=None,
+    incremental=False,
+):
     """
     Simpler fallback scraper that uses requests + BeautifulSoup only.
     This is used in environments (like Railway) where Chrome is not available.
+
+    Result pages (``url``, ``url-2``, ``url-3``, ...) are fetched concurrently
+    by up to ``workers`` threads over one keep-alive session. Fetching stops
+    once ``max_results`` unique jobs are collected, a page comes back empty or
+    ``max_pages`` is reached; jobs are returned in page order. A page that
+    is still throttled or failing after its retries raises
+    ``RetriesExhausted`` instead of cutting the results short.
+
+    With ``incremental=True`` every page is recorded in ``store`` (a
+    ``JobStore``), only jobs not already stored are returned, and pagination
+    stops at the first page whose jobs are all known.
+
+    Repeats of a job id are dropped; every job carries ``dup_group`` and
+    ``near_duplicate`` from the shared ``dedup`` index.
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
+    return list(
+        iter_naukri_jobs_simple(
+            url,
+            location,
+            max_results,
+            debug,
+            workers=workers,
+            max_pages=max_pages,
+            session=session,
+            store=store,
+            incremental=incremental,
         )
-    }
+    )
+
+
+def iter_naukri_search_simple(
+    keywords,
+    location,
+    max_results=20,
+    debug=False,
+    store=None,
+    incremental=False,
+    max_pages=10,
+    **browser_options,
+):
+    """
+    ``iter_naukri_jobs`` without a browser: the "simple" backend. Takes the
+    same arguments; browser-only ones (``extract_mode``, ``browser_profile``)
+    are ignored.
+    """
+    yield from iter_naukri_jobs_simple(
+        build_search_url(keywords, location),
+        location,
+        max_results,
+        debug,
+        max_pages=max_pages,
+        store=store,
+        incremental=incremental,
+    )
+
+
+# Candidate containers for a single job, most specific first
+JOB_SELECTORS = [
+    "article[class*='tuple']:not([class*='shimmer'])",
+    "div[class*='tuple']:not([class*='shimmer'])",
+    "[data-job-id]",
+    "article[class*='job']",
+    "a[href*='/job']",
+]
+# Bare job links match almost any page but lose the tuple's company,
+# experience and salary, so they are only ever tried after every container
+# selector failed on the page and are never learned as the preferred one
+GENERIC_JOB_SELECTORS = ["a[href*='/job']"]
+TUPLE_SELECTORS = [s for s in JOB_SELECTORS if s not in GENERIC_JOB_SELECTORS]
+
+
+def _job_selector_order(cache):
+    """``JOB_SELECTORS`` with the learned tuple selector first and generic ones last."""
+    return [*cache.order("selector", TUPLE_SELECTORS), *GENERIC_JOB_SELECTORS]
 
+
+def _make_soup(html):
+    """Parse with lxml when it is installed, html.parser otherwise."""
     try:
-        if debug:
-            print(f"[Fallback] Fetching URL via requests: {url}")
+        return BeautifulSoup(html, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser")
 
-        resp = requests.get(url, headers=headers, timeout=20)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-    except Exception as e:
-        if debug:
-            print(f"[Fallback] Error fetching URL: {e}")
-        return []
 
-    jobs = []
-    seen_urls = set()
+def _has_comp_class(x):
+    return x and 'comp' in str(x).lower()
 
-    # Heuristic: job links usually contain "job-listings" or related patterns in the path
-    job_links = soup.find_all(
-        "a",
-        href=lambda x: x
-        and (
-            "/job-listings" in x
-            or "/job-" in x
-            or "/job/" in x
-        ),
-    )[: max_results * 3]
 
-    if debug:
-        print(f"[Fallback] Found {len(job_links)} potential job links")
+def _company_from_text(soup_elem, links, get_text):
+    """Company from the tuple's text lines (usually right after the title)."""
+    all_text = get_text()
+    if all_text:
+        lines = [line.strip() for line in all_text.split('\n') if line.strip() and len(line.strip()) > 2]
+        # Company usually appears in second or third line
+        if len(lines) > 1:
+            potential_company = lines[1]
+            # Skip if it looks like experience or location
+            if classify(potential_company) is None:
+                return potential_company
+    return None
 
-    for link in job_links:
-        try:
-            job_url = link.get("href", "")
-            if not job_url:
-                continue
 
-            if not job_url.startswith("http"):
-                job_url = f"https://www.naukri.com{job_url}"
+def _element_text(elem):
+    return elem.text.strip() if elem is not None else None
+
+
+# Ways to find a tuple's title link, in default order. ``links`` are the
+# tuple's <a> elements (the tuple itself first when it is the link).
+TITLE_LINK_STRATEGIES = {
+    'title_attr': lambda links: next((a for a in links if a.has_attr('title')), None),
+    'job_href': lambda links: next((a for a in links if '/job' in str(a.get('href'))), None),
+    'title_class': lambda links: next(
+        (a for a in links if 'title' in str(a.get('class', '')).lower()), None
+    ),
+    'first_link': lambda links: links[0] if links else None,
+}
+
+# Ways to find a tuple's company name, in default order
+COMPANY_STRATEGIES = {
+    'comp_link': lambda soup_elem, links, get_text: _element_text(
+        next((a for a in links if _has_comp_class(a.get('class'))), None)
+    ),
+    'comp_span': lambda soup_elem, links, get_text: _element_text(
+        soup_elem.find('span', class_=_has_comp_class)
+    ),
+    'comp_div': lambda soup_elem, links, get_text: _element_text(
+        soup_elem.find('div', class_=_has_comp_class)
+    ),
+    'text_line': _company_from_text,
+}
+
+
+# Broad lookups that also succeed on a standard tuple but read something
+# else there (the company <div> includes the rating, the first link or text
+# line need not be the title or company). Reordering them would change what
+# is extracted, not just how fast, so they always run after the precise
+# lookups, are not tallied and are never learned as the preferred one.
+FALLBACK_TITLE_STRATEGIES = ['first_link']
+FALLBACK_COMPANY_STRATEGIES = ['comp_div', 'text_line']
+PRECISE_TITLE_STRATEGIES = [s for s in TITLE_LINK_STRATEGIES if s not in FALLBACK_TITLE_STRATEGIES]
+PRECISE_COMPANY_STRATEGIES = [s for s in COMPANY_STRATEGIES if s not in FALLBACK_COMPANY_STRATEGIES]
+
+
+class _Strategies:
+    """Lookup order for one page's tuples and the tally their outcomes go into."""
+
+    __slots__ = ('title_slot', 'company_slot', 'title', 'company', 'tally')
+
+    def __init__(self, layout, cache=None, tally=None):
+        self.title_slot = f'title:{layout}'
+        self.company_slot = f'company:{layout}'
+        self.title = cache.order(self.title_slot, PRECISE_TITLE_STRATEGIES) if cache else PRECISE_TITLE_STRATEGIES
+        self.company = cache.order(self.company_slot, PRECISE_COMPANY_STRATEGIES) if cache else PRECISE_COMPANY_STRATEGIES
+        self.tally = tally
+
+
+_DEFAULT_STRATEGIES = _Strategies('default')
+
+
+def _record_strategies(cache, tally, layout):
+    """Feed a page's tally back into the strategy cache."""
+    cache.record(tally, {
+        'selector': TUPLE_SELECTORS,
+        f'title:{layout}': PRECISE_TITLE_STRATEGIES,
+        f'company:{layout}': PRECISE_COMPANY_STRATEGIES,
+    })
+
+
+def _first_found(slot, order, fallbacks, table, tally, *args):
+    """
+    Result of the first strategy in ``order``, then in ``fallbacks``, that
+    finds something. Only the strategies in ``order`` are tallied.
+    """
+    for name in order:
+        result = table[name](*args)
+        if tally is not None:
+            tally.add(slot, name, result is not None)
+        if result is not None:
+            return result
+    for name in fallbacks:
+        result = table[name](*args)
+        if result is not None:
+            return result
+    return None
+
+
+def _parse_job_tuple(soup_elem, location, get_text, get_data_url, fields=None, strategies=None):
+    """
+    Extract one job dict from a tuple's markup.
+
+    ``get_text`` returns the tuple's visible text and ``get_data_url`` its
+    data-url/href attribute; both are only called when the markup alone is not
+    enough. ``fields`` are the tuple's already-classified span fields (see
+    ``field_classifier.classify_batch``). ``strategies`` is a ``_Strategies``
+    with the learned title/company lookup order and the tally to record
+    outcomes in. Returns None when no usable title is found.
+    """
+    strategies = strategies or _DEFAULT_STRATEGIES
+    # Look for job title link - try multiple strategies. The tuple itself may
+    # be the link (e.g. the "a[href*='/job']" selector).
+    links = ([soup_elem] if soup_elem.name == 'a' else []) + soup_elem.find_all('a')
+    title_link = _first_found(
+        strategies.title_slot, strategies.title, FALLBACK_TITLE_STRATEGIES,
+        TITLE_LINK_STRATEGIES, strategies.tally, links,
+    )
+
+    title = ''
+    job_url = None
+    if title_link:
+        title = title_link.get('title', '').strip() or title_link.text.strip()
+        job_url = title_link.get('href', '')
+
+    # If no title found, try other methods
+    if not title:
+        h2 = soup_elem.find('h2')
+        if h2:
+            title = h2.text.strip()
+
+    if not title:
+        # Try getting first meaningful text from the element
+        all_text = get_text()
+        if all_text:
+            # Get first line that's not empty and has some content
+            lines = [line.strip() for line in all_text.split('\n') if line.strip()]
+            if lines:
+                title = lines[0]
+                # If first line is too short, try second
+                if len(title) < 5 and len(lines) > 1:
+                    title = lines[1]
+
+    if not title or len(title) < 3:
+        return None
+
+    # Try to find company - multiple strategies
+    company = _first_found(
+        strategies.company_slot, strategies.company, FALLBACK_COMPANY_STRATEGIES,
+        COMPANY_STRATEGIES, strategies.tally, soup_elem, links, get_text,
+    )
+    if company is None:
+        company = 'Not specified'
+
+    # Experience, salary, location from spans
+    if fields is None:
+        fields = classify_fields((span.text for span in soup_elem.find_all('span')), location)
+
+    # Fix job URL
+    if job_url:
+        if not job_url.startswith('http'):
+            job_url = f'https://www.naukri.com{job_url}'
+    else:
+        # Try to find URL from data attributes or other links
+        data_url = get_data_url()
+        if data_url:
+            job_url = data_url if data_url.startswith('http') else f'https://www.naukri.com{data_url}'
+        else:
+            job_url = 'N/A'
+
+    return {
+        'title': title,
+        'company': company,
+        **fields,
+        'url': job_url,
+        'platform': 'Naukri'
+    }
+
+
+def _parse_job_links(soup, location, max_results):
+    """Last-resort extraction from bare job links when no tuples matched."""
+    jobs = []
+    job_links = soup.find_all('a', href=lambda x: x and '/job' in x)
+
+    # Extract unique jobs from links
+    seen_urls = set()
+    for link in job_links[:max_results * 2]:  # Get more to account for duplicates
+        try:
+            job_url = link.get('href', '')
+            if not job_url.startswith('http'):
+                job_url = f'https://www.naukri.com{job_url}'
 
             if job_url in seen_urls:
                 continue
             seen_urls.add(job_url)
 
-            title = link.get("title") or link.text.strip()
-            if not title or len(title) < 3:
+            # Try to find title
+            title = link.get('title', '') or link.text.strip()
+            if not title:
                 continue
 
-            parent = link.find_parent(["article", "div"]) or soup
-            company = "Not specified"
-            experience = "Not specified"
-            salary = "Not disclosed"
-            job_location = location
+            # Try to find parent container for other details
+            parent = link.find_parent(['article', 'div'])
+            company = 'Not specified'
+            span_texts = []
 
-            # Company name
-            comp_elem = parent.find(
-                ["a", "span", "div"],
-                class_=lambda c: c and "comp" in str(c).lower(),
-            )
-            if comp_elem:
-                company = comp_elem.text.strip()
-
-            # Other metadata
-            for span in parent.find_all("span"):
-                text = span.text.strip()
-                lower = text.lower()
-                if any(x in lower for x in ["yr", "year", "exp"]):
-                    experience = text
-                elif any(x in lower for x in ["lakh", "crore", "salary", "pa"]):
-                    salary = text
-                elif any(
-                    city in lower
-                    for city in [
-                        "bangalore",
-                        "mumbai",
-                        "delhi",
-                        "hyderabad",
-                        "pune",
-                        "chennai",
-                        "gurgaon",
-                        "noida",
-                    ]
-                ):
-                    job_location = text
-
-            jobs.append(
-                {
-                    "title": title,
-                    "company": company,
-                    "experience": experience,
-                    "salary": salary,
-                    "location": job_location,
-                    "url": job_url,
-                    "platform": "Naukri",
-                }
-            )
+            if parent:
+                # Try to find company
+                company_elem = parent.find(['a', 'span'], class_=_has_comp_class)
+                if company_elem:
+                    company = company_elem.text.strip()
+
+                # Try to find experience, salary, location
+                span_texts = [span.text for span in parent.find_all('span')]
+
+            jobs.append({
+                'title': title,
+                'company': company,
+                **classify_fields(span_texts, location),
+                'url': job_url,
+                'platform': 'Naukri'
+            })
 
             if len(jobs) >= max_results:
                 break
+        except:
+            continue
+
+    return jobs
+
+
+def _iter_collected(candidates, location, max_results, stats, debug=False, strategies=None):
+    """
+    Run ``_parse_job_tuple`` over ``(soup_elem, get_text, get_data_url)``
+    candidates (optionally with a fourth, pre-classified ``fields`` item),
+    yielding unique jobs until ``max_results`` are found.
+    ``stats`` receives the extracted/skipped counts.
+    """
+    seen_urls = set()
+    stats.setdefault('extracted', 0)
+    stats.setdefault('skipped', 0)
+    for soup_elem, get_text, get_data_url, *fields in candidates:
+        try:
+            with timed(SCRAPE_PHASE_SECONDS, phase="extract_element"):
+                job = _parse_job_tuple(
+                    soup_elem, location, get_text, get_data_url, *fields, strategies=strategies
+                )
+            if job is None:
+                stats['skipped'] += 1
+                if debug and stats['skipped'] <= 3:  # Only show first few skipped items
+                    print(f"Skipping job element {stats['skipped']}: No valid title found")
+                continue
+
+            # Skip duplicates
+            if job['url'] in seen_urls or job['url'] == 'N/A':
+                continue
+            seen_urls.add(job['url'])
 
         except Exception as e:
             if debug:
-                print(f"[Fallback] Error parsing job link: {e}")
+                print(f"Error parsing job: {str(e)}")
+            stats['skipped'] += 1
             continue
 
+        stats['extracted'] += 1
+        yield job
+
+        if stats['extracted'] >= max_results:
+            break
+
+
+def _collect_jobs(candidates, location, max_results, debug=False):
+    """List version of ``_iter_collected``: returns ``(jobs, skipped_count)``."""
+    stats = {}
+    jobs = list(_iter_collected(candidates, location, max_results, stats, debug))
+    return jobs, stats['skipped']
+
+
+def _print_extraction_summary(total, stats):
+    print(f"\nExtraction Summary:")
+    print(f"  Total elements found: {total}")
+    print(f"  Successfully extracted: {stats.get('extracted', 0)}")
+    print(f"  Skipped (no title/duplicates/errors): {stats.get('skipped', 0)}")
+
+
+def _iter_json_jobs(html, location, max_results, debug=False):
+    """
+    Jobs from the page's embedded JSON payload (see ``json_state``), or None
+    when it has none and the DOM has to be read instead.
+    """
+    with timed(SCRAPE_PHASE_SECONDS, phase="json_parse"):
+        found = jobs_from_html(html, location)
+    if found is None:
+        SCRAPE_FALLBACKS.labels(kind="dom").inc()
+        if debug:
+            print("No embedded job JSON, reading the DOM")
+        return None
+    jobs, source = found
+    SCRAPE_SELECTOR_MATCHES.labels(selector=f"json:{source}").inc()
     if debug:
-        print(f"[Fallback] Returning {len(jobs)} jobs")
+        print(f"Found {len(jobs)} jobs in embedded JSON ({source})")
+    unique = {}
+    for job in jobs:
+        unique.setdefault(job['url'], job)
+    return list(unique.values())[:max_results]
 
-    return jobs
 
+def iter_jobs_from_html(html, location, max_results=20, debug=False, use_json=True):
+    """
+    Extract jobs from a full results page in a single pass.
 
-def scrape_naukri_jobs(keywords, location, max_results=20, debug=False):
-    """Naukri scraper using Selenium to handle JavaScript-rendered content."""
+    With ``use_json`` the page's embedded JSON state / JSON-LD is decoded
+    first and the DOM is only read when there is none. Otherwise the page is
+    parsed once (lxml when available) and every tuple is read from that one
+    tree, so no per-element WebDriver round trips are needed.
+    Works on ``driver.page_source`` as well as on saved pages.
+    """
+    if use_json:
+        jobs = _iter_json_jobs(html, location, max_results, debug)
+        if jobs is not None:
+            yield from jobs
+            return
 
-    search_query = keywords.lower().replace(" ", "-")
-    url = f"https://www.naukri.com/{search_query}-jobs-in-{location.lower()}"
+    with timed(SCRAPE_PHASE_SECONDS, phase="parse"):
+        soup = _make_soup(html)
 
-    # Setup Chrome options
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run in background
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option("useAutomationExtension", False)
-    chrome_options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
+    # Try the selector that worked on recent pages first
+    cache = get_strategy_cache()
+    tally = StrategyTally()
+    job_elements = []
+    matched = "none"
+    with timed(SCRAPE_PHASE_SECONDS, phase="selector_probe"):
+        for selector in _job_selector_order(cache):
+            job_elements = [
+                e for e in soup.select(selector)
+                if 'shimmer' not in ' '.join(e.get('class', []))
+            ]
+            if selector in TUPLE_SELECTORS:
+                tally.add("selector", selector, bool(job_elements))
+            if job_elements:
+                matched = selector
+                if debug:
+                    print(f"Found {len(job_elements)} job elements using selector: {selector}")
+                break
+    SCRAPE_SELECTOR_MATCHES.labels(selector=matched).inc()
 
-    driver = None
-    try:
+    if not job_elements:
+        _record_strategies(cache, tally, matched)
         if debug:
-            print(f"Fetching URL: {url}")
+            print("Trying BeautifulSoup fallback...")
+        SCRAPE_FALLBACKS.labels(kind="bs4_links").inc()
+        yield from _parse_job_links(soup, location, max_results)
+        return
 
-        # Initialize Chrome driver
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as chrome_error:
-            # In environments without Chrome (e.g. Railway), fall back to requests-based scraping
-            if debug:
-                print("Chrome WebDriver failed, falling back to simple scraper.")
-                print(f"Chrome error: {chrome_error}")
-            return scrape_naukri_jobs_simple(url, location, max_results, debug)
-        
+    strategies = _Strategies(matched, cache, tally)
+    # Get more to account for duplicates and invalid entries
+    tuples = job_elements[:max_results * 3]
+    # Classify the span texts of every tuple on the page in one pass
+    page_fields = classify_batch(
+        ([span.text for span in elem.find_all('span')] for elem in tuples), location
+    )
+    candidates = (
+        (
+            elem,
+            lambda elem=elem: elem.get_text('\n').strip(),
+            lambda elem=elem: elem.get('data-url') or elem.get('href'),
+            fields,
+        )
+        for elem, fields in zip(tuples, page_fields)
+    )
+    stats = {}
+    try:
+        yield from _iter_collected(candidates, location, max_results, stats, debug, strategies)
+    finally:
+        _record_strategies(cache, tally, matched)
+
+    if debug:
+        _print_extraction_summary(len(job_elements), stats)
+
+
+def extract_jobs_from_html(html, location, max_results=20, debug=False, use_json=True):
+    """List version of ``iter_jobs_from_html``."""
+    return list(iter_jobs_from_html(html, location, max_results, debug, use_json))
+
+
+def _element_candidates(job_elements):
+    """Per-element candidates for the WebDriver extraction path."""
+    for job_elem in job_elements:
+        # Get the HTML of this element and parse it
+        elem_html = job_elem.get_attribute('outerHTML')
+        soup_elem = BeautifulSoup(elem_html, 'html.parser')
+        text_cache = []
+
+        def get_text(job_elem=job_elem, text_cache=text_cache):
+            if not text_cache:
+                text_cache.append(job_elem.text.strip())
+            return text_cache[0]
+
+        def get_data_url(job_elem=job_elem):
+            return job_elem.get_attribute('data-url') or job_elem.get_attribute('href')
+
+        yield soup_elem, get_text, get_data_url
+
+
+def _iter_page(driver, url, location, max_results, extract_mode, debug=False):
+    """Load one results page in ``driver`` and yield its jobs."""
+    from selenium.webdriver.common.by import By
+
+    # The page keeps loading (search XHRs) until its tuples are ready, so the
+    # host slot covers both navigation and the readiness wait
+    with get_host_limiter().slot(url):
         # Navigate to the page
-        driver.get(url)
-        
+        with timed(SCRAPE_PHASE_SECONDS, phase="page_load"):
+            _navigate(driver, url, debug)
+
         if debug:
             print(f"Page loaded. Waiting for job listings...")
-        
-        # Wait for job listings to load (try multiple selectors)
-        wait = WebDriverWait(driver, 20)
-        
-        # Wait for shimmer/loading to disappear and actual content to load
-        if debug:
-            print("Waiting for page to fully load...")
-        
-        # Wait a bit for initial page load
-        time.sleep(5)
-        
-        # Try to wait for actual job content (not shimmer)
-        try:
-            # Wait for job title links to appear (actual content, not shimmer)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a[title*='job'], a[href*='/job'], article[class*='tuple']:not([class*='shimmer'])")))
-            if debug:
-                print("Job listings detected!")
-            # Give additional time for all jobs to render
-            time.sleep(3)
-        except:
-            # Give it more time for JavaScript to render
-            if debug:
-                print("Waiting additional time for content to load...")
-            time.sleep(5)
-        
-        # Try to find job listings using Selenium directly (more reliable for dynamic content)
-        jobs = []
-        
-        # Try multiple CSS selectors to find job listings
-        job_selectors = [
-            "article[class*='tuple']:not([class*='shimmer'])",
-            "div[class*='tuple']:not([class*='shimmer'])",
-            "a[href*='/job']",
-            "[data-job-id]",
-            "article[class*='job']",
-        ]
-        
-        job_elements = []
-        for selector in job_selectors:
+
+        # Poll until tuples have rendered (or stopped changing) instead of
+        # sleeping for a fixed amount of time
+        with timed(SCRAPE_PHASE_SECONDS, phase="readiness_wait"):
+            readiness = wait_for_tuples(driver, target_count=max_results, timeout=20, debug=debug)
+    if debug:
+        if readiness["ready"]:
+            print(f"Job listings detected! ({readiness['count']} after {readiness['waited']}s)")
+        else:
+            print(f"No job listings after {readiness['waited']}s, trying selectors anyway...")
+
+    if extract_mode in ("json", "snapshot"):
+        with timed(SCRAPE_PHASE_SECONDS, phase="page_source"):
+            html = driver.page_source
+        yield from iter_jobs_from_html(
+            html, location, max_results, debug, use_json=extract_mode == "json"
+        )
+        return
+    
+    # Try to find job listings using Selenium directly (more reliable for dynamic content).
+    # Each probe is a round trip, so the selector that worked on recent pages goes first.
+    cache = get_strategy_cache()
+    tally = StrategyTally()
+    job_elements = []
+    matched = "none"
+    with timed(SCRAPE_PHASE_SECONDS, phase="selector_probe"):
+        for selector in _job_selector_order(cache):
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 # Filter out shimmer/loading elements
                 job_elements = [e for e in elements if 'shimmer' not in e.get_attribute('class') or '']
+                if selector in TUPLE_SELECTORS:
+                    tally.add("selector", selector, bool(job_elements))
                 if len(job_elements) > 0:
+                    matched = selector
                     if debug:
                         print(f"Found {len(job_elements)} job elements using selector: {selector}")
                     break
             except:
+                if selector in TUPLE_SELECTORS:
+                    tally.add("selector", selector, False)
                 continue
-        
-        if len(job_elements) == 0:
-            # Fallback: Get page source and parse with BeautifulSoup
-            if debug:
-                print("Trying BeautifulSoup fallback...")
-            page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Try finding job links
-            job_links = soup.find_all('a', href=lambda x: x and '/job' in x)
+    SCRAPE_SELECTOR_MATCHES.labels(selector=matched).inc()
+    
+    if len(job_elements) == 0:
+        _record_strategies(cache, tally, matched)
+        # Fallback: Get page source and parse with BeautifulSoup
+        if debug:
+            print("Trying BeautifulSoup fallback...")
+        SCRAPE_FALLBACKS.labels(kind="bs4_links").inc()
+        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        yield from _parse_job_links(soup, location, max_results)
+        return
+    
+    # Extract job information from Selenium elements
+    # Get more to account for duplicates and invalid entries
+    candidates = _element_candidates(job_elements[:max_results * 3])
+    stats = {}
+    try:
+        yield from _iter_collected(
+            candidates, location, max_results, stats, debug,
+            _Strategies(matched, cache, tally),
+        )
+    finally:
+        _record_strategies(cache, tally, matched)
+    
+    if debug:
+        _print_extraction_summary(len(job_elements), stats)
+
+
+def _iter_incremental(driver, url, location, max_results, extract_mode, store, max_pages, debug=False):
+    """Walk result pages until ``max_results`` new jobs or a fully known page."""
+    count = 0
+    seen_urls = set()
+    for page in range(1, max_pages + 1):
+        page_jobs = list(_iter_page(
+            driver, results_page_url(url, page), location, max_results, extract_mode, debug
+        ))
+        if not page_jobs:
+            break
+        new_jobs, all_known = _filter_known(store, page_jobs)
+        if all_known:
             if debug:
-                print(f"Found {len(job_links)} job links in HTML")
-            
-            # Extract unique jobs from links
-            seen_urls = set()
-            for link in job_links[:max_results * 2]:  # Get more to account for duplicates
-                try:
-                    job_url = link.get('href', '')
-                    if not job_url.startswith('http'):
-                        job_url = f'https://www.naukri.com{job_url}'
-                    
-                    if job_url in seen_urls:
-                        continue
-                    seen_urls.add(job_url)
-                    
-                    # Try to find title
-                    title = link.get('title', '') or link.text.strip()
-                    if not title:
-                        continue
-                    
-                    # Try to find parent container for other details
-                    parent = link.find_parent(['article', 'div'])
-                    company = 'Not specified'
-                    experience = 'Not specified'
-                    salary = 'Not disclosed'
-                    job_location = location
-                    
-                    if parent:
-                        # Try to find company
-                        company_elem = parent.find(['a', 'span'], class_=lambda x: x and 'comp' in str(x).lower())
-                        if company_elem:
-                            company = company_elem.text.strip()
-                        
-                        # Try to find experience, salary, location
-                        for span in parent.find_all('span'):
-                            text = span.text.strip().lower()
-                            if 'yr' in text or 'year' in text or 'exp' in text:
-                                experience = span.text.strip()
-                            elif 'lakh' in text or 'crore' in text or 'salary' in text:
-                                salary = span.text.strip()
-                            elif any(city in text for city in ['bangalore', 'mumbai', 'delhi', 'hyderabad', 'pune', 'chennai']):
-                                job_location = span.text.strip()
-                    
-                    jobs.append({
-                        'title': title,
-                        'company': company,
-                        'experience': experience,
-                        'salary': salary,
-                        'location': job_location,
-                        'url': job_url,
-                        'platform': 'Naukri'
-                    })
-                    
-                    if len(jobs) >= max_results:
-                        break
-                except:
-                    continue
-            
-            return jobs
-        
-        # Extract job information from Selenium elements
-        seen_urls = set()
-        skipped_count = 0
-        for job_elem in job_elements[:max_results * 3]:  # Get more to account for duplicates and invalid entries
-            try:
-                # Get the HTML of this element and parse it
-                elem_html = job_elem.get_attribute('outerHTML')
-                soup_elem = BeautifulSoup(elem_html, 'html.parser')
-                
-                # Try to find title from link
-                title = ''
-                job_url = None
-                
-                # Look for job title link - try multiple strategies
-                title_link = (soup_elem.find('a', title=True) or 
-                              soup_elem.find('a', href=lambda x: x and '/job' in str(x)) or
-                              soup_elem.find('a', class_=lambda x: x and 'title' in str(x).lower()) or
-                              soup_elem.find('a'))
-                
-                if title_link:
-                    title = title_link.get('title', '').strip() or title_link.text.strip()
-                    job_url = title_link.get('href', '')
-                
-                # If no title found, try other methods
-                if not title:
-                    h2 = soup_elem.find('h2')
-                    if h2:
-                        title = h2.text.strip()
-                
-                if not title:
-                    # Try getting first meaningful text from the element
-                    all_text = job_elem.text.strip()
-                    if all_text:
-                        # Get first line that's not empty and has some content
-                        lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-                        if lines:
-                            title = lines[0]
-                            # If first line is too short, try second
-                            if len(title) < 5 and len(lines) > 1:
-                                title = lines[1]
-                
-                if not title or len(title) < 3:
-                    skipped_count += 1
-                    if debug and skipped_count <= 3:  # Only show first few skipped items
-                        print(f"Skipping job element {skipped_count}: No valid title found")
-                    continue
-                
-                # Try to find company - multiple strategies
-                company = 'Not specified'
-                company_elem = (soup_elem.find('a', class_=lambda x: x and 'comp' in str(x).lower()) or
-                               soup_elem.find('span', class_=lambda x: x and 'comp' in str(x).lower()) or
-                               soup_elem.find('div', class_=lambda x: x and 'comp' in str(x).lower()))
-                
-                if company_elem:
-                    company = company_elem.text.strip()
-                else:
-                    # Try to find company from text patterns (usually appears after title)
-                    all_text = job_elem.text.strip()
-                    if all_text:
-                        lines = [line.strip() for line in all_text.split('\n') if line.strip() and len(line.strip()) > 2]
-                        # Company usually appears in second or third line
-                        if len(lines) > 1:
-                            potential_company = lines[1]
-                            # Skip if it looks like experience or location
-                            if not any(x in potential_company.lower() for x in ['yr', 'year', 'exp', 'lakh', 'crore', 'pa', 'bangalore', 'mumbai', 'delhi']):
-                                company = potential_company
-                
-                # Try to find experience, salary, location from spans
-                experience = 'Not specified'
-                salary = 'Not disclosed'
-                job_location = location
-                
-                for span in soup_elem.find_all('span'):
-                    text = span.text.strip()
-                    text_lower = text.lower()
-                    
-                    if 'yr' in text_lower or 'year' in text_lower or 'exp' in text_lower:
-                        if experience == 'Not specified':
-                            experience = text
-                    elif 'lakh' in text_lower or 'crore' in text_lower or 'salary' in text_lower or 'pa' in text_lower:
-                        if salary == 'Not disclosed':
-                            salary = text
-                    elif any(city in text_lower for city in ['bangalore', 'mumbai', 'delhi', 'hyderabad', 'pune', 'chennai', 'gurgaon', 'noida']):
-                        job_location = text
-                
-                # Fix job URL
-                if job_url:
-                    if not job_url.startswith('http'):
-                        job_url = f'https://www.naukri.com{job_url}'
-                else:
-                    # Try to find URL from data attributes or other links
-                    data_url = job_elem.get_attribute('data-url') or job_elem.get_attribute('href')
-                    if data_url:
-                        job_url = data_url if data_url.startswith('http') else f'https://www.naukri.com{data_url}'
-                    else:
-                        job_url = 'N/A'
-                
-                # Skip duplicates
-                if job_url in seen_urls or job_url == 'N/A':
-                    continue
-                seen_urls.add(job_url)
-                
-                jobs.append({
-                    'title': title,
-                    'company': company,
-                    'experience': experience,
-                    'salary': salary,
-                    'location': job_location,
-                    'url': job_url,
-                    'platform': 'Naukri'
-                })
-                
-                if len(jobs) >= max_results:
-                    break
-                
-            except Exception as e:
-                if debug:
-                    print(f"Error parsing job: {str(e)}")
-                skipped_count += 1
+                print(f"Page {page} is already known, stopping")
+            break
+        for job in new_jobs:
+            if job['url'] in seen_urls:
                 continue
-        
+            seen_urls.add(job['url'])
+            count += 1
+            yield job
+            if count >= max_results:
+                return
+
+
+def iter_naukri_jobs(
+    keywords,
+    location,
+    max_results=20,
+    debug=False,
+    extract_mode="json",
+    store=None,
+    incremental=False,
+    max_pages=10,
+    browser_profile=None,
+):
+    """
+    Generator version of ``scrape_naukri_jobs``: yields each job dict as soon
+    as it has been extracted. The pooled driver is returned when the
+    generator finishes or is closed.
+    """
+
+    url = build_search_url(keywords, location)
+    if incremental and store is None:
+        store = get_job_store()
+
+    if not browser_available():
+        # No Chrome on this machine: skip the doomed driver start
+        SCRAPE_FALLBACKS.labels(kind="no_browser").inc()
+        yield from iter_naukri_jobs_simple(
+            url,
+            location,
+            max_results,
+            debug,
+            max_pages=max_pages,
+            store=store,
+            incremental=incremental,
+        )
+        return
+
+    from selenium.common.exceptions import WebDriverException
+
+    pool = get_scrape_pool(browser_profile)
+    lease = None
+    try:
         if debug:
-            print(f"\nExtraction Summary:")
-            print(f"  Total elements found: {len(job_elements)}")
-            print(f"  Successfully extracted: {len(jobs)}")
-            print(f"  Skipped (no title/duplicates/errors): {skipped_count}")
-        
-        return jobs
-    
+            print(f"Fetching URL: {url}")
+
+        # Check out a warm Chrome driver from the shared pool
+        try:
+            with timed(SCRAPE_PHASE_SECONDS, phase="driver_acquire"):
+                lease = pool.acquire()
+            driver = lease.driver
+        except BrowserBudgetExhausted:
+            # Chrome works but the machine is at its browser limit: shed load
+            raise
+        except Exception as chrome_error:
+            # In environments without Chrome (e.g. Railway), fall back to requests-based scraping
+            if debug:
+                print("Chrome WebDriver failed, falling back to simple scraper.")
+                print(f"Chrome error: {chrome_error}")
+            SCRAPE_FALLBACKS.labels(kind="simple").inc()
+            yield from iter_naukri_jobs_simple(
+                url,
+                location,
+                max_results,
+                debug,
+                max_pages=max_pages,
+                store=store,
+                incremental=incremental,
+            )
+            return
+
+        if incremental:
+            jobs = _iter_incremental(
+                driver, url, location, max_results, extract_mode, store, max_pages, debug
+            )
+        else:
+            jobs = _iter_page(driver, url, location, max_results, extract_mode, debug)
+        dedup = get_dedup_index().session()
+        for job in jobs:
+            # A job id already returned by this call
+            if not dedup.accept(job):
+                continue
+            SCRAPE_JOBS.labels(backend="selenium").inc()
+            yield job
+
     except Exception as e:
+        # Never end a failed scrape as if it had finished (RetriesExhausted,
+        # BrowserBudgetExhausted and driver errors all reach the caller)
         if debug:
             print(f"Error: {str(e)}")
-        return []
+        if lease and isinstance(e, WebDriverException):
+            lease.broken = True
+        raise
     
     finally:
-        if driver:
-            driver.quit()
+        if lease:
+            pool.release(lease)
 
 
-def apply_to_naukri_job(job_url, email, password, cover_letter=None, debug=False):
+def scrape_naukri_jobs(
+    keywords,
+    location,
+    max_results=20,
+    debug=False,
+    extract_mode="json",
+    store=None,
+    incremental=False,
+    max_pages=10,
+    browser_profile=None,
+):
     """
-    Minimal auto-apply helper that:
-      1) Logs into Naukri with the given credentials
-      2) Opens the given job_url
-      3) Clicks an 'Apply' / 'Apply Now' button
-      4) Optionally fills a cover letter text area if present
+    Naukri scraper using Selenium to handle JavaScript-rendered content.
 
-    This is intended to run on a local machine where Chrome is installed.
+    ``extract_mode`` selects how tuples are read once the page is ready:
+      "json"      decode the job JSON embedded in ``driver.page_source``,
+                  falling back to "snapshot" when there is none (default)
+      "snapshot"  grab ``driver.page_source`` once and parse it in one pass
+      "elements"  query each tuple element over WebDriver (the original path)
+
+    ``browser_profile`` picks the driver pool (default ``SCRAPE_BROWSER_PROFILE``):
+      "standard"  a normal headless Chrome
+      "lite"      eager page loads with images, fonts, stylesheets and
+                  trackers blocked, extensions and GPU disabled
+
+    With ``incremental=True`` results pages are walked in order, every page
+    is recorded in ``store`` (a ``JobStore``) and only jobs it did not
+    already have are returned; pagination stops at the first page whose jobs
+    are all known.
+
+    Repeats of a job id are dropped; every job carries ``dup_group`` and
+    ``near_duplicate`` from the shared ``dedup`` index.
     """
+    return list(
+        iter_naukri_jobs(
+            keywords,
+            location,
+            max_results,
+            debug,
+            extract_mode=extract_mode,
+            store=store,
+            incremental=incremental,
+            max_pages=max_pages,
+            browser_profile=browser_profile,
+        )
+    )
 
-    chrome_options = Options()
-    # For local debugging it's helpful to see the browser; change to headless if desired
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option("useAutomationExtension", False)
 
-    driver = None
-    try:
-        if debug:
-            print("=== apply_to_naukri_job ===")
-            print("Job URL:", job_url)
+NAUKRI_LOGIN_URL = os.getenv("NAUKRI_LOGIN_URL", "https://www.naukri.com/nlogin/login")
+NAUKRI_HOME_URL = os.getenv("NAUKRI_HOME_URL", "https://www.naukri.com/mnjuser/homepage")
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        wait = WebDriverWait(driver, 30)
 
-        # 1) Go to login page
-        driver.get("https://www.naukri.com/nlogin/login")
-        if debug:
-            print("Opened Naukri login page")
+class LoginFailed(Exception):
+    """The site did not show a logged-in page after submitting the credentials."""
+
+
+def _logged_in(driver):
+    """True once ``driver`` is off the login page and shows the logged-in header."""
+    from selenium.webdriver.common.by import By
+
+    if "login" in driver.current_url.lower():
+        return False
+    return bool(
+        driver.find_elements(By.CSS_SELECTOR, "[data-ga-track='Main Navigation'], header")
+    )
 
-        # Email / username
-        email_input = wait.until(
-            EC.presence_of_element_located((By.NAME, "username"))
-        )
-        email_input.clear()
-        email_input.send_keys(email)
-
-        # Password
-        pwd_input = driver.find_element(By.NAME, "password")
-        pwd_input.clear()
-        pwd_input.send_keys(password)
-
-        # Click login button
-        login_btn = driver.find_element(
-            By.XPATH,
-            "//button[contains(., 'Login') or contains(., 'Sign in') or contains(., 'sign in')]",
-        )
-        login_btn.click()
 
-        # Wait for some logged-in indicator (header nav etc.)
+def _login(driver, email, password, debug=False, login_url=None):
+    """
+    Fill and submit the Naukri login form in ``driver``. Raises
+    ``LoginFailed`` when no logged-in page shows up afterwards.
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    wait = WebDriverWait(driver, 30)
+
+    # 1) Go to login page
+    _navigate(driver, login_url or NAUKRI_LOGIN_URL, debug)
+    if debug:
+        print("Opened Naukri login page")
+
+    # Email / username
+    email_input = wait.until(
+        EC.presence_of_element_located((By.NAME, "username"))
+    )
+    email_input.clear()
+    email_input.send_keys(email)
+
+    # Password
+    pwd_input = driver.find_element(By.NAME, "password")
+    pwd_input.clear()
+    pwd_input.send_keys(password)
+
+    # Click login button
+    login_btn = driver.find_element(
+        By.XPATH,
+        "//button[contains(., 'Login') or contains(., 'Sign in') or contains(., 'sign in')]",
+    )
+    login_btn.click()
+
+    # Wait to leave the login page for one with the logged-in header
+    try:
+        wait.until(_logged_in)
+    except TimeoutException:
+        raise LoginFailed(f"Login was not confirmed (still on {driver.current_url})")
+    if debug:
+        print("Login confirmed")
+
+
+def _restore_session(driver, session, home_url, debug=False):
+    """Inject saved cookies and check the site still treats us as logged in."""
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    # Cookies can only be set for the domain currently loaded
+    _navigate(driver, home_url, debug)
+    for cookie in session["cookies"]:
+        cookie = {k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")}
         try:
-            wait.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "[data-ga-track='Main Navigation'], header")
-                )
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            continue
+    _navigate(driver, home_url, debug)
+    try:
+        WebDriverWait(driver, 5).until(_logged_in)
+        logged_in = True
+    except TimeoutException:
+        logged_in = False
+    if debug:
+        print("Restored saved session" if logged_in else "Saved session was rejected")
+    return logged_in
+
+
+def _ensure_logged_in(driver, email, password, debug=False, login_url=None, home_url=None):
+    """
+    Log ``driver`` in, reusing the saved session for ``email`` when possible.
+    Raises ``LoginFailed`` when neither works; nothing is saved then.
+
+    Returns ``{"session_reused", "login_seconds", "seconds_saved"}`` where
+    ``seconds_saved`` is the last full login's duration minus the time spent
+    restoring the session (0 when a full login was needed).
+    """
+    from session_store import get_session_store
+
+    store = get_session_store()
+    started = time.monotonic()
+
+    session = store.load(email, password)
+    restored = False
+    if session:
+        with timed(APPLY_STAGE_SECONDS, stage="session_restore"):
+            restored = _restore_session(driver, session, home_url or NAUKRI_HOME_URL, debug)
+    if restored:
+        restore_seconds = time.monotonic() - started
+        if debug:
+            print(
+                f"Reused saved session in {restore_seconds:.2f}s "
+                f"(full login took {session['login_seconds']:.2f}s)"
             )
-            if debug:
-                print("Login seems successful")
-        except TimeoutException:
-            if debug:
-                print("Login confirmation timed out, proceeding anyway")
+        return {
+            "session_reused": True,
+            "login_seconds": round(restore_seconds, 3),
+            "seconds_saved": round(max(0.0, session["login_seconds"] - restore_seconds), 3),
+        }
+    if session:
+        # Rejected by the site; don't offer it again if the login below fails
+        store.delete(email)
 
-        # 2) Open the job URL
-        driver.get(job_url)
+    login_started = time.monotonic()
+    _login(driver, email, password, debug, login_url)
+    login_seconds = time.monotonic() - login_started
+    APPLY_STAGE_SECONDS.labels(stage="login").observe(login_seconds)
+    # Only a confirmed login (``_login`` raises otherwise) is worth keeping
+    try:
+        store.save(email, password, driver.get_cookies(), login_seconds)
+    except OSError as e:
         if debug:
-            print("Opened job page")
+            print(f"Could not save session: {e}")
+    return {
+        "session_reused": False,
+        "login_seconds": round(time.monotonic() - started, 3),
+        "seconds_saved": 0.0,
+    }
 
-        # 3) Click an Apply button
-        try:
+
+def _confirmation_shown(driver):
+    page_source = driver.page_source.lower()
+    return "applied" in page_source or "application submitted" in page_source
+
+
+def _apply_on_page(driver, job_url, cover_letter=None, debug=False):
+    """Open ``job_url`` in an already logged-in ``driver`` and apply."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    wait = WebDriverWait(driver, 30)
+
+    # 2) Open the job URL
+    with timed(APPLY_STAGE_SECONDS, stage="open_job"):
+        _navigate(driver, job_url, debug)
+    if debug:
+        print("Opened job page")
+
+    # 3) Click an Apply button
+    try:
+        with timed(APPLY_STAGE_SECONDS, stage="click_apply"):
             apply_btn = wait.until(
                 EC.element_to_be_clickable(
                     (
@@ -512,14 +1257,15 @@ def apply_to_naukri_job(job_url, email, password, cover_letter=None, debug=False
                 )
             )
             apply_btn.click()
-            if debug:
-                print("Clicked Apply button")
-        except TimeoutException:
-            raise Exception("Apply button not found on job page")
+        if debug:
+            print("Clicked Apply button")
+    except TimeoutException:
+        raise Exception("Apply button not found on job page")
 
-        # 4) Optionally fill a cover-letter box if present
-        if cover_letter:
-            try:
+    # 4) Optionally fill a cover-letter box if present
+    if cover_letter:
+        try:
+            with timed(APPLY_STAGE_SECONDS, stage="cover_letter"):
                 textarea = WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located(
                         (
@@ -532,29 +1278,183 @@ def apply_to_naukri_job(job_url, email, password, cover_letter=None, debug=False
                 )
                 textarea.clear()
                 textarea.send_keys(cover_letter)
-                if debug:
-                    print("Filled cover letter")
-            except TimeoutException:
-                if debug:
-                    print("No cover letter textarea found; skipping")
+            if debug:
+                print("Filled cover letter")
+        except TimeoutException:
+            if debug:
+                print("No cover letter textarea found; skipping")
 
-        # Wait briefly to let any confirmation render
-        time.sleep(3)
-        page_source = driver.page_source.lower()
-        success = "applied" in page_source or "application submitted" in page_source
+    # Give any confirmation up to 3 seconds to render
+    try:
+        with timed(APPLY_STAGE_SECONDS, stage="confirmation"):
+            WebDriverWait(driver, 3, poll_frequency=0.2).until(_confirmation_shown)
+        success = True
+    except TimeoutException:
+        success = False
+    APPLY_RESULTS.labels(outcome="confirmed" if success else "unconfirmed").inc()
 
-        return {
-            "job_url": job_url,
-            "applied_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "cover_letter_used": bool(cover_letter),
-            "status_text": "Applied (best-effort)"
-            if success
-            else "Apply clicked; please verify manually on Naukri.",
-        }
+    return {
+        "job_url": job_url,
+        "applied_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "cover_letter_used": bool(cover_letter),
+        "status_text": "Applied (best-effort)"
+        if success
+        else "Apply clicked; please verify manually on Naukri.",
+    }
+
+
+def apply_to_naukri_job(
+    job_url,
+    email,
+    password,
+    cover_letter=None,
+    debug=False,
+    login_url=None,
+    home_url=None,
+):
+    """
+    Minimal auto-apply helper that:
+      1) Logs into Naukri with the given credentials (or restores the saved
+         session for this account, see ``session_store``)
+      2) Opens the given job_url
+      3) Clicks an 'Apply' / 'Apply Now' button
+      4) Optionally fills a cover letter text area if present
+
+    The result includes a ``session`` dict reporting whether a saved session
+    was reused and how many seconds of login that saved.
+
+    This is intended to run on a local machine where Chrome is installed.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    pool = get_apply_pool()
+    lease = None
+    try:
+        if debug:
+            print("=== apply_to_naukri_job ===")
+            print("Job URL:", job_url)
+
+        with timed(APPLY_STAGE_SECONDS, stage="driver_acquire"):
+            lease = pool.acquire()
+        driver = lease.driver
+
+        session = _ensure_logged_in(driver, email, password, debug, login_url, home_url)
+        result = _apply_on_page(driver, job_url, cover_letter, debug)
+        return {**result, "session": session}
+
+    except Exception as e:
+        APPLY_RESULTS.labels(outcome="failed").inc()
+        if lease and isinstance(e, WebDriverException):
+            lease.broken = True
+        raise
 
     finally:
-        if driver:
-            driver.quit()
+        if lease:
+            pool.release(lease)
+
+
+def apply_to_naukri_jobs(
+    applications,
+    email,
+    password,
+    debug=False,
+    login_url=None,
+    home_url=None,
+):
+    """
+    Apply to many jobs in one browser session, logging in only once.
+
+    ``applications`` is a list of ``{"job_url": ..., "cover_letter": ...}``
+    dicts (cover_letter optional). A failure on one job is recorded and the
+    batch moves on; if the browser itself dies a fresh one is checked out
+    and logged in before continuing. If logging in fails, or no browser
+    can be checked out, the remaining jobs fail with that error instead of
+    each trying again. ``BrowserBudgetExhausted`` is raised when it happens
+    before any job was applied, so the whole batch can be retried later.
+
+    Returns a dict with per-job ``results`` (each with ``success`` and
+    ``seconds``), ``applied`` / ``failed`` counts, ``logins``, the
+    ``sessions`` used for each login and timings.
+    """
+    pool = get_apply_pool()
+    lease = None
+    started = time.monotonic()
+    login_seconds = 0.0
+    logins = 0
+    sessions = []
+    results = []
+    login_error = None
+
+    def checkout_and_login():
+        nonlocal lease, login_seconds, logins, login_error
+        try:
+            with timed(APPLY_STAGE_SECONDS, stage="driver_acquire"):
+                lease = pool.acquire()
+        except Exception as e:
+            # Later jobs would only wait out the same checkout again
+            login_error = f"Login failed: no browser available ({e})"
+            raise
+        login_started = time.monotonic()
+        try:
+            sessions.append(
+                _ensure_logged_in(lease.driver, email, password, debug, login_url, home_url)
+            )
+        except Exception as e:
+            login_error = f"Login failed: {e}"
+            pool.release(lease)
+            lease = None
+            raise
+        finally:
+            login_seconds += time.monotonic() - login_started
+        logins += 1
+
+    try:
+        if debug:
+            print(f"=== apply_to_naukri_jobs ({len(applications)} jobs) ===")
+
+        for application in applications:
+            job_url = application.get("job_url")
+            cover_letter = application.get("cover_letter")
+            job_started = time.monotonic()
+            try:
+                if not job_url:
+                    raise ValueError("job_url is required")
+                if login_error is not None:
+                    raise LoginFailed(login_error)
+                if lease is None:
+                    checkout_and_login()
+                result = _apply_on_page(lease.driver, job_url, cover_letter, debug)
+                results.append({"success": True, **result})
+            except Exception as e:
+                if isinstance(e, BrowserBudgetExhausted) and not any(
+                    r["success"] for r in results
+                ):
+                    raise
+                if debug:
+                    print(f"Apply failed for {job_url}: {e}")
+                results.append({"success": False, "job_url": job_url, "error": str(e)})
+                APPLY_RESULTS.labels(outcome="failed").inc()
+                if lease is not None and not pool.is_healthy(lease):
+                    # Browser crashed; start over with a fresh, logged-in one
+                    lease.broken = True
+                    pool.release(lease)
+                    lease = None
+            results[-1]["seconds"] = round(time.monotonic() - job_started, 3)
+
+    finally:
+        if lease:
+            pool.release(lease)
+
+    applied = sum(1 for r in results if r["success"])
+    return {
+        "results": results,
+        "applied": applied,
+        "failed": len(results) - applied,
+        "logins": logins,
+        "sessions": sessions,
+        "login_seconds": round(login_seconds, 3),
+        "total_seconds": round(time.monotonic() - started, 3),
+    }
 
 
 if __name__ == '__main__':
@@ -0,0 +1,138 @@
+"""
+Event-driven readiness checks for Naukri search result pages.
+
+Instead of sleeping for a fixed amount of time, ``wait_for_tuples`` polls the
+number of rendered (non-shimmer) job tuples with a single ``execute_script``
+call per poll and returns as soon as either ``target_count`` tuples are on the
+page or the count has stopped changing for ``stable_for`` seconds.
+
+The deadline for the *first* tuple to appear adapts to recent history: pages
+that normally render in ~1 s do not wait the full ``timeout`` when the site
+returns an empty result set. Once tuples start appearing the hard ``timeout``
+applies.
+"""
+
+import threading
+import time
+from collections import deque
+
+TUPLE_SELECTOR = "article[class*='tuple']:not([class*='shimmer'])"
+
+# One round trip per poll: count real tuples, or job links when the layout
+# has no tuple articles at all.
+_COUNT_SCRIPT = """
+var n = document.querySelectorAll(arguments[0]).length;
+if (!n) { n = document.querySelectorAll("a[href*='/job']").length; }
+return n;
+"""
+
+_recent_waits = deque(maxlen=50)
+_recent_lock = threading.Lock()
+
+
+def _adaptive_first_deadline(timeout, floor=3.0, factor=3.0):
+    """Deadline for the first tuple, based on recent time-to-first-tuple."""
+    with _recent_lock:
+        samples = sorted(w["first_seen"] for w in _recent_waits if w["first_seen"] is not None)
+    if len(samples) < 5:
+        return timeout
+    p90 = samples[int(len(samples) * 0.9) - 1]
+    return min(timeout, max(floor, p90 * factor))
+
+
+def wait_for_tuples(
+    driver,
+    target_count=None,
+    timeout=20,
+    stable_for=0.75,
+    poll_interval=0.1,
+    selector=TUPLE_SELECTOR,
+    debug=False,
+):
+    """
+    Block until job tuples have rendered on the current page.
+
+    Returns a dict describing the wait:
+      ready       True when tuples were found before the deadline
+      reason      "target", "stable" or "timeout"
+      count       tuple count at the time of return
+      waited      seconds spent waiting
+      first_seen  seconds until the first tuple appeared (None if never)
+      polls       number of polls issued
+    """
+    started = time.monotonic()
+    first_deadline = started + _adaptive_first_deadline(timeout)
+    hard_deadline = started + timeout
+
+    count = 0
+    last_count = -1
+    last_change = started
+    first_seen = None
+    polls = 0
+    reason = "timeout"
+
+    while True:
+        try:
+            count = int(driver.execute_script(_COUNT_SCRIPT, selector) or 0)
+        except Exception:
+            count = 0
+        polls += 1
+        now = time.monotonic()
+
+        if count != last_count:
+            last_count = count
+            last_change = now
+        if count and first_seen is None:
+            first_seen = now - started
+
+        if target_count and count >= target_count:
+            reason = "target"
+            break
+        if count and now - last_change >= stable_for:
+            reason = "stable"
+            break
+        if not count and now >= first_deadline:
+            break
+        if now >= hard_deadline:
+            if count:
+                reason = "stable"
+            break
+
+        time.sleep(poll_interval)
+
+    result = {
+        "ready": reason != "timeout",
+        "reason": reason,
+        "count": count,
+        "waited": round(time.monotonic() - started, 3),
+        "first_seen": round(first_seen, 3) if first_seen is not None else None,
+        "polls": polls,
+    }
+    with _recent_lock:
+        _recent_waits.append(result)
+
+    if debug:
+        print(
+            f"[Readiness] {reason} after {result['waited']}s "
+            f"(count={count}, polls={polls}, first_seen={result['first_seen']})"
+        )
+    return result
+
+
+def readiness_stats():
+    """Summary of recent waits: count, mean/max wait and outcome counts."""
+    with _recent_lock:
+        waits = list(_recent_waits)
+    if not waits:
+        return {"samples": 0}
+    durations = [w["waited"] for w in waits]
+    reasons = {}
+    for w in waits:
+        reasons[w["reason"]] = reasons.get(w["reason"], 0) + 1
+    return {
+        "samples": len(waits),
+        "mean_wait": round(sum(durations) / len(durations), 3),
+        "max_wait": max(durations),
+        "last_wait": durations[-1],
+        "reasons": reasons,
+    }
@@ -0,0 +1,277 @@
+"""
+Process-wide token-bucket rate limiter with retries and adaptive slowdown.
+
+Every outgoing page load (requests, aiohttp and WebDriver navigations, for
+scraping and applying alike) takes a token from one shared bucket, so the
+whole process stays under ``rate`` requests/second with bursts of up to
+``burst``. ``call`` / ``call_async`` also retry throttled (429), server
+error (5xx) and timed-out requests with jittered exponential backoff.
+
+When the share of failed attempts in the recent window rises above
+``slowdown_threshold`` the effective rate is halved (down to
+``min_rate_factor`` of the configured rate); it recovers step by step once
+requests succeed again. A 429 with ``Retry-After`` pauses the bucket for
+everyone, not just the caller that saw it.
+
+    limiter = get_rate_limiter()
+    html = limiter.call(fetch, retry_on=(requests.Timeout,))
+
+Scrapers turn the error that is left once retries run out into
+``RetriesExhausted`` for the page, instead of treating the page as the end
+of the results.
+
+Configuration (environment variables):
+  SCRAPE_RATE          requests per second across the process, 0 disables (default 5)
+  SCRAPE_BURST         bucket size (default 10)
+  SCRAPE_MAX_RETRIES   retries per request after the first attempt (default 3)
+  SCRAPE_BACKOFF_BASE  first retry delay in seconds (default 0.5)
+  SCRAPE_BACKOFF_MAX   longest retry delay in seconds (default 30)
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import deque
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryableError(Exception):
+    """A failed attempt worth retrying (throttled, 5xx, timeout...)."""
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class RetriesExhausted(Exception):
+    """
+    A page still failed after every retry. Scrapers raise it rather than
+    ending early, so a throttled or failing site never passes for a short
+    result set (the app answers it with 503).
+    """
+
+    def __init__(self, url, error):
+        super().__init__(f"Gave up on {url} after retries: {error}")
+        self.url = url
+        self.retry_after = getattr(error, "retry_after", None)
+
+
+def _retry_after_seconds(value):
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def check_status(status, retry_after=None):
+    """Raise ``RetryableError`` for a 429/5xx response status."""
+    if status in RETRYABLE_STATUSES:
+        raise RetryableError(
+            f"HTTP {status}", status=status, retry_after=_retry_after_seconds(retry_after)
+        )
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate=5.0,
+        burst=10,
+        max_retries=3,
+        backoff_base=0.5,
+        backoff_max=30.0,
+        window=50,
+        min_samples=10,
+        slowdown_threshold=0.2,
+        min_rate_factor=0.1,
+        adjust_interval=5.0,
+    ):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.min_samples = min_samples
+        self.slowdown_threshold = slowdown_threshold
+        self.min_rate_factor = min_rate_factor
+        self.adjust_interval = adjust_interval
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._factor = 1.0
+        self._outcomes = deque(maxlen=window)
+        self._last_adjust = 0.0
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "give_ups": 0,
+            "throttled": 0,
+            "slowdowns": 0,
+            "speedups": 0,
+            "wait_seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Token bucket
+    # ------------------------------------------------------------------ #
+    def reserve(self):
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            self._stats["requests"] += 1
+            if self.rate <= 0:
+                return 0.0
+            now = time.monotonic()
+            rate = self.rate * self._factor
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._paused_until - now)
+            self._stats["wait_seconds"] += wait
+            return wait
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    # ------------------------------------------------------------------ #
+    # Outcomes and adaptive rate
+    # ------------------------------------------------------------------ #
+    def record(self, success, retry_after=None, throttled=False):
+        """Feed one attempt's outcome into the error-rate window."""
+        with self._lock:
+            now = time.monotonic()
+            self._outcomes.append(bool(success))
+            if not success:
+                self._stats["failures"] += 1
+            if throttled:
+                self._stats["throttled"] += 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            if len(self._outcomes) < self.min_samples or now - self._last_adjust < self.adjust_interval:
+                return
+            error_rate = self._outcomes.count(False) / len(self._outcomes)
+            if error_rate > self.slowdown_threshold and self._factor > self.min_rate_factor:
+                self._factor = max(self.min_rate_factor, self._factor / 2)
+                self._stats["slowdowns"] += 1
+            elif error_rate < self.slowdown_threshold / 2 and self._factor < 1.0:
+                self._factor = min(1.0, self._factor * 1.5)
+                self._stats["speedups"] += 1
+            else:
+                return
+            # Judge the new rate on fresh outcomes only
+            self._outcomes.clear()
+            self._last_adjust = now
+
+    def backoff(self, attempt):
+        """Jittered exponential delay before retry number ``attempt`` (1-based)."""
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(cap / 2, cap)
+
+    def _retry_delay(self, error, attempt):
+        retry_after = getattr(error, "retry_after", None)
+        throttled = getattr(error, "status", None) == 429
+        self.record(False, retry_after=retry_after if throttled else None, throttled=throttled)
+        if attempt > self.max_retries:
+            with self._lock:
+                self._stats["give_ups"] += 1
+            return None
+        with self._lock:
+            self._stats["retries"] += 1
+        return max(self.backoff(attempt), retry_after or 0.0)
+
+    # ------------------------------------------------------------------ #
+    # Rate-limited calls with retries
+    # ------------------------------------------------------------------ #
+    def call(self, fn, retry_on=(), debug=False):
+        """
+        ``fn()`` under the rate limit, retried on ``RetryableError`` and the
+        exception types in ``retry_on``. Re-raises the last error once the
+        retries are used up.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            self.acquire()
+            try:
+                result = fn()
+            except (RetryableError, *retry_on) as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                if debug:
+                    print(f"[RateLimiter] {e!r}; retry {attempt} in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+            self.record(True)
+            return result
+
+    async def call_async(self, fn, retry_on=(), debug=False):
+        """``call`` for a coroutine function ``fn``."""
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.acquire_async()
+            try:
+                result = await fn()
+            except (RetryableError, *retry_on) as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                if debug:
+                    print(f"[RateLimiter] {e!r}; retry {attempt} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            self.record(True)
+            return result
+
+    def stats(self):
+        with self._lock:
+            outcomes = list(self._outcomes)
+            now = time.monotonic()
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "effective_rate": round(self.rate * self._factor, 3),
+                "rate_factor": round(self._factor, 3),
+                "tokens": round(
+                    min(self.burst, self._tokens + (now - self._updated) * self.rate * self._factor),
+                    3,
+                ),
+                "paused_for": round(max(0.0, self._paused_until - now), 3),
+                "error_rate": round(outcomes.count(False) / len(outcomes), 3) if outcomes else 0.0,
+                **self._stats,
+            }
+
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """The process-wide limiter, configured from the environment on first use."""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter(
+                rate=float(os.getenv("SCRAPE_RATE", 5)),
+                burst=int(os.getenv("SCRAPE_BURST", 10)),
+                max_retries=int(os.getenv("SCRAPE_MAX_RETRIES", 3)),
+                backoff_base=float(os.getenv("SCRAPE_BACKOFF_BASE", 0.5)),
+                backoff_max=float(os.getenv("SCRAPE_BACKOFF_MAX", 30)),
+            )
+        return _default_limiter
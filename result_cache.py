@@ -0,0 +1,212 @@
+"""
+TTL + LRU cache for scrape results with stale-while-revalidate.
+
+Entries are fresh for ``ttl`` seconds. After that, and for up to
+``stale_ttl`` seconds, they are still served immediately while a background
+thread refreshes them. The cache is bounded by the approximate JSON size of
+the stored values and evicts least-recently-used entries first. With a
+``path`` it is snapshotted to disk and reloaded on start.
+
+Configuration (environment variables):
+  SCRAPE_CACHE_TTL        seconds an entry is fresh (default 300)
+  SCRAPE_CACHE_STALE_TTL  seconds a stale entry may still be served (default 3600)
+  SCRAPE_CACHE_MAX_BYTES  memory budget for cached values (default 32 MiB)
+  SCRAPE_CACHE_PATH       JSON snapshot file; persistence is off when unset
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+FRESH = "hit"
+STALE = "stale"
+MISS = "miss"
+
+
+class ResultCache:
+    def __init__(
+        self,
+        ttl=300,
+        stale_ttl=3600,
+        max_bytes=32 * 1024 * 1024,
+        path=None,
+        persist_interval=5.0,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.path = path
+        self.persist_interval = persist_interval
+
+        self._entries = OrderedDict()  # key -> (value, size, stored_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._dirty = False
+        self._last_persist = 0.0
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "evictions": 0,
+        }
+
+        if self.path:
+            self._load()
+            atexit.register(self.flush)
+
+    # ------------------------------------------------------------------ #
+    # Core operations
+    # ------------------------------------------------------------------ #
+    def get(self, key):
+        """Return ``(value, state)`` where state is "hit", "stale" or "miss"."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None, MISS
+            value, _, stored_at = entry
+            age = time.time() - stored_at
+            if age > self.ttl + self.stale_ttl:
+                self._remove(key)
+                self._stats["misses"] += 1
+                return None, MISS
+            self._entries.move_to_end(key)
+            if age > self.ttl:
+                self._stats["stale_hits"] += 1
+                return value, STALE
+            self._stats["hits"] += 1
+            return value, FRESH
+
+    def set(self, key, value, stored_at=None):
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, stored_at or time.time())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats["evictions"] += 1
+            self._dirty = True
+        self._maybe_persist()
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get_or_load(self, key, loader, cacheable=bool):
+        """
+        Serve ``key`` from the cache, calling ``loader()`` on a miss.
+
+        Stale entries are returned as-is and refreshed in a background thread.
+        Results for which ``cacheable(value)`` is false (by default empty
+        results, which usually mean the scrape failed) are not stored.
+        Returns ``(value, state)``.
+        """
+        value, state = self.get(key)
+        if state == FRESH:
+            return value, state
+        if state == STALE:
+            self._refresh_in_background(key, loader, cacheable)
+            return value, state
+
+        value = loader()
+        if cacheable(value):
+            self.set(key, value)
+        return value, state
+
+    def _refresh_in_background(self, key, loader, cacheable):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                value = loader()
+                if cacheable(value):
+                    self.set(key, value)
+                with self._lock:
+                    self._stats["refreshes"] += 1
+            except Exception as e:
+                print(f"[ResultCache] Background refresh failed for {key!r}: {e}")
+                with self._lock:
+                    self._stats["refresh_errors"] += 1
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["stale_hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_ratio": round(
+                    (self._stats["hits"] + self._stats["stale_hits"]) / lookups, 3
+                )
+                if lookups
+                else 0.0,
+                "refreshing": len(self._refreshing),
+            }
+
+    # ------------------------------------------------------------------ #
+    # Persistence
+    # ------------------------------------------------------------------ #
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._last_persist = time.time()
+        for key, value, stored_at in snapshot.get("entries", []):
+            self.set(key, value, stored_at=stored_at)
+        self._dirty = False
+
+    def _maybe_persist(self):
+        if self.path and time.time() - self._last_persist >= self.persist_interval:
+            self.flush()
+
+    def flush(self):
+        """Write the cache to ``path`` (atomically) if it changed."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = [
+                [key, value, stored_at]
+                for key, (value, _, stored_at) in self._entries.items()
+            ]
+            self._dirty = False
+            self._last_persist = time.time()
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[ResultCache] Could not persist cache to {self.path}: {e}")
+
+
+def cache_from_env():
+    return ResultCache(
+        ttl=float(os.getenv("SCRAPE_CACHE_TTL", 300)),
+        stale_ttl=float(os.getenv("SCRAPE_CACHE_STALE_TTL", 3600)),
+        max_bytes=int(os.getenv("SCRAPE_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+        path=os.getenv("SCRAPE_CACHE_PATH") or None,
+    )
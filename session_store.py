@@ -0,0 +1,127 @@
+"""
+Encrypted on-disk store for authenticated Naukri browser sessions.
+
+After a successful login the driver's cookies are saved, encrypted with
+Fernet, in one file per account (keyed by a hash of ``NAUKRI_EMAIL``). New
+drivers get the cookies injected instead of going through the login form;
+the login only runs again once the saved session is missing, older than
+``max_age`` or rejected by the site.
+
+The encryption key comes from ``NAUKRI_SESSION_KEY`` (a Fernet key, see
+``Fernet.generate_key()``) or, when unset, is derived from the account
+password, so a password change also invalidates saved sessions.
+
+Configuration (environment variables):
+  NAUKRI_SESSION_DIR      directory for session files (default sessions/ in NAUKRI_DATA_DIR)
+  NAUKRI_SESSION_KEY      Fernet key used to encrypt session files
+  NAUKRI_SESSION_MAX_AGE  seconds before a saved session is discarded (default 43200)
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from data_dir import state_path
+
+
+class SessionStore:
+    def __init__(self, directory=".naukri_sessions", key=None, max_age=12 * 3600):
+        self.directory = directory
+        self.key = key
+        self.max_age = max_age
+        self._derived = {}
+
+    def _path(self, email):
+        digest = hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.session")
+
+    def _fernet(self, email, password):
+        if self.key:
+            return Fernet(self.key)
+        # Key derivation is deliberately slow, so remember it per account
+        cache_key = hashlib.sha256(f"{email}\0{password}".encode("utf-8")).digest()
+        key = self._derived.get(cache_key)
+        if key is None:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=hashlib.sha256(email.strip().lower().encode("utf-8")).digest(),
+                iterations=200_000,
+            )
+            key = base64.urlsafe_b64encode(kdf.derive(password.encode("utf-8")))
+            self._derived[cache_key] = key
+        return Fernet(key)
+
+    def load(self, email, password):
+        """The saved session for ``email``, or None if missing/expired/unreadable."""
+        path = self._path(email)
+        try:
+            with open(path, "rb") as f:
+                token = f.read()
+        except OSError:
+            return None
+        try:
+            session = json.loads(self._fernet(email, password).decrypt(token))
+        except (InvalidToken, ValueError):
+            self.delete(email)
+            return None
+
+        now = time.time()
+        if now - session.get("saved_at", 0) > self.max_age:
+            self.delete(email)
+            return None
+        # Drop cookies that have expired since they were saved
+        session["cookies"] = [
+            c for c in session.get("cookies", []) if c.get("expiry", now + 1) > now
+        ]
+        if not session["cookies"]:
+            self.delete(email)
+            return None
+        return session
+
+    def save(self, email, password, cookies, login_seconds):
+        """Encrypt and store ``cookies`` (as returned by ``driver.get_cookies()``)."""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        payload = json.dumps(
+            {
+                "cookies": cookies,
+                "saved_at": time.time(),
+                "login_seconds": login_seconds,
+            }
+        ).encode("utf-8")
+        token = self._fernet(email, password).encrypt(payload)
+        path = self._path(email)
+        tmp_path = f"{path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+        os.replace(tmp_path, path)
+
+    def delete(self, email):
+        try:
+            os.remove(self._path(email))
+        except OSError:
+            pass
+
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def get_session_store():
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = SessionStore(
+                directory=state_path("NAUKRI_SESSION_DIR", "sessions"),
+                key=os.getenv("NAUKRI_SESSION_KEY") or None,
+                max_age=float(os.getenv("NAUKRI_SESSION_MAX_AGE", 12 * 3600)),
+            )
+        return _default_store
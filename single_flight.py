@@ -0,0 +1,81 @@
+"""
+Single-flight request coalescing.
+
+The first caller for a key runs the work; callers that arrive with the same
+key while it is still running wait for that result instead of repeating it.
+Exceptions raised by the work are re-raised in every waiting caller.
+"""
+
+import threading
+
+
+class SingleFlightTimeout(Exception):
+    """Raised when a waiting caller gives up on an in-flight call."""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "executed": 0,
+            "deduplicated": 0,
+            "timeouts": 0,
+            "errors": 0,
+        }
+
+    def do(self, key, fn, timeout=None):
+        """
+        Run ``fn()`` for ``key`` unless an identical call is in flight.
+
+        Returns ``(result, shared)`` where ``shared`` is True when the result
+        came from another caller's run. Waiting callers raise
+        ``SingleFlightTimeout`` after ``timeout`` seconds; the leader is never
+        interrupted.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                self._stats["deduplicated"] += 1
+                leader = False
+
+        if not leader:
+            if not call.done.wait(timeout):
+                with self._lock:
+                    self._stats["timeouts"] += 1
+                raise SingleFlightTimeout(
+                    f"Timed out after {timeout}s waiting for in-flight call {key!r}"
+                )
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._stats["executed"] += 1
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
@@ -0,0 +1,318 @@
+"""
+Learned order for the scraper's selector and field-lookup strategies.
+
+Extraction tries several strategies in a fixed order: the ``TUPLE_SELECTORS``
+probes (each a ``find_elements`` round trip in the WebDriver path) and the
+precise title-link / company lookups done for every tuple (broad fallbacks
+always run last and are never learned). The cache remembers which
+strategy has been succeeding for the current page layout and moves it to the
+front, so a page usually needs one probe and one lookup per field.
+
+Each slot (``"selector"``, ``"title:<selector>"``, ``"company:<selector>"``)
+keeps an exponentially weighted success rate per strategy, fed with per-page
+tallies. The best strategy with enough samples becomes the slot's preferred
+one. When its rate falls below ``relearn_below`` (the layout changed), the
+preference and its history are dropped, the default order is used again and
+a new winner is learned. Every ``explore_every`` orderings a slot uses the
+default order once, so a more specific strategy that starts working again
+wins its place back (ties go to the default order). A slot nothing was
+recorded for in ``max_age`` seconds is forgotten, so a preference learned
+from a passing layout (or an old state file) does not outlive it.
+
+State is saved to a JSON file and reloaded on start; expired slots, and
+slots saved without a timestamp, are skipped when loading. Workers sharing
+the file merge it slot by slot when saving (the latest update wins).
+
+    cache = get_strategy_cache()
+    tally = StrategyTally()
+    for selector in cache.order("selector", TUPLE_SELECTORS):
+        ...
+        tally.add("selector", selector, bool(found))
+    cache.record(tally)
+
+Configuration (environment variables):
+  STRATEGY_CACHE_PATH           JSON state file; persistence is off when empty
+                                (default strategy_cache.json in NAUKRI_DATA_DIR)
+  STRATEGY_CACHE_RELEARN_BELOW  success rate under which a slot re-learns (default 0.5)
+  STRATEGY_CACHE_MIN_SAMPLES    attempts before a strategy can be preferred (default 3)
+  STRATEGY_CACHE_EXPLORE_EVERY  use the default order once every N orderings (default 50)
+  STRATEGY_CACHE_MAX_AGE        seconds a slot's learned state lasts without new
+                                records, 0 to keep it forever (default 604800, one week)
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+from data_dir import state_lock, state_path
+
+
+class StrategyTally:
+    """Attempts and successes per ``(slot, strategy)`` gathered while reading one page."""
+
+    __slots__ = ("tries", "hits")
+
+    def __init__(self):
+        self.tries = Counter()
+        self.hits = Counter()
+
+    def add(self, slot, name, success):
+        self.tries[slot, name] += 1
+        if success:
+            self.hits[slot, name] += 1
+
+
+class StrategyCache:
+    def __init__(
+        self,
+        path=None,
+        alpha=0.3,
+        relearn_below=0.5,
+        min_samples=3,
+        explore_every=50,
+        max_age=7 * 24 * 3600,
+        persist_interval=30.0,
+    ):
+        self.path = path
+        self.alpha = alpha
+        self.relearn_below = relearn_below
+        self.min_samples = min_samples
+        self.explore_every = explore_every
+        self.max_age = max_age
+        self.persist_interval = persist_interval
+
+        # slot -> {"rates": {name: [rate, samples]}, "preferred": name or None,
+        #          "orders": n, "updated": epoch seconds of the last record}
+        self._slots = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_persist = 0.0
+        self._reset_at = {}  # slot (None for all) -> when reset() forgot it
+        self._stats = {
+            "learned": 0,
+            "relearns": 0,
+            "explorations": 0,
+            "preferred_first": 0,
+            "expired": 0,
+        }
+
+        if self.path:
+            self._load()
+            atexit.register(self.flush)
+
+    def _slot(self, slot):
+        state = self._slots.get(slot)
+        if state is not None and self._expired(state["updated"]):
+            self._stats["expired"] += 1
+            self._dirty = True
+            state = None
+        if state is None:
+            state = self._slots[slot] = {
+                "rates": {},
+                "preferred": None,
+                "orders": 0,
+                "updated": time.time(),
+            }
+        return state
+
+    def _expired(self, updated):
+        return bool(self.max_age) and time.time() - updated > self.max_age
+
+    def order(self, slot, candidates):
+        """``candidates`` (in default order) with the slot's preferred strategy first."""
+        candidates = list(candidates)
+        with self._lock:
+            state = self._slot(slot)
+            state["orders"] += 1
+            preferred = state["preferred"]
+            if preferred not in candidates or preferred == candidates[0]:
+                return candidates
+            if self.explore_every and state["orders"] % self.explore_every == 0:
+                self._stats["explorations"] += 1
+                return candidates
+            self._stats["preferred_first"] += 1
+        candidates.remove(preferred)
+        return [preferred, *candidates]
+
+    def preferred(self, slot):
+        with self._lock:
+            state = self._slots.get(slot)
+            return state["preferred"] if state else None
+
+    def record(self, tally, defaults=None):
+        """
+        Fold one page's ``StrategyTally`` into the success rates and update
+        each touched slot's preferred strategy. ``defaults`` maps a slot to
+        its default order, used to break ties; strategies missing from it
+        rank last.
+        """
+        defaults = defaults or {}
+        touched = set()
+        now = time.time()
+        with self._lock:
+            for (slot, name), tries in tally.tries.items():
+                state = self._slot(slot)
+                state["updated"] = now
+                rates = state["rates"]
+                page_rate = tally.hits[slot, name] / tries
+                current = rates.get(name)
+                if current is None:
+                    rates[name] = [page_rate, tries]
+                else:
+                    current[0] += self.alpha * (page_rate - current[0])
+                    current[1] += tries
+                touched.add(slot)
+            for slot in touched:
+                self._update_preferred(slot, defaults.get(slot, ()))
+            self._dirty = True
+        self._maybe_persist()
+
+    def _update_preferred(self, slot, default_order):
+        state = self._slots[slot]
+        rates = state["rates"]
+        preferred = state["preferred"]
+        if preferred is not None:
+            rate, samples = rates.get(preferred, (0.0, 0))
+            if samples >= self.min_samples and rate < self.relearn_below:
+                # The layout changed under us: forget the old winner and learn again
+                rates.pop(preferred, None)
+                state["preferred"] = preferred = None
+                self._stats["relearns"] += 1
+
+        rank = {name: i for i, name in enumerate(default_order)}
+        eligible = [
+            name
+            for name, (rate, samples) in rates.items()
+            if samples >= self.min_samples and rate >= self.relearn_below
+        ]
+        if not eligible:
+            return
+        best = min(
+            eligible, key=lambda name: (-round(rates[name][0], 2), rank.get(name, len(rank)))
+        )
+        if best != preferred:
+            state["preferred"] = best
+            self._stats["learned"] += 1
+
+    def reset(self, slot=None):
+        """Forget what was learned for ``slot`` (or for every slot)."""
+        with self._lock:
+            if slot is None:
+                self._slots.clear()
+            else:
+                self._slots.pop(slot, None)
+            # Keep the next flush from merging the forgotten slots back in
+            self._reset_at[slot] = time.time()
+            self._dirty = True
+        self.flush()
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._stats,
+                "slots": len(self._slots),
+                "preferred": {
+                    slot: state["preferred"]
+                    for slot, state in self._slots.items()
+                    if state["preferred"]
+                },
+            }
+
+    # ------------------------------------------------------------------ #
+    # Persistence
+    # ------------------------------------------------------------------ #
+    def _read(self):
+        """``(slots, expired)``: the unexpired slots saved at ``path`` and how many expired."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return {}, 0
+        slots = {}
+        expired = 0
+        for slot, state in snapshot.get("slots", {}).items():
+            updated = state.get("updated", 0)
+            if self._expired(updated):
+                expired += 1
+                continue
+            slots[slot] = {**state, "updated": updated}
+        return slots, expired
+
+    def _load(self):
+        saved, self._stats["expired"] = self._read()
+        self._last_persist = time.time()
+        for slot, state in saved.items():
+            self._slots[slot] = {
+                "rates": {name: list(value) for name, value in state.get("rates", {}).items()},
+                "preferred": state.get("preferred"),
+                "orders": 0,
+                "updated": state["updated"],
+            }
+
+    def _maybe_persist(self):
+        if self.path and time.time() - self._last_persist >= self.persist_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the learned state to ``path`` (atomically) if it changed.
+        Under ``state_lock`` the file is read back first and, per slot, the
+        more recently updated state is kept, so workers sharing the file do
+        not drop each other's slots.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+        try:
+            with state_lock(self.path):
+                saved_slots, _ = self._read()
+                with self._lock:
+                    reset_all = self._reset_at.get(None, 0)
+                    slots = {
+                        slot: state
+                        for slot, state in saved_slots.items()
+                        if state["updated"] > max(reset_all, self._reset_at.get(slot, 0))
+                    }
+                    self._reset_at.clear()
+                    for slot, state in self._slots.items():
+                        saved = slots.get(slot)
+                        if saved is None or saved["updated"] <= state["updated"]:
+                            slots[slot] = {
+                                "rates": state["rates"],
+                                "preferred": state["preferred"],
+                                "updated": state["updated"],
+                            }
+                    # Serialise under the lock: rates are mutated in place by record()
+                    data = json.dumps({"slots": slots})
+                    self._dirty = False
+                    self._last_persist = time.time()
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[StrategyCache] Could not persist strategies to {self.path}: {e}")
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_strategy_cache():
+    """The process-wide strategy cache, configured from the environment on first use."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = StrategyCache(
+                path=state_path("STRATEGY_CACHE_PATH", "strategy_cache.json") or None,
+                relearn_below=float(os.getenv("STRATEGY_CACHE_RELEARN_BELOW", 0.5)),
+                min_samples=int(os.getenv("STRATEGY_CACHE_MIN_SAMPLES", 3)),
+                explore_every=int(os.getenv("STRATEGY_CACHE_EXPLORE_EVERY", 50)),
+                max_age=float(os.getenv("STRATEGY_CACHE_MAX_AGE", 7 * 24 * 3600)),
+            )
+        return _default_cache
@@ -0,0 +1,310 @@
+"""
+Persistent background task queue for long-running scrape/apply work.
+
+Tasks are rows in a local SQLite database, so queued work survives a
+restart. Tasks that were running when the process died are queued again
+if their kind is safe to repeat (``requeue_kinds``, e.g. scrapes); any
+other kind (an apply may already have been submitted) is marked failed
+as interrupted instead.
+A fixed pool of worker threads picks the highest-priority, oldest queued
+task and runs the handler registered for its ``kind``.
+
+Under a multi-worker server every process can submit, but only the one
+holding the ``<path>.lock`` file lock runs workers (and re-queues
+interrupted tasks); if it dies the next process to ``start()`` takes over.
+
+Task states: queued -> running -> succeeded | failed, or cancelled. A running
+task cannot be interrupted; cancelling it marks it ``cancelling`` and its
+result is discarded when it finishes.
+
+Configuration (environment variables):
+  TASK_QUEUE_PATH  SQLite database file (default tasks.db in NAUKRI_DATA_DIR, see ``data_dir``)
+  TASK_WORKERS     worker threads (default 2)
+  TASK_QUEUE_MAX   max queued tasks before submissions are rejected (default 100)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # no cross-process lock: every process runs workers
+    fcntl = None
+
+from data_dir import state_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id           TEXT PRIMARY KEY,
+    kind         TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    priority     INTEGER NOT NULL DEFAULT 0,
+    status       TEXT NOT NULL,
+    result       TEXT,
+    error        TEXT,
+    created_at   REAL NOT NULL,
+    started_at   REAL,
+    finished_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_queue ON tasks (status, priority DESC, created_at);
+"""
+
+QUEUED = "queued"
+RUNNING = "running"
+CANCELLING = "cancelling"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class QueueFull(Exception):
+    """Raised by ``submit`` when ``max_queued`` tasks are already waiting."""
+
+
+class TaskQueue:
+    def __init__(
+        self, path="tasks.db", workers=2, max_queued=100, handlers=None, requeue_kinds=()
+    ):
+        self.path = path
+        self.workers = max(1, int(workers))
+        self.max_queued = int(max_queued)
+        self.handlers = dict(handlers or {})
+        self.requeue_kinds = frozenset(requeue_kinds)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._threads = []
+        self._stopping = False
+        self._runner_lock = None
+
+        self._conn().executescript(_SCHEMA)
+
+    def _recover(self):
+        conn = self._conn()
+        kinds = sorted(self.requeue_kinds)
+        placeholders = ", ".join("?" * len(kinds))
+        with conn:
+            # Running tasks that are safe to repeat get another go...
+            recovered = conn.execute(
+                "UPDATE tasks SET status = ?, started_at = NULL "
+                f"WHERE status = ? AND kind IN ({placeholders})",
+                (QUEUED, RUNNING, *kinds),
+            ).rowcount
+            # ...the rest may have half-happened, so they are not run again
+            interrupted = conn.execute(
+                "UPDATE tasks SET status = ?, error = ?, finished_at = ? WHERE status = ?",
+                (FAILED, "Interrupted by a restart; not retried", time.time(), RUNNING),
+            ).rowcount
+            conn.execute(
+                "UPDATE tasks SET status = ?, finished_at = ? WHERE status = ?",
+                (CANCELLED, time.time(), CANCELLING),
+            )
+        if recovered:
+            print(f"[TaskQueue] Re-queued {recovered} interrupted task(s)")
+        if interrupted:
+            print(f"[TaskQueue] Marked {interrupted} interrupted task(s) failed")
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    # ------------------------------------------------------------------ #
+    # Client API
+    # ------------------------------------------------------------------ #
+    def submit(self, kind, payload, priority=0):
+        """Queue a task and return its id. Raises ``QueueFull`` when saturated."""
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown task kind {kind!r}")
+        task_id = uuid.uuid4().hex
+        conn = self._conn()
+        with self._wakeup:
+            queued = conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE status = ?", (QUEUED,)
+            ).fetchone()[0]
+            if queued >= self.max_queued:
+                raise QueueFull(f"{queued} tasks already queued")
+            with conn:
+                conn.execute(
+                    "INSERT INTO tasks (id, kind, payload, priority, status, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (task_id, kind, json.dumps(payload), int(priority), QUEUED, time.time()),
+                )
+            self._wakeup.notify()
+        return task_id
+
+    def get(self, task_id):
+        """Task as a dict (payload/result decoded), or None if unknown."""
+        row = self._conn().execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None:
+            return None
+        task = dict(row)
+        task["payload"] = json.loads(task["payload"])
+        task["result"] = json.loads(task["result"]) if task["result"] else None
+        if task["status"] == QUEUED:
+            task["position"] = self._position(task)
+        return task
+
+    def _position(self, task):
+        """How many queued tasks will run before this one."""
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM tasks WHERE status = ? AND "
+            "(priority > ? OR (priority = ? AND created_at < ?))",
+            (QUEUED, task["priority"], task["priority"], task["created_at"]),
+        ).fetchone()[0]
+
+    def cancel(self, task_id):
+        """Cancel a task. Returns its new status, or None if unknown."""
+        conn = self._conn()
+        with self._lock, conn:
+            row = conn.execute("SELECT status FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            if row is None:
+                return None
+            status = row["status"]
+            if status == QUEUED:
+                status = CANCELLED
+                conn.execute(
+                    "UPDATE tasks SET status = ?, finished_at = ? WHERE id = ?",
+                    (CANCELLED, time.time(), task_id),
+                )
+            elif status == RUNNING:
+                status = CANCELLING
+                conn.execute("UPDATE tasks SET status = ? WHERE id = ?", (CANCELLING, task_id))
+            return status
+
+    def stats(self):
+        rows = self._conn().execute(
+            "SELECT status, COUNT(*) AS n FROM tasks GROUP BY status"
+        ).fetchall()
+        counts = {row["status"]: row["n"] for row in rows}
+        return {
+            "workers": self.workers,
+            "max_queued": self.max_queued,
+            "queued": counts.get(QUEUED, 0),
+            "running": counts.get(RUNNING, 0) + counts.get(CANCELLING, 0),
+            "by_status": counts,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Workers
+    # ------------------------------------------------------------------ #
+    def _claim_runner(self):
+        """Take the cross-process runner lock; False if another process has it."""
+        if fcntl is None or self.path == ":memory:":
+            return True
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._runner_lock = fd
+        return True
+
+    def start(self):
+        """Start the workers unless another process already runs them. Returns True if started."""
+        with self._lock:
+            if self._threads:
+                return True
+            if not self._claim_runner():
+                return False
+            self._recover()
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker, name=f"task-worker-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            return True
+
+    def stop(self, timeout=None):
+        """Stop taking new tasks and wait for running ones to finish."""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        # Hand the runner role to another process once nothing is running here
+        if self._runner_lock is not None and not any(t.is_alive() for t in self._threads):
+            os.close(self._runner_lock)
+            self._runner_lock = None
+
+    def _claim(self):
+        """Atomically mark the next queued task as running and return it."""
+        conn = self._conn()
+        with self._lock, conn:
+            row = conn.execute(
+                "SELECT id, kind, payload FROM tasks WHERE status = ? "
+                "ORDER BY priority DESC, created_at LIMIT 1",
+                (QUEUED,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = ?, started_at = ? WHERE id = ?",
+                (RUNNING, time.time(), row["id"]),
+            )
+            return row
+
+    def _finish(self, task_id, result=None, error=None):
+        conn = self._conn()
+        with self._lock, conn:
+            status = conn.execute(
+                "SELECT status FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()["status"]
+            if status == CANCELLING:
+                final, result, error = CANCELLED, None, None
+            else:
+                final = FAILED if error is not None else SUCCEEDED
+            conn.execute(
+                "UPDATE tasks SET status = ?, result = ?, error = ?, finished_at = ? "
+                "WHERE id = ?",
+                (
+                    final,
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    time.time(),
+                    task_id,
+                ),
+            )
+
+    def _worker(self):
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+            task = self._claim()
+            if task is None:
+                with self._wakeup:
+                    if not self._stopping:
+                        self._wakeup.wait(1.0)
+                continue
+
+            handler = self.handlers.get(task["kind"])
+            try:
+                if handler is None:
+                    raise ValueError(f"No handler for task kind {task['kind']!r}")
+                result = handler(json.loads(task["payload"]))
+                self._finish(task["id"], result=result)
+            except Exception as e:
+                print(f"[TaskQueue] Task {task['id']} failed: {e}")
+                self._finish(task["id"], error=str(e))
+
+
+def queue_from_env(handlers, requeue_kinds=()):
+    return TaskQueue(
+        path=state_path("TASK_QUEUE_PATH", "tasks.db"),
+        workers=int(os.getenv("TASK_WORKERS", 2)),
+        max_queued=int(os.getenv("TASK_QUEUE_MAX", 100)),
+        handlers=handlers,
+        requeue_kinds=requeue_kinds,
+    )
@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+# Keep every store out of the working tree and start from empty state
+os.environ["NAUKRI_DATA_DIR"] = tempfile.mkdtemp(prefix="naukri-tests-")
+os.environ["DEDUP_INDEX_PATH"] = ""
+os.environ["STRATEGY_CACHE_PATH"] = ""
+os.environ["DRIVER_POOL_WARM"] = "0"
@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+
+import app as app_module
+from admission import AdmissionController, Overloaded
+
+
+def test_rejects_beyond_in_flight_and_waiting_limits():
+    admission = AdmissionController(max_in_flight=1, max_waiting=0)
+    admission.admit()
+
+    with pytest.raises(Overloaded) as rejected:
+        admission.admit()
+    assert rejected.value.status == 429
+    admission.release()
+    admission.admit()
+
+
+def test_waiter_gets_the_released_slot():
+    admission = AdmissionController(max_in_flight=1, max_waiting=1, wait_timeout=5)
+    admission.admit()
+    threading.Timer(0.1, admission.release).start()
+
+    started = time.monotonic()
+    admission.admit()
+
+    assert 0.05 < time.monotonic() - started < 2
+    assert admission.stats()["queued"] == 1
+
+
+def test_waiter_gives_up_after_wait_timeout():
+    admission = AdmissionController(max_in_flight=1, max_waiting=1, wait_timeout=0.1)
+    admission.admit()
+
+    with pytest.raises(Overloaded) as rejected:
+        admission.admit()
+    assert rejected.value.status == 429
+
+
+def test_drain_rejects_new_requests_and_waits_for_in_flight_ones():
+    admission = AdmissionController(max_in_flight=2)
+    admission.admit()
+    threading.Timer(0.1, admission.release).start()
+
+    assert admission.drain(timeout=5)
+    with pytest.raises(Overloaded) as rejected:
+        admission.admit()
+    assert rejected.value.status == 503
+
+
+def test_drain_times_out_while_requests_are_running():
+    admission = AdmissionController()
+    admission.admit()
+
+    assert not admission.drain(timeout=0.05)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    admission = AdmissionController(max_in_flight=1, max_waiting=0, retry_after=7)
+    monkeypatch.setattr(app_module, "admission", admission)
+    return app_module.app.test_client(), admission
+
+
+def test_browser_endpoints_answer_429_when_full_and_503_when_draining(client):
+    client, admission = client
+    admission.admit()
+
+    full = client.post("/scrape", json={})
+    health = client.get("/health")
+    admission.release()
+    admission.drain(timeout=1)
+    draining = client.post("/apply/batch", json={})
+
+    assert full.status_code == 429 and full.headers["Retry-After"] == "7"
+    assert health.status_code == 200
+    assert draining.status_code == 503
+    assert admission.stats()["in_flight"] == 0
@@ -0,0 +1,155 @@
+import pytest
+import requests
+
+import app as app_module
+import naukri_scrapper
+from backends import browser_available
+from browser_budget import BrowserBudgetExhausted
+from driver_pool import DriverPoolTimeout
+from fixtures import FixtureServer, standin_site_routes
+
+EMAIL = "user@example.com"
+PASSWORD = "secret"
+
+
+class FakeLease:
+    driver = None
+    broken = False
+
+
+class FakePool:
+    """Stands in for the Chrome apply pool; counts checkouts."""
+
+    def __init__(self):
+        self.acquired = 0
+        self.released = 0
+
+    def acquire(self):
+        self.acquired += 1
+        return FakeLease()
+
+    def release(self, lease):
+        self.released += 1
+
+    def is_healthy(self, lease):
+        return True
+
+
+@pytest.fixture
+def site():
+    with FixtureServer(standin_site_routes(3)) as server:
+        yield server
+
+
+@pytest.fixture
+def browserless(monkeypatch):
+    """
+    Batch apply without Chrome: logins are counted and each job page is
+    fetched over HTTP, failing like the real page handler when the page has
+    no Apply button.
+    """
+    pool = FakePool()
+    logins = []
+
+    def ensure_logged_in(driver, email, password, *args):
+        logins.append(email)
+        return {"session_reused": False, "login_seconds": 0.0, "seconds_saved": 0.0}
+
+    def apply_on_page(driver, job_url, cover_letter=None, debug=False):
+        page = requests.get(job_url, timeout=5)
+        if page.status_code != 200 or "Apply</button>" not in page.text:
+            raise Exception("Apply button not found on job page")
+        return {"job_url": job_url, "cover_letter_used": bool(cover_letter)}
+
+    monkeypatch.setattr(naukri_scrapper, "get_apply_pool", lambda: pool)
+    monkeypatch.setattr(naukri_scrapper, "_ensure_logged_in", ensure_logged_in)
+    monkeypatch.setattr(naukri_scrapper, "_apply_on_page", apply_on_page)
+    return pool, logins
+
+
+def applications(site):
+    urls = [f"{site.base_url}/job-listings-standin-{i}" for i in range(3)]
+    jobs = [{"job_url": url, "cover_letter": "Hello"} for url in urls]
+    jobs.insert(1, {"job_url": site.base_url + "/missing"})
+    return jobs
+
+
+def test_batch_apply_continues_after_bad_url_with_one_login(site, browserless):
+    pool, logins = browserless
+
+    report = naukri_scrapper.apply_to_naukri_jobs(applications(site), EMAIL, PASSWORD)
+
+    assert [r["success"] for r in report["results"]] == [True, False, True, True]
+    assert report["results"][1]["job_url"].endswith("/missing")
+    assert (report["applied"], report["failed"]) == (3, 1)
+    assert report["logins"] == 1 and logins == [EMAIL]
+    assert pool.acquired == pool.released == 1
+
+
+def test_batch_apply_stops_logging_in_after_login_failure(site, browserless, monkeypatch):
+    pool, _ = browserless
+    attempts = []
+
+    def failing_login(*args):
+        attempts.append(1)
+        raise naukri_scrapper.LoginFailed("Login was not confirmed")
+
+    monkeypatch.setattr(naukri_scrapper, "_ensure_logged_in", failing_login)
+
+    report = naukri_scrapper.apply_to_naukri_jobs(applications(site), EMAIL, PASSWORD)
+
+    assert report["applied"] == 0 and report["failed"] == 4
+    assert len(attempts) == 1 and report["logins"] == 0
+    assert all("Login" in r["error"] for r in report["results"])
+    assert pool.acquired == pool.released == 1
+
+
+@pytest.mark.skipif(not browser_available(), reason="needs a local Chrome")
+def test_batch_apply_in_chrome(site):
+    report = naukri_scrapper.apply_to_naukri_jobs(
+        applications(site),
+        EMAIL,
+        PASSWORD,
+        login_url=site.base_url + "/nlogin/login",
+        home_url=site.base_url + "/home",
+    )
+    naukri_scrapper.get_apply_pool().close()
+
+    assert [r["success"] for r in report["results"]] == [True, False, True, True]
+    assert report["logins"] == 1
+
+
+def test_batch_apply_stops_checking_out_after_acquire_failure(site, browserless):
+    pool, logins = browserless
+
+    def acquire():
+        pool.acquired += 1
+        raise DriverPoolTimeout("No driver became free within 30s")
+
+    pool.acquire = acquire
+
+    report = naukri_scrapper.apply_to_naukri_jobs(applications(site), EMAIL, PASSWORD)
+
+    assert report["applied"] == 0 and report["failed"] == 4
+    assert pool.acquired == 1 and logins == []
+    assert "No driver became free" in report["results"][0]["error"]
+    assert all("no browser available" in r["error"] for r in report["results"][1:])
+
+
+def test_batch_apply_without_browser_budget_answers_503(site, browserless, monkeypatch):
+    pool, _ = browserless
+
+    def acquire():
+        pool.acquired += 1
+        raise BrowserBudgetExhausted("All 4 browser slots are in use")
+
+    pool.acquire = acquire
+    monkeypatch.setenv("NAUKRI_EMAIL", EMAIL)
+    monkeypatch.setenv("NAUKRI_PASSWORD", PASSWORD)
+
+    response = app_module.app.test_client().post(
+        "/apply/batch", json={"jobs": applications(site)}
+    )
+
+    assert response.status_code == 503 and response.headers["Retry-After"]
+    assert pool.acquired == 1
@@ -0,0 +1,36 @@
+import pytest
+
+from browser_budget import BrowserBudget, BrowserBudgetExhausted
+
+
+@pytest.fixture
+def lock_dir(tmp_path):
+    return str(tmp_path / "budget")
+
+
+def test_slots_are_shared_between_budgets_on_one_directory(lock_dir):
+    # Two budgets on one directory stand in for two server workers
+    first = BrowserBudget(slots=2, lock_dir=lock_dir)
+    second = BrowserBudget(slots=2, lock_dir=lock_dir)
+    held = [first.acquire(), second.acquire()]
+
+    assert second.try_acquire() is None
+    assert first.available() == 0
+    first.release(held[0])
+    slot = second.acquire(timeout=1)
+    assert slot is not None and second.stats()["held"] == 2
+
+
+def test_acquire_gives_up_after_timeout(lock_dir):
+    budget = BrowserBudget(slots=1, lock_dir=lock_dir, poll_interval=0.01)
+    budget.acquire()
+
+    with pytest.raises(BrowserBudgetExhausted):
+        budget.acquire(timeout=0.05)
+    assert budget.stats()["exhausted"] == 1
+
+
+def test_disabled_budget_never_blocks(lock_dir):
+    budget = BrowserBudget(slots=0, lock_dir=lock_dir)
+
+    assert [budget.acquire(timeout=0).index for _ in range(5)] == [-1] * 5
@@ -0,0 +1,86 @@
+import random
+
+from bench_dedup import make_jobs, repost
+from dedup import DedupIndex, simhash
+
+JOB = {
+    "title": "Senior Product Manager - Payments",
+    "company": "Acme Technologies",
+    "location": "Mumbai",
+    "experience": "5-9 Yrs",
+    "salary": "20-30 Lacs PA",
+    "url": "https://www.naukri.com/job-listings-senior-product-manager-120325001234",
+}
+
+
+def distance(a, b):
+    return (simhash(a) ^ simhash(b)).bit_count()
+
+
+def test_repost_noise_does_not_change_the_fingerprint():
+    reposted = {
+        **JOB,
+        "title": "URGENT HIRING - Sr. Product Manager - Payments - Acme Pvt Ltd",
+        "company": "Acme Technologies Private Limited",
+        "url": "https://www.naukri.com/job-listings-sr-product-manager-220325009999",
+    }
+    assert distance(JOB, reposted) == 0
+    assert distance(
+        {"title": "Sr. Product Manager - Acme Pvt Ltd", "company": "Acme Pvt Ltd"},
+        {"title": "Senior Product Manager | ACME", "company": "ACME"},
+    ) == 0
+
+
+def test_different_openings_stay_apart():
+    for change in (
+        {"company": "Beta Technologies"},
+        {"location": "Pune"},
+        {"title": "Product Manager - Payments"},
+        {"title": "Senior Product Manager - Growth"},
+    ):
+        assert distance(JOB, {**JOB, **change}) > 2, change
+
+
+def test_benchmark_repost_detection_rate():
+    rng = random.Random(7)
+    originals = make_jobs(2000, rng)
+    picked = rng.sample(range(len(originals)), 400)
+
+    index = DedupIndex()
+    groups = [index.add(job).group for job in originals]
+    detected = 0
+    for n, i in enumerate(picked):
+        match = index.add(repost(originals[i], n, rng))
+        detected += match.near_duplicate and match.group == groups[i]
+
+    assert detected / len(picked) >= 0.95
+    assert len(originals) - len(set(groups)) <= len(originals) * 0.01
+
+
+def test_session_drops_only_exact_repeats():
+    session = DedupIndex().session()
+    repost_job = {**JOB, "url": JOB["url"].replace("120325001234", "220325009999")}
+
+    assert session.accept(dict(JOB))
+    assert not session.accept({**JOB, "url": JOB["url"] + "?src=jobsearch"})
+    assert session.accept(repost_job)
+    assert repost_job["near_duplicate"]
+
+
+def test_workers_sharing_the_file_keep_each_others_entries(tmp_path):
+    path = str(tmp_path / "dedup_index.bin")
+    first, second = DedupIndex(path), DedupIndex(path)
+    jobs = make_jobs(40, random.Random(3))
+    for job in jobs[:20]:
+        first.add(job)
+    for job in jobs[20:]:
+        second.add(job)
+    first.flush()
+    second.flush()
+    # The repost of a job only the first worker saw still joins its group
+    leader = DedupIndex(path).add(jobs[0])
+
+    reloaded = DedupIndex(path)
+    assert len(reloaded) == 40
+    match = reloaded.add(repost(jobs[0], 0, random.Random(1)))
+    assert match.near_duplicate and match.group == leader.group
@@ -0,0 +1,56 @@
+import time
+
+import requests
+
+from enrichment import DetailCache, Enricher, extract_job_details
+from fixtures import FixtureServer, job_description_page, job_description_routes
+
+
+def enricher(tmp_path, fresh_ttl):
+    cache = DetailCache(str(tmp_path / "details.db"))
+    return Enricher(cache, session=requests.Session(), workers=2, fresh_ttl=fresh_ttl)
+
+
+def jobs_on(server):
+    return [{"url": server.base_url + path} for path in job_description_routes(3)]
+
+
+def test_extracts_details_from_ld_json_and_markup():
+    fetched_at = time.mktime((2024, 5, 10, 12, 0, 0, 0, 0, -1))
+    from_ld_json = extract_job_details(job_description_page(0), fetched_at)
+    from_markup = extract_job_details(job_description_page(0, ld_json=False), fetched_at)
+
+    assert from_ld_json["description"] and len(from_ld_json["skills"]) == 4
+    assert from_ld_json["posted_date"] == "2024-05-01"
+    assert from_markup["skills"] == from_ld_json["skills"]
+    assert from_markup["posted"] == "3 days ago"
+    assert from_markup["posted_date"] == "2024-05-07"
+
+
+def test_revalidates_with_etag_and_reuses_details_on_304(tmp_path):
+    with FixtureServer(job_description_routes(3), etags=True) as server:
+        stale = enricher(tmp_path, fresh_ttl=0)
+        first = stale.enrich(jobs_on(server))
+        second = stale.enrich(jobs_on(server))
+
+    assert second == first
+    assert all(job["skills"] for job in first)
+    assert server.served["full"] == 3 and server.served["not_modified"] == 3
+    assert stale.stats()["fetched"] == 3 and stale.stats()["not_modified"] == 3
+
+
+def test_fresh_entries_are_not_requested_again(tmp_path):
+    with FixtureServer(job_description_routes(3), etags=True) as server:
+        fresh = enricher(tmp_path, fresh_ttl=3600)
+        fresh.enrich(jobs_on(server))
+        fresh.enrich(jobs_on(server))
+
+    assert server.served["full"] == 3 and server.served["not_modified"] == 0
+    assert fresh.stats()["fresh"] == 3
+
+
+def test_unreadable_pages_get_empty_details(tmp_path):
+    with FixtureServer({}) as server:
+        jobs = enricher(tmp_path, fresh_ttl=0).enrich([{"url": server.base_url + "/gone"}])
+
+    assert jobs[0]["description"] is None and jobs[0]["skills"] == []
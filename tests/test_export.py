@@ -0,0 +1,75 @@
+import csv
+import io
+
+import pytest
+
+from export import export_jobs, iter_export
+from job_store import JobStore
+
+JOBS = [
+    {
+        "url": f"https://www.naukri.com/job-listings-{i}",
+        "title": f"Job {i}",
+        "company": ["Acme", "Beta"][i % 2],
+        "location": "Mumbai",
+        "experience": "3-5 Yrs",
+        "salary": "5-8 Lacs PA" if i % 3 else "Not disclosed",
+    }
+    for i in range(12)
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.upsert_jobs(JOBS, seen_at=1700000000.5)
+    return store
+
+
+def export(store, fmt, **options):
+    out = io.BytesIO()
+    export_jobs(out, fmt, store=store, batch_size=5, **options)
+    return out.getvalue()
+
+
+def test_parquet_and_arrow_round_trip(store):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    tables = [
+        pq.read_table(io.BytesIO(export(store, "parquet"))),
+        pa.ipc.open_stream(export(store, "arrow")).read_all(),
+    ]
+
+    for table in tables:
+        rows = {row["url"]: row for row in table.to_pylist()}
+        assert len(rows) == 12
+        row = rows[JOBS[1]["url"]]
+        assert (row["company"], row["experience_min"], row["salary_max"]) == ("Beta", 3.0, 800000)
+        assert rows[JOBS[0]["url"]]["salary_min"] is None
+        assert row["first_seen"].timestamp() == 1700000000.5
+        assert str(table.schema.field("company").type) == "dictionary<values=string, indices=int32, ordered=0>"
+
+
+def test_csv_round_trip(store):
+    rows = list(csv.DictReader(io.StringIO(export(store, "csv").decode("utf-8"))))
+
+    assert sorted(row["url"] for row in rows) == sorted(job["url"] for job in JOBS)
+    row = next(row for row in rows if row["url"] == JOBS[1]["url"])
+    assert (row["salary_min"], row["salary_max"]) == ("500000", "800000")
+    assert row["first_seen"] == "2023-11-14T22:13:20.500Z"
+
+
+def test_filters_and_empty_exports(store):
+    acme = list(csv.DictReader(io.StringIO(export(store, "csv", company="acme").decode())))
+    empty = export(store, "csv", company="nobody").decode()
+
+    assert {row["company"] for row in acme} == {"Acme"} and len(acme) == 6
+    assert empty.strip() == ",".join(next(csv.reader([empty])))
+
+
+def test_unknown_format_and_compression_are_rejected():
+    with pytest.raises(ValueError):
+        list(iter_export("xlsx", []))
+    with pytest.raises(ValueError):
+        list(iter_export("parquet", [], compression="rar"))
@@ -0,0 +1,80 @@
+import pytest
+
+from async_scraper import iter_naukri_jobs_async
+from fixtures import (
+    FixtureServer,
+    ld_json_results_page,
+    paginated_routes,
+    results_page,
+    state_results_page,
+)
+from naukri_scrapper import extract_jobs_from_html, scrape_naukri_jobs_simple
+
+# What ld+json carries in a different textual form (salary as raw rupees)
+PARSED_FIELDS = (
+    "title",
+    "company",
+    "location",
+    "url",
+    "experience_min",
+    "experience_max",
+    "salary_min",
+    "salary_max",
+)
+
+
+def parsed(jobs):
+    return [{field: job.get(field) for field in PARSED_FIELDS} for job in jobs]
+
+
+def extracted(jobs):
+    """Jobs without the dedup index's annotations, which only scrapes add."""
+    return [
+        {k: v for k, v in job.items() if k not in ("dup_group", "near_duplicate")}
+        for job in jobs
+    ]
+
+
+def test_dom_extraction_reads_every_tuple_field():
+    jobs = extract_jobs_from_html(results_page(20), "Mumbai", 20)
+
+    assert len(jobs) == 20
+    for job in jobs:
+        for field in ("title", "company", "experience", "salary", "location", "url"):
+            assert job[field] and job[field] != "N/A", (field, job)
+
+
+@pytest.mark.parametrize("count", [1, 20, 120])
+def test_embedded_state_matches_dom(count):
+    page = state_results_page(count)
+
+    from_json = extract_jobs_from_html(page, "Mumbai", count)
+    from_dom = extract_jobs_from_html(page, "Mumbai", count, use_json=False)
+
+    assert len(from_json) == count
+    assert from_json == from_dom
+
+
+def test_ld_json_matches_dom():
+    from_ld_json = extract_jobs_from_html(ld_json_results_page(20), "Mumbai", 20)
+    from_dom = extract_jobs_from_html(results_page(20), "Mumbai", 20)
+
+    assert parsed(from_ld_json) == parsed(from_dom)
+
+
+def test_http_backends_match_page_extraction():
+    path = "/product-manager-jobs-in-mumbai"
+    with FixtureServer(paginated_routes(path, 20)) as server:
+        simple = scrape_naukri_jobs_simple(server.base_url + path, "Mumbai", 20)
+        # The async backend builds the URL itself, from NAUKRI_BASE_URL
+        import naukri_scrapper
+
+        base_url = naukri_scrapper.NAUKRI_BASE_URL
+        naukri_scrapper.NAUKRI_BASE_URL = server.base_url
+        try:
+            from_async = list(iter_naukri_jobs_async("Product Manager", "Mumbai", 20))
+        finally:
+            naukri_scrapper.NAUKRI_BASE_URL = base_url
+
+    assert extracted(simple) == extract_jobs_from_html(results_page(20), "Mumbai", 20)
+    assert from_async == simple
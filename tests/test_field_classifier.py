@@ -0,0 +1,69 @@
+import pytest
+
+from field_classifier import classify, classify_batch, classify_fields, parse_experience, parse_salary
+
+
+@pytest.mark.parametrize(
+    "text, field",
+    [
+        ("3-5 Yrs", "experience"),
+        ("Fresher", "experience"),
+        ("10-15 Lacs PA", "salary"),
+        ("₹ 12,00,000 p.a.", "salary"),
+        ("Not disclosed", None),
+        ("Pune", "location"),
+        ("Hybrid - Bengaluru, Mumbai", "location"),
+        ("Japan", None),
+        ("5 yrs exp, 8 LPA", "experience"),
+        ("Salary 10 Lacs, Mumbai", "salary"),
+    ],
+)
+def test_classify(text, field):
+    assert classify(text) == field
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("2-5 Yrs", (2, 5)), ("5+ Yrs", (5, None)), ("Fresher", (0, 0)), ("", (None, None))],
+)
+def test_parse_experience(text, expected):
+    assert parse_experience(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("5-8 Lacs PA", (500000, 800000)),
+        ("1.5-2 Crore PA", (15000000, 20000000)),
+        ("12+ LPA", (1200000, None)),
+        ("Not disclosed", (None, None)),
+    ],
+)
+def test_parse_salary(text, expected):
+    assert parse_salary(text) == expected
+
+
+def test_first_experience_and_salary_win_last_location_wins():
+    fields = classify_fields(
+        ["2-4 Yrs", "6-9 Yrs", "4-6 Lacs PA", "8 Lacs PA", "Pune", "Mumbai"], "Delhi"
+    )
+
+    assert fields["experience"] == "2-4 Yrs" and fields["salary"] == "4-6 Lacs PA"
+    assert fields["location"] == "Mumbai"
+    assert (fields["experience_min"], fields["salary_max"]) == (2, 600000)
+
+
+def test_missing_fields_get_defaults():
+    fields = classify_fields(["Work from office"], "Delhi")
+
+    assert (fields["experience"], fields["salary"], fields["location"]) == (
+        "Not specified",
+        "Not disclosed",
+        "Delhi",
+    )
+
+
+def test_batch_matches_per_tuple_classification():
+    groups = [["1-3 Yrs", "3 Lacs PA", "Noida"], [], ["Remote"], ["Fresher", "Chennai"]]
+
+    assert classify_batch(groups, "Delhi") == [classify_fields(g, "Delhi") for g in groups]
@@ -0,0 +1,84 @@
+import pytest
+
+import naukri_scrapper
+from backends import get_backend
+from fixtures import FixtureServer, paginated_routes
+from job_store import JobStore
+
+PATH = "/product-manager-jobs-in-mumbai"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.db"))
+
+
+@pytest.fixture
+def site(monkeypatch):
+    with FixtureServer(paginated_routes(PATH, 60)) as server:
+        monkeypatch.setattr(naukri_scrapper, "NAUKRI_BASE_URL", server.base_url)
+        yield server
+
+
+def job(i, **fields):
+    return {
+        "url": f"https://www.naukri.com/job-listings-{i}",
+        "title": f"Job {i}",
+        "company": "Acme" if i % 2 else "Beta",
+        "location": "Mumbai",
+        **fields,
+    }
+
+
+def test_upsert_counts_new_urls_and_bumps_seen(store):
+    assert store.upsert_jobs([job(1), job(2)], seen_at=100) == 2
+    assert store.upsert_jobs([job(2), job(3)], seen_at=200) == 1
+    rows, _ = store.query_jobs(q="Job 2")
+    assert (rows[0]["first_seen"], rows[0]["last_seen"], rows[0]["seen_count"]) == (100, 200, 2)
+    assert store.known_urls([job(1)["url"], "https://x/unknown"]) == {job(1)["url"]}
+
+
+def test_keyset_pages_cover_every_match_once_in_order(store):
+    # Several jobs share a last_seen, so the url tie-break matters
+    for i in range(25):
+        store.upsert_jobs([job(i)], seen_at=1000 + i // 3)
+
+    pages, cursor = [], None
+    while True:
+        rows, cursor = store.query_jobs(company="acme", limit=4, cursor=cursor)
+        pages.append(rows)
+        if cursor is None:
+            break
+
+    urls = [row["url"] for rows in pages for row in rows]
+    keys = [(row["last_seen"], row["url"]) for rows in pages for row in rows]
+    assert sorted(urls) == sorted(job(i)["url"] for i in range(25) if i % 2)
+    assert len(set(urls)) == len(urls)
+    assert keys == sorted(keys, reverse=True)
+    assert all(len(rows) == 4 for rows in pages[:-1])
+
+
+def test_cursor_stays_valid_while_new_jobs_arrive(store):
+    store.upsert_jobs([job(i) for i in range(10)], seen_at=1000)
+    first, cursor = store.query_jobs(limit=5)
+    store.upsert_jobs([job(i) for i in range(10, 15)], seen_at=2000)
+    rest, _ = store.query_jobs(limit=50, cursor=cursor)
+
+    assert {r["url"] for r in first + rest} == {job(i)["url"] for i in range(10)}
+
+
+def test_invalid_cursor_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.query_jobs(cursor="not-a-cursor")
+
+
+@pytest.mark.parametrize("backend", ["simple", "async"])
+def test_incremental_scrape_records_jobs_and_stops_when_known(site, store, backend):
+    scrape = get_backend(backend)
+
+    first = list(scrape("Product Manager", "Mumbai", 40, store=store, incremental=True))
+    second = list(scrape("Product Manager", "Mumbai", 40, store=store, incremental=True))
+
+    assert len(first) == 40
+    assert store.count() == 40
+    assert second == []
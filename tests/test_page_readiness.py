@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+import page_readiness
+from fixtures import results_page
+from naukri_scrapper import _make_soup
+from page_readiness import wait_for_tuples
+
+NEVER = 3600.0
+EMPTY_PAGE = "<html><body><header><a href='/'>naukri</a></header><p>No results</p></body></html>"
+
+
+class DelayedPageDriver:
+    """
+    Stands in for a WebDriver on a page that shows shimmer placeholders and
+    renders ``after`` once ``delay`` seconds have passed, like
+    ``results_page(delay_ms=...)`` does in a browser. ``execute_script``
+    evaluates the readiness count script's selectors on the current DOM.
+    """
+
+    def __init__(self, after, delay):
+        self.before = _make_soup(results_page(0, delay_ms=int(delay * 1000)))
+        self.after = _make_soup(after)
+        self.render_at = time.monotonic() + delay
+
+    def execute_script(self, script, selector):
+        soup = self.after if time.monotonic() >= self.render_at else self.before
+        return len(soup.select(selector)) or len(soup.select("a[href*='/job']"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_history():
+    page_readiness._recent_waits.clear()
+    yield
+    page_readiness._recent_waits.clear()
+
+
+def test_returns_once_delayed_tuples_render():
+    driver = DelayedPageDriver(results_page(20), delay=0.3)
+
+    result = wait_for_tuples(driver, target_count=20, timeout=5)
+
+    assert result["ready"] and result["reason"] == "target"
+    assert result["count"] == 20
+    assert 0.3 <= result["waited"] < 1.0
+    assert result["first_seen"] >= 0.3
+
+
+def test_fewer_tuples_than_target_return_once_stable():
+    driver = DelayedPageDriver(results_page(7), delay=0.1)
+
+    result = wait_for_tuples(driver, target_count=20, timeout=5, stable_for=0.3)
+
+    assert result["ready"] and result["reason"] == "stable"
+    assert result["count"] == 7
+    assert result["waited"] < 1.0
+
+
+def test_times_out_when_nothing_renders():
+    driver = DelayedPageDriver(results_page(20), delay=NEVER)
+
+    result = wait_for_tuples(driver, target_count=20, timeout=0.5)
+
+    assert not result["ready"] and result["reason"] == "timeout"
+    assert result["count"] == 0 and result["first_seen"] is None
+    assert 0.5 <= result["waited"] < 1.0
+
+
+def test_empty_results_page_does_not_wait_the_full_timeout():
+    # Pages have been rendering quickly, so an empty one gives up early
+    for _ in range(5):
+        wait_for_tuples(DelayedPageDriver(results_page(20), delay=0.05), target_count=20)
+
+    result = wait_for_tuples(DelayedPageDriver(EMPTY_PAGE, delay=0.05), timeout=10)
+
+    assert not result["ready"] and result["count"] == 0
+    assert result["waited"] < 5
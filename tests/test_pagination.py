@@ -0,0 +1,118 @@
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import app as app_module
+import async_scraper
+import naukri_scrapper
+from fixtures import FixtureServer, paginated_routes
+from naukri_scrapper import scrape_naukri_jobs_simple
+from rate_limiter import RateLimiter, RetriesExhausted
+
+PATH = "/product-manager-jobs-in-mumbai"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def job_ids(jobs):
+    return [int(job["url"].rsplit("-", 1)[1]) for job in jobs]
+
+
+@pytest.mark.parametrize(
+    "total, max_results",
+    [
+        (200, 100),  # stops part-way through the result set
+        (45, 100),  # runs out of pages first
+        (40, 40),  # ends exactly on a page boundary
+    ],
+)
+def test_concurrent_pagination_matches_sequential(total, max_results):
+    with FixtureServer(paginated_routes(PATH, total), latency=0.02) as server:
+        url = server.base_url + PATH
+        sequential = scrape_naukri_jobs_simple(url, "Mumbai", max_results, workers=1)
+        concurrent = scrape_naukri_jobs_simple(url, "Mumbai", max_results, workers=4)
+
+    assert len(sequential) == min(total, max_results)
+    assert concurrent == sequential
+    assert job_ids(concurrent) == sorted(job_ids(concurrent))
+
+
+def test_concurrent_pagination_skips_failed_page():
+    routes = paginated_routes(PATH, 100)
+    del routes[f"{PATH}-2"]
+    with FixtureServer(routes) as server:
+        url = server.base_url + PATH
+        sequential = scrape_naukri_jobs_simple(url, "Mumbai", 60, workers=1)
+        concurrent = scrape_naukri_jobs_simple(url, "Mumbai", 60, workers=4)
+
+    assert concurrent == sequential
+    assert 100020 not in job_ids(concurrent)
+
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    limiter = RateLimiter(rate=0, max_retries=1, backoff_base=0.001)
+    monkeypatch.setattr(naukri_scrapper, "get_rate_limiter", lambda: limiter)
+    monkeypatch.setattr(async_scraper, "get_rate_limiter", lambda: limiter)
+
+
+@pytest.fixture
+def throttled_site(monkeypatch):
+    """Page 2 keeps answering 503."""
+    routes = paginated_routes(PATH, 100)
+    routes[f"{PATH}-2"] = 503
+    with FixtureServer(routes) as server:
+        monkeypatch.setattr(naukri_scrapper, "NAUKRI_BASE_URL", server.base_url)
+        yield server
+
+
+async def scrape_async(url):
+    async with async_scraper.AsyncScraper() as scraper:
+        return await scraper.scrape_url(url, "Mumbai", 60)
+
+
+def test_page_failing_after_retries_raises_instead_of_ending(fast_retries, throttled_site):
+    url = throttled_site.base_url + PATH
+
+    for workers in (1, 4):
+        with pytest.raises(RetriesExhausted):
+            scrape_naukri_jobs_simple(url, "Mumbai", 60, workers=workers)
+    with pytest.raises(RetriesExhausted):
+        asyncio.run(scrape_async(url))
+
+
+@pytest.mark.parametrize("endpoint", ["/scrape", "/scrape/async"])
+def test_app_answers_exhausted_retries_with_503(fast_retries, throttled_site, monkeypatch, endpoint):
+    monkeypatch.setenv("SCRAPE_BACKEND", "simple")
+
+    response = app_module.app.test_client().post(
+        endpoint, json={"keywords": "Product Manager", "location": "Mumbai", "max_results": 60}
+    )
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+    assert not response.get_json()["success"]
+
+
+def test_simple_and_async_backends_run_without_selenium_or_cryptography():
+    script = textwrap.dedent(
+        f"""
+        import sys
+        sys.path[:0] = [{ROOT!r}, {ROOT + "/benchmarks"!r}]
+        for name in ("selenium", "cryptography"):
+            sys.modules[name] = None  # any import of them now fails
+        from backends import get_backend
+        from fixtures import FixtureServer, paginated_routes
+        import naukri_scrapper
+
+        with FixtureServer(paginated_routes("{PATH}", 30)) as server:
+            naukri_scrapper.NAUKRI_BASE_URL = server.base_url
+            for name in ("simple", "async"):
+                assert len(list(get_backend(name)("Product Manager", "Mumbai", 30))) == 30
+        """
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=60)
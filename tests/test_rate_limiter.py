@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from rate_limiter import RateLimiter, RetryableError, check_status
+
+
+def failing(times, error):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= times:
+            raise error
+        return "ok"
+
+    return fn, calls
+
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    limiter = RateLimiter(rate=10, burst=2)
+
+    assert [limiter.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_retries_retryable_errors_then_succeeds():
+    limiter = RateLimiter(rate=0, max_retries=3, backoff_base=0.001)
+    fn, calls = failing(2, RetryableError("HTTP 503", status=503))
+
+    assert limiter.call(fn) == "ok"
+    assert len(calls) == 3
+    assert limiter.stats()["retries"] == 2
+
+
+def test_gives_up_after_max_retries_and_reraises():
+    limiter = RateLimiter(rate=0, max_retries=2, backoff_base=0.001)
+    fn, calls = failing(10, TimeoutError("slow"))
+
+    with pytest.raises(TimeoutError):
+        limiter.call(fn, retry_on=(TimeoutError,))
+    assert len(calls) == 3
+    assert limiter.stats()["give_ups"] == 1
+
+
+def test_other_errors_are_not_retried():
+    limiter = RateLimiter(rate=0, backoff_base=0.001)
+    fn, calls = failing(1, KeyError("bug"))
+
+    with pytest.raises(KeyError):
+        limiter.call(fn)
+    assert len(calls) == 1
+
+
+def test_retry_after_on_429_pauses_every_caller():
+    limiter = RateLimiter(rate=100, burst=10)
+
+    with pytest.raises(RetryableError) as raised:
+        check_status(429, "2")
+    limiter.record(False, retry_after=raised.value.retry_after, throttled=True)
+
+    assert limiter.reserve() == pytest.approx(2.0, abs=0.05)
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_error_rate_halves_the_rate_and_successes_restore_it():
+    limiter = RateLimiter(rate=8, min_samples=4, adjust_interval=0)
+
+    for _ in range(4):
+        limiter.record(False)
+    assert limiter.stats()["effective_rate"] == 4
+    for _ in range(4):
+        limiter.record(True)
+    assert limiter.stats()["effective_rate"] == 6
+
+
+def test_call_async_retries_like_call():
+    limiter = RateLimiter(rate=0, backoff_base=0.001)
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        if len(calls) < 2:
+            raise RetryableError("HTTP 502", status=502)
+        return "ok"
+
+    assert asyncio.run(limiter.call_async(fn)) == "ok"
+    assert len(calls) == 2
@@ -0,0 +1,69 @@
+import threading
+import time
+
+from result_cache import FRESH, MISS, STALE, ResultCache
+
+
+def test_entries_go_from_fresh_to_stale_to_expired():
+    cache = ResultCache(ttl=10, stale_ttl=20)
+    now = time.time()
+    cache.set("fresh", [1], stored_at=now - 5)
+    cache.set("stale", [2], stored_at=now - 15)
+    cache.set("expired", [3], stored_at=now - 40)
+
+    assert cache.get("fresh") == ([1], FRESH)
+    assert cache.get("stale") == ([2], STALE)
+    assert cache.get("expired") == (None, MISS)
+    assert cache.stats()["entries"] == 2
+
+
+def test_evicts_least_recently_used_over_the_byte_budget():
+    cache = ResultCache(max_bytes=25)
+    cache.set("a", "x" * 8)
+    cache.set("b", "y" * 8)
+    cache.get("a")
+    cache.set("c", "z" * 8)
+
+    assert cache.get("b") == (None, MISS)
+    assert cache.get("a")[1] == FRESH and cache.get("c")[1] == FRESH
+    assert cache.stats()["evictions"] == 1
+
+
+def test_stale_entry_is_served_and_refreshed_once_in_background():
+    cache = ResultCache(ttl=10, stale_ttl=60)
+    cache.set("q", ["old"], stored_at=time.time() - 30)
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return ["new"]
+
+    assert cache.get_or_load("q", loader) == (["old"], STALE)
+    assert cache.get_or_load("q", loader) == (["old"], STALE)
+    release.set()
+    deadline = time.time() + 5
+    while cache.stats()["refreshing"] and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert calls == [1]
+    assert cache.get("q") == (["new"], FRESH)
+
+
+def test_miss_loads_and_empty_results_are_not_stored():
+    cache = ResultCache()
+
+    assert cache.get_or_load("empty", lambda: []) == ([], MISS)
+    assert cache.get("empty") == (None, MISS)
+    assert cache.get_or_load("jobs", lambda: [1]) == ([1], MISS)
+    assert cache.get("jobs") == ([1], FRESH)
+
+
+def test_snapshot_is_reloaded(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ResultCache(path=path)
+    cache.set("q", [{"title": "PM"}])
+    cache.flush()
+
+    assert ResultCache(path=path).get("q") == ([{"title": "PM"}], FRESH)
@@ -0,0 +1,41 @@
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"queries": ["Product Manager"]},
+        {"queries": [{"keywords": "PM"}, None]},
+        {"queries": "Product Manager"},
+        {"queries": [{"keywords": ["PM"]}]},
+        {"queries": [{"keywords": "PM", "max_results": 0}]},
+        {"queries": [{"keywords": "PM", "max_results": "20"}]},
+        {"queries": [{"keywords": "PM", "max_results": True}]},
+        {"queries": [{"keywords": "PM"}], "max_results": -5},
+        {"queries": []},
+        ["Product Manager"],
+    ],
+)
+def test_malformed_batches_are_a_400(client, payload):
+    response = client.post("/scrape/batch", json=payload)
+
+    assert response.status_code == 400
+    assert response.json["success"] is False
+
+
+def test_queries_get_defaults_and_the_batch_max_results():
+    queries = app_module._batch_queries(
+        {"max_results": 40, "queries": [{"keywords": "QA"}, {"location": "Pune", "max_results": 5}]}
+    )
+
+    assert queries == [
+        {"keywords": "QA", "location": "Mumbai", "max_results": 40},
+        {"keywords": "Product Manager", "location": "Pune", "max_results": 5},
+    ]
@@ -0,0 +1,73 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from single_flight import SingleFlight, SingleFlightTimeout
+
+
+def test_concurrent_callers_share_one_run():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    runs = []
+
+    def work():
+        runs.append(1)
+        started.set()
+        release.wait(5)
+        return "jobs"
+
+    with ThreadPoolExecutor(4) as pool:
+        leader = pool.submit(flight.do, "q", work)
+        started.wait(5)
+        waiters = [pool.submit(flight.do, "q", work) for _ in range(3)]
+        while flight.stats()["deduplicated"] < 3:
+            pass
+        release.set()
+        results = [leader.result()] + [f.result() for f in waiters]
+
+    assert runs == [1]
+    assert results == [("jobs", False)] + [("jobs", True)] * 3
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_errors_reach_every_waiter_and_the_key_is_released():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("blocked")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "q", fail)
+        started.wait(5)
+        waiter = pool.submit(flight.do, "q", fail)
+        while not flight.stats()["deduplicated"]:
+            pass
+        release.set()
+        for future in (leader, waiter):
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert flight.do("q", lambda: 1) == (1, False)
+
+
+def test_waiter_times_out_without_stopping_the_leader():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def work():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    with ThreadPoolExecutor(1) as pool:
+        leader = pool.submit(flight.do, "q", work)
+        started.wait(5)
+        with pytest.raises(SingleFlightTimeout):
+            flight.do("q", work, timeout=0.05)
+        release.set()
+        assert leader.result() == ("done", False)
+    assert flight.stats()["timeouts"] == 1
@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+import naukri_scrapper
+from fixtures import results_page
+from naukri_scrapper import extract_jobs_from_html
+from strategy_cache import StrategyCache, StrategyTally
+
+
+def mixed_page(count):
+    """Tuples only the fallback lookups can read: no title attribute/class, no comp-name link."""
+    tuples = "".join(
+        f"""
+<article class="cust-job-tuple">
+  <div class="info">
+    <a href="https://www.naukri.com/view?id={i}">Analyst Role {i}</a>
+    <div class="companyInfo">Other Co {i}</div>
+  </div>
+  <span>2-6 Yrs</span><span>Pune</span>
+</article>"""
+        for i in range(count)
+    )
+    return f"<html><body><div class='list'>{tuples}</div></body></html>"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = StrategyCache(min_samples=1, explore_every=0)
+    monkeypatch.setattr(naukri_scrapper, "get_strategy_cache", lambda: cache)
+    return cache
+
+
+def test_mixed_layout_pages_never_change_standard_extraction(cache):
+    expected = extract_jobs_from_html(results_page(20), "Mumbai", 20)
+
+    for _ in range(10):
+        jobs = extract_jobs_from_html(mixed_page(20), "Pune", 20)
+        assert jobs[0]["company"] == "Other Co 0"
+    after_mixed = extract_jobs_from_html(results_page(20), "Mumbai", 20)
+
+    assert after_mixed == expected
+    assert all("\n" not in job["company"] for job in after_mixed)
+    preferred = cache.stats()["preferred"].values()
+    assert not set(preferred) & {"first_link", "comp_div", "text_line"}
+
+
+def test_workers_sharing_the_file_keep_each_others_slots(tmp_path):
+    path = str(tmp_path / "strategy_cache.json")
+    first, second = StrategyCache(path, min_samples=1), StrategyCache(path, min_samples=1)
+    for cache, slot in ((first, "company:a"), (second, "company:b")):
+        tally = StrategyTally()
+        tally.add(slot, "comp_span", True)
+        cache.record(tally)
+    first.flush()
+    second.flush()
+
+    assert StrategyCache(path).stats()["preferred"] == {
+        "company:a": "comp_span",
+        "company:b": "comp_span",
+    }
+
+    second.reset()
+    assert StrategyCache(path).stats()["slots"] == 0
+
+
+def record(cache, slot, outcomes):
+    tally = StrategyTally()
+    for name, success in outcomes:
+        tally.add(slot, name, success)
+    cache.record(tally, {slot: ["a", "b", "c"]})
+
+
+def test_learns_the_succeeding_strategy_and_relearns_when_it_fails():
+    cache = StrategyCache(min_samples=3, explore_every=0)
+    for _ in range(3):
+        record(cache, "company:x", [("a", False), ("b", True)])
+
+    assert cache.order("company:x", ["a", "b", "c"]) == ["b", "a", "c"]
+    for _ in range(3):
+        record(cache, "company:x", [("b", False), ("c", True)])
+    assert cache.preferred("company:x") == "c"
+    assert cache.stats()["relearns"] == 1
+
+
+def test_explores_the_default_order_periodically():
+    cache = StrategyCache(min_samples=1, explore_every=3)
+    record(cache, "title:x", [("a", False), ("b", True)])
+
+    orders = [cache.order("title:x", ["a", "b"])[0] for _ in range(6)]
+
+    assert orders.count("a") == 2
+
+
+def test_slots_expire_after_max_age(monkeypatch):
+    cache = StrategyCache(min_samples=1, max_age=60)
+    record(cache, "title:x", [("a", False), ("b", True)])
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+
+    assert cache.order("title:x", ["a", "b"]) == ["a", "b"]
+    assert cache.stats()["expired"] == 1
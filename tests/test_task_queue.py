@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+import app as app_module
+from task_queue import CANCELLED, FAILED, QUEUED, SUCCEEDED, QueueFull, TaskQueue
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while not predicate():
+        if time.time() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "tasks.db")
+
+
+def test_runs_highest_priority_then_oldest_first(path):
+    ran = []
+    queue = TaskQueue(path, workers=1, handlers={"scrape": lambda p: ran.append(p["n"]) or p["n"]})
+    ids = [queue.submit("scrape", {"n": n}, priority=p) for n, p in enumerate([0, 5, 1, 5])]
+
+    assert queue.get(ids[0])["position"] == 3
+    queue.start()
+    try:
+        wait_until(lambda: all(queue.get(i)["status"] == SUCCEEDED for i in ids))
+    finally:
+        queue.stop(5)
+
+    assert ran == [1, 3, 2, 0]
+    assert queue.get(ids[1])["result"] == 1
+
+
+def test_submit_rejects_unknown_kinds_and_a_full_queue(path):
+    queue = TaskQueue(path, max_queued=2, handlers={"scrape": lambda p: None})
+    queue.submit("scrape", {})
+    queue.submit("scrape", {})
+
+    with pytest.raises(QueueFull):
+        queue.submit("scrape", {})
+    with pytest.raises(ValueError):
+        queue.submit("email", {})
+
+
+def test_cancel_queued_task(path):
+    queue = TaskQueue(path, handlers={"scrape": lambda p: None})
+    task_id = queue.submit("scrape", {})
+
+    assert queue.cancel(task_id) == CANCELLED
+    assert queue.cancel("missing") is None
+
+
+def test_restart_requeues_only_repeatable_kinds(path):
+    handlers = {"scrape": lambda p: "scraped", "apply": lambda p: "applied"}
+    before = TaskQueue(path, handlers=handlers, requeue_kinds=("scrape",))
+    scrape_id = before.submit("scrape", {}, priority=1)
+    apply_id = before.submit("apply", {})
+    # Both were running when the process died
+    before._claim()
+    before._claim()
+
+    after = TaskQueue(path, handlers=handlers, requeue_kinds=("scrape",))
+    after.start()
+    try:
+        wait_until(lambda: after.get(scrape_id)["status"] == SUCCEEDED)
+    finally:
+        after.stop(5)
+
+    apply_task = after.get(apply_id)
+    assert apply_task["status"] == FAILED
+    assert "not retried" in apply_task["error"]
+
+
+@pytest.fixture
+def client(path, monkeypatch):
+    queue = TaskQueue(path, max_queued=1, handlers={"scrape": lambda p: None})
+    monkeypatch.setattr(app_module, "get_task_queue", lambda: queue)
+    return app_module.app.test_client(), queue
+
+
+def test_async_scrape_answers_202_then_429_when_full(client):
+    client, queue = client
+
+    accepted = client.post("/scrape", json={"async": True, "priority": "3"})
+    rejected = client.post("/scrape", json={"async": True})
+
+    assert accepted.status_code == 202
+    assert queue.get(accepted.json["task_id"])["priority"] == 3
+    assert queue.get(accepted.json["task_id"])["status"] == QUEUED
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "30"
+
+
+@pytest.mark.parametrize("priority", ["high", 1.5, True, None, [1]])
+def test_non_integer_priority_is_a_400(client, priority):
+    client, _ = client
+
+    response = client.post("/scrape", json={"async": True, "priority": priority})
+
+    assert response.status_code == 400